@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file benchmarks/batch.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Compare the time per lane of the batch solvers.
+
+Run it with::
+
+    python benchmarks/batch.py --problems 1000 100000 1000000
+
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import time
+import argparse
+
+import numpy as np
+
+from pyroots import BatchBisect, BatchBrentq, BatchBrenth, BatchChandrupatla
+
+
+SOLVERS = [BatchBisect, BatchBrentq, BatchBrenth, BatchChandrupatla]
+
+
+def f(x, a):
+    return x * np.exp(x) - a
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--problems", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--epsilon", type=float, default=1e-10)
+    options = parser.parse_args()
+
+    print("%10s %-18s %12s %12s %12s" % ("problems", "solver", "time (s)", "ns per lane", "func calls"))
+    for problems in options.problems:
+        a = np.linspace(0.1, 100.0, problems)
+        xa, xb = np.zeros(problems), np.full(problems, 5.0)
+        for solver in SOLVERS:
+            start = time.perf_counter()
+            result = solver(epsilon=options.epsilon)(f, xa, xb, a)
+            elapsed = time.perf_counter() - start
+            print("%10d %-18s %12.4f %12.1f %12.2f" % (problems, solver.__name__, elapsed, 1e9 * elapsed / problems, result.func_calls.mean()))
+
+
+if __name__ == "__main__":
+    main()
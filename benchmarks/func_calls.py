@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file benchmarks/func_calls.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Compare the number of function calls of the solvers on standard test problems.
+
+The problems are classic test functions of the root finding literature (see
+`problems.CLASSIC`); `suite.py` runs the larger test sets. Run it with::
+
+    python benchmarks/func_calls.py --epsilon 1e-6 1e-12
+
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import argparse
+from functools import partial
+
+from pyroots import Bisect, Ridder, Brentq, Brenth, Toms748, ITP, Chandrupatla, RegulaFalsi, Newton, Halley
+
+from problems import CLASSIC
+
+
+SOLVERS = [
+    ("Bisect", Bisect),
+    ("Ridder", Ridder),
+    ("Brentq", Brentq),
+    ("Brenth", Brenth),
+    ("Toms748", Toms748),
+    ("ITP", ITP),
+    ("Chandrupatla", Chandrupatla),
+    ("Illinois", partial(RegulaFalsi, method="illinois")),
+    ("Pegasus", partial(RegulaFalsi, method="pegasus")),
+    ("A-B", partial(RegulaFalsi, method="anderson-bjorck")),
+    ("Newton", Newton),
+    ("Halley", Halley),
+]
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--epsilon", type=float, nargs="+", default=[1e-6, 1e-12])
+    options = parser.parse_args()
+
+    names = [name for name, _ in SOLVERS]
+    width = max(len(name) for name in names) + 2
+    for epsilon in options.epsilon:
+        print("epsilon: %g" % epsilon)
+        print("%-42s" % "problem" + "".join(name.rjust(width) for name in names))
+        totals = [0] * len(SOLVERS)
+        for name, f, xa, xb in CLASSIC:
+            row = []
+            for i, (_, solver) in enumerate(SOLVERS):
+                result = solver(epsilon=epsilon, raise_on_fail=False)(f, xa, xb)
+                totals[i] += result.func_calls
+                row.append(("%d%s" % (result.func_calls, " " if result.converged else "*")).rjust(width))
+            print("%-42s" % name + "".join(row))
+        print("%-42s" % "total" + "".join(("%d " % total).rjust(width) for total in totals))
+        print()
+    print("* did not converge")
+
+
+if __name__ == "__main__":
+    main()
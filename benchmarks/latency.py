@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file benchmarks/latency.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Compare the latency of a single solve with the functions, the solver objects and scipy.
+
+Run it with::
+
+    python benchmarks/latency.py --number 20000
+
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import timeit
+import argparse
+
+try:
+    from scipy import optimize
+except ImportError:
+    optimize = None
+
+from pyroots import functional
+from pyroots import Bisect, Ridder, Brentq, Brenth
+
+
+def f(x):
+    return x ** 3 - x ** 2 - 3 * x + 2
+
+
+def g(x, c):
+    return x ** 3 - x ** 2 - 3 * x + c
+
+
+SOLVERS = [("bisect", Bisect), ("ridder", Ridder), ("brentq", Brentq), ("brenth", Brenth)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=20000)
+    options = parser.parse_args()
+
+    def latency(statement):
+        return min(timeit.repeat(statement, number=options.number, repeat=3)) / options.number * 1e6
+
+    print("%-8s %12s %12s %12s %12s" % ("method", "function", "args", "solver", "scipy"))
+    for name, Solver in SOLVERS:
+        function = getattr(functional, name)
+        solver = Solver(epsilon=1e-12, history=False)
+        row = [
+            latency(lambda: function(f, 0.5, 1.5)),
+            latency(lambda: function(g, 0.5, 1.5, args=(2,))),
+            latency(lambda: solver(f, 0.5, 1.5)),
+        ]
+        if optimize is not None:
+            row.append(latency(lambda: getattr(optimize, name)(f, 0.5, 1.5)))
+        print("%-8s" % name + "".join(" %10.2fus" % value for value in row))
+
+
+if __name__ == "__main__":
+    main()
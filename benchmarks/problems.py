@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file benchmarks/problems.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Test problems for the benchmarks.
+
+Each problem is a `(name, f, xa, xb)` tuple, where `f` changes sign in `[xa, xb]`. The
+functions are written with `pyroots.dmath`, so that `Newton` and `Halley` can compute their
+derivatives.
+
+-   `CLASSIC`: classic test functions of the root finding literature.
+-   `APS`: the test problems of G. E. Alefeld, F. A. Potra and Y. Shi, "Algorithm 748:
+    Enclosing zeros of continuous functions", ACM Transactions on Mathematical Software,
+    21(3), 327-344 (1995).
+-   `WORKLOADS`: problems like the ones of the applications of pyroots, i.e. equations of
+    engineering and finance whose parameters vary from solve to solve.
+
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from pyroots import dmath as math
+
+
+CLASSIC = [
+    ("sin(x) - x/2", lambda x: math.sin(x) - x / 2, math.pi / 2, math.pi),
+    ("x^3 - 2x - 5", lambda x: x ** 3 - 2 * x - 5, 2, 3),
+    ("exp(x) - 2", lambda x: math.exp(x) - 2, -4, 4 / 3),
+    ("x exp(x) - 1", lambda x: x * math.exp(x) - 1, -1, 4),
+    ("(x - 1)^3", lambda x: (x - 1) ** 3, 0, 3),
+    ("x^20 - 1", lambda x: x ** 20 - 1, 0, 5),
+    ("exp(-x^2)(x - 0.3) - 1e-4", lambda x: math.exp(-x * x) * (x - 0.3) - 1e-4, -1, 2),
+    ("1/x - sin(x) + 1", lambda x: 1 / x - math.sin(x) + 1, -1.3, -0.5),
+    ("x^2 (x^2/3 + sqrt(2) sin(x)) - sqrt(3)/18", lambda x: x ** 2 * (x ** 2 / 3 + math.sqrt(2) * math.sin(x)) - math.sqrt(3) / 18, 0.1, 1),
+]
+
+
+def _aps():
+    problems = [("aps01", lambda x: math.sin(x) - x / 2, math.pi / 2, math.pi)]
+    for n in range(1, 11):
+        f = lambda x: -2 * sum((2 * i - 5) ** 2 / (x - i * i) ** 3 for i in range(1, 21))
+        problems.append(("aps02 n=%d" % n, f, n * n + 1e-9, (n + 1) ** 2 - 1e-9))
+    for a, b in [(-40, -1), (-100, -2), (-200, -3)]:
+        problems.append(("aps03 a=%d b=%d" % (a, b), lambda x, a=a, b=b: a * x * math.exp(b * x), -9, 31))
+    for a, n in [(0.2, 4), (0.2, 6), (0.2, 8), (0.2, 10), (0.2, 12), (1, 4), (1, 6), (1, 8), (1, 10), (1, 12)]:
+        problems.append(("aps04 a=%g n=%d [0, 5]" % (a, n), lambda x, a=a, n=n: x ** n - a, 0, 5))
+    for n in range(8, 15, 2):
+        problems.append(("aps04 a=1 n=%d [-0.95, 4.05]" % n, lambda x, n=n: x ** n - 1, -0.95, 4.05))
+    problems.append(("aps05", lambda x: math.sin(x) - 0.5, 0, 1.5))
+    for n in list(range(1, 6)) + list(range(20, 101, 20)):
+        problems.append(("aps06 n=%d" % n, lambda x, n=n: 2 * x * math.exp(-n) - 2 * math.exp(-n * x) + 1, 0, 1))
+    for n in [5, 10, 20]:
+        problems.append(("aps07 n=%d" % n, lambda x, n=n: (1 + (1 - n) ** 2) * x - (1 - n * x) ** 2, 0, 1))
+    for n in [2, 5, 10, 15, 20]:
+        problems.append(("aps08 n=%d" % n, lambda x, n=n: x ** 2 - (1 - x) ** n, 0, 1))
+    for n in [1, 2, 4, 5, 8, 15, 20]:
+        problems.append(("aps09 n=%d" % n, lambda x, n=n: (1 + (1 - n) ** 4) * x - (1 - n * x) ** 4, 0, 1))
+    for n in [1, 5, 10, 15, 20]:
+        problems.append(("aps10 n=%d" % n, lambda x, n=n: math.exp(-n * x) * (x - 1) + x ** n, 0, 1))
+    for n in [2, 5, 15, 20]:
+        problems.append(("aps11 n=%d" % n, lambda x, n=n: (n * x - 1) / ((n - 1) * x), 0.01, 1))
+    for n in range(2, 34):
+        problems.append(("aps12 n=%d" % n, lambda x, n=n: x ** (1 / n) - n ** (1 / n), 1, 100))
+    problems.append(("aps13", lambda x: 0.0 if x == 0 else x * math.exp(-x ** -2), -1, 4))
+    for n in range(1, 41):
+        problems.append(("aps14 n=%d" % n, lambda x, n=n: n / 20 * (x / 1.5 + math.sin(x) - 1) if x >= 0 else -n / 20, -1e4, math.pi / 2))
+    for n in list(range(20, 41)) + list(range(100, 1001, 100)):
+        problems.append(("aps15 n=%d" % n, lambda x, n=n: _aps15(x, n), -1e4, 1e-4))
+    return problems
+
+
+def _aps15(x, n):
+    if x >= 2e-3 / (1 + n):
+        return math.e - 1.859
+    if x < 0:
+        return -0.859
+    return math.exp((n + 1) * x / 2 * 1000) - 1.859
+
+
+APS = _aps()
+
+
+def _kepler(x, mean_anomaly, eccentricity):
+    return x - eccentricity * math.sin(x) - mean_anomaly
+
+
+def _colebrook(x, reynolds, roughness):
+    # `x` is 1 / sqrt(friction factor).
+    return x + 2 * math.log10(roughness / 3.7 + 2.51 * x / reynolds)
+
+
+def _irr(x, cash_flows):
+    return sum(flow / (1 + x) ** t for t, flow in enumerate(cash_flows))
+
+
+def _workloads():
+    problems = []
+    for eccentricity in [0.1, 0.5, 0.9, 0.99]:
+        for mean_anomaly in [0.01, 1.0, 3.0]:
+            f = lambda x, m=mean_anomaly, e=eccentricity: _kepler(x, m, e)
+            problems.append(("kepler e=%g M=%g" % (eccentricity, mean_anomaly), f, 0, math.pi))
+    for reynolds in [4e3, 1e5, 1e7]:
+        for roughness in [0, 1e-4, 1e-2]:
+            f = lambda x, r=reynolds, k=roughness: _colebrook(x, r, k)
+            problems.append(("colebrook Re=%g e/D=%g" % (reynolds, roughness), f, 1, 20))
+    for flows in [(-100, 10, 10, 110), (-1000, 100, 200, 300, 400, 500), (-50, 3, 3, 3, 3, 3, 3, 3, 3, 3, 53)]:
+        problems.append(("irr %d flows" % len(flows), lambda x, flows=flows: _irr(x, flows), -0.5, 1))
+    return problems
+
+
+WORKLOADS = _workloads()
+
+SETS = {
+    "classic": CLASSIC,
+    "aps": APS,
+    "workloads": WORKLOADS,
+}
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file benchmarks/scaling.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Compare the scaling of `solve_many()` (processes) and `solve_many_threaded()` (threads).
+
+Two kinds of functions are used: a pure python one, which holds the GIL, and one that spends
+its time in NumPy, which releases the GIL. Run it with::
+
+    python benchmarks/scaling.py --problems 2000 --workers 1 2 4 8
+
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import sys
+import math
+import time
+import argparse
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyroots import Brentq, solve_many, solve_many_threaded
+
+
+def python_function(x, a):
+    total = 0.0
+    for i in range(1, 500):
+        total += math.tanh((x - a) * i / 100)
+    return total
+
+
+if np is not None:
+    _grid = np.linspace(0.0, 1.0, 20000)
+
+def numpy_function(x, a):
+    return float(np.sum(np.tanh(_grid * (x - a)))) + (x - a)
+
+
+def run(solve, f, problems, workers):
+    brackets = [(-10.0, 10.0)] * problems
+    args_list = [(i / problems,) for i in range(problems)]
+    start = time.perf_counter()
+    solve(Brentq(epsilon=1e-10), f, brackets, args_list, workers=workers)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--problems", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    options = parser.parse_args()
+
+    functions = [("python", python_function)]
+    if np is not None:
+        functions.append(("numpy", numpy_function))
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("GIL enabled: %s" % gil)
+    print("%-8s %-10s %8s %10s %10s" % ("function", "backend", "workers", "time (s)", "speedup"))
+    for name, f in functions:
+        for backend, solve in [("processes", solve_many), ("threads", solve_many_threaded)]:
+            baseline = None
+            for workers in options.workers:
+                elapsed = run(solve, f, options.problems, workers)
+                baseline = baseline or elapsed
+                print("%-8s %-10s %8d %10.3f %10.2f" % (name, backend, workers, elapsed, baseline / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file benchmarks/suite.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Run the benchmark suite of the solvers and compare it with a baseline.
+
+For each solver and tolerance, it reports the function calls, the iterations and the
+failures on the test sets of `problems.py`, the wall time of the solves and the overhead of
+the solver, i.e. the wall time minus the time spent in `f`. Run it with::
+
+    python benchmarks/suite.py --sets aps workloads --epsilon 1e-6 1e-12 --save baseline.json
+    python benchmarks/suite.py --sets aps workloads --epsilon 1e-6 1e-12 --compare baseline.json
+
+When comparing, an increase of the function calls, the iterations or the failures of a
+solver is a regression, and so is an increase of its time or overhead by more than
+`--tolerance` (100% by default); the exit status is 1 if there are regressions. The times
+are noisy, so they are only compared if both runs used at least `MIN_REPEAT` repeats, and
+they depend on the machine, so they should only be compared with baselines of the same
+machine.
+
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import sys
+import json
+import time
+import argparse
+import platform
+
+import pyroots
+
+from problems import SETS
+from func_calls import SOLVERS
+
+COUNTS = ("func_calls", "iterations", "failures")
+TIMES = ("time", "overhead")
+# The minimum `--repeat` of both runs for comparing their times; with fewer repeats, the
+# times of a run differ from the ones of another run of the same tree by more than 50%.
+MIN_REPEAT = 5
+
+
+def timed(f):
+    """ Return `f` wrapped so that the time spent in it is accumulated in `f.elapsed`. """
+    def wrapper(x, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return f(x, *args, **kwargs)
+        finally:
+            wrapper.elapsed += time.perf_counter() - start
+    wrapper.elapsed = 0.0
+    return wrapper
+
+
+def measure(solver, problems, repeat):
+    """ Return the totals of `solver` on `problems` and the function calls of each problem. """
+    totals = dict.fromkeys(COUNTS + TIMES, 0)
+    calls = {}
+    for name, f, xa, xb in problems:
+        # The best of `repeat` solves, to reduce the noise of the timings.
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = solver(f, xa, xb)
+            best = min(best, time.perf_counter() - start)
+        # The time in `f` is measured separately, so that the timer doesn't slow down the
+        # timed solves.
+        in_f = float("inf")
+        for _ in range(repeat):
+            g = timed(f)
+            solver(g, xa, xb)
+            in_f = min(in_f, g.elapsed)
+        totals["func_calls"] += result.func_calls
+        totals["iterations"] += result.iterations
+        totals["failures"] += not result.converged
+        totals["time"] += best
+        totals["overhead"] += max(best - in_f, 0.0)
+        calls[name] = result.func_calls
+    return totals, calls
+
+
+def run(sets, epsilons, repeat):
+    problems = [problem for name in sets for problem in SETS[name]]
+    report = {
+        "pyroots": pyroots.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "sets": sets,
+        "problems": len(problems),
+        "repeat": repeat,
+        "results": {},
+    }
+    for epsilon in epsilons:
+        results = report["results"]["%g" % epsilon] = {}
+        for name, factory in SOLVERS:
+            totals, calls = measure(factory(epsilon=epsilon, raise_on_fail=False), problems, repeat)
+            results[name] = dict(totals, calls=calls)
+    return report
+
+
+def show(report):
+    print("%d problems of the sets: %s" % (report["problems"], ", ".join(report["sets"])))
+    for epsilon, results in report["results"].items():
+        print()
+        print("epsilon: %s" % epsilon)
+        print("%-14s %10s %10s %8s %12s %12s %14s" % ("solver", "calls", "iters", "failed", "time (ms)", "overhead", "per call (us)"))
+        for name, totals in results.items():
+            print("%-14s %10d %10d %8d %12.2f %12.2f %14.2f" % (
+                name, totals["func_calls"], totals["iterations"], totals["failures"],
+                1e3 * totals["time"], 1e3 * totals["overhead"],
+                1e6 * totals["overhead"] / max(totals["func_calls"], 1),
+            ))
+
+
+def compare(report, baseline, tolerance):
+    """
+    Return the regressions of `report` with respect to `baseline`, as messages.
+
+    The times are only compared if `tolerance` is not None, and a time is never a regression
+    if the time of the baseline is 0.
+
+    """
+    regressions = []
+    if report["sets"] != baseline["sets"]:
+        regressions.append("The test sets differ from the ones of the baseline: %s" % ", ".join(baseline["sets"]))
+        return regressions
+    for epsilon, results in report["results"].items():
+        for name, totals in results.items():
+            try:
+                old = baseline["results"][epsilon][name]
+            except KeyError:
+                continue
+            for key in COUNTS:
+                if totals[key] > old[key]:
+                    regressions.append("%s (epsilon=%s): %s increased from %d to %d" % (name, epsilon, key, old[key], totals[key]))
+            for key in TIMES if tolerance is not None else ():
+                if old[key] and totals[key] > (1 + tolerance) * old[key]:
+                    regressions.append("%s (epsilon=%s): %s increased by %.0f%%" % (name, epsilon, key, 100 * (totals[key] / old[key] - 1)))
+            for problem, calls in sorted(totals["calls"].items()):
+                if calls > old["calls"].get(problem, calls):
+                    regressions.append("%s (epsilon=%s): %s needs %d function calls instead of %d" % (name, epsilon, problem, calls, old["calls"][problem]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sets", nargs="+", choices=sorted(SETS), default=sorted(SETS))
+    parser.add_argument("--epsilon", type=float, nargs="+", default=[1e-6, 1e-12])
+    parser.add_argument("--repeat", type=int, default=5, help="the number of timed runs of each solve")
+    parser.add_argument("--save", metavar="JSON", help="save the results as a baseline")
+    parser.add_argument("--compare", metavar="JSON", help="compare the results with a baseline")
+    parser.add_argument("--tolerance", type=float, default=1.0, help="the allowed relative increase of the times")
+    options = parser.parse_args()
+
+    report = run(options.sets, options.epsilon, options.repeat)
+    show(report)
+    if options.save:
+        with open(options.save, "w") as fd:
+            json.dump(report, fd, indent=1, sort_keys=True)
+    if options.compare:
+        with open(options.compare) as fd:
+            baseline = json.load(fd)
+        tolerance = options.tolerance
+        print()
+        if min(report["repeat"], baseline["repeat"]) < MIN_REPEAT:
+            tolerance = None
+            print("The times are not compared, since they need --repeat %d or more." % MIN_REPEAT)
+        regressions = compare(report, baseline, tolerance)
+        print("\n".join(regressions) if regressions else "No regressions.")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
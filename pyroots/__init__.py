@@ -56,8 +56,53 @@ logging.getLogger('pyroots').addHandler(logging.NullHandler())
 
 # Package imports
 from .utils import ConvergenceError
+from .hooks import Hook, LoggingHook
+from .metrics import MetricsHook
+from .export import TraceExporter
+from .cache import CachedFunction
+from .bracket import find_bracket
 from .bisect import Bisect
 from .ridder import Ridder
 from .brent import Brentq, Brenth
+from .toms748 import Toms748
+from .itp import ITP
+from .chandrupatla import Chandrupatla
+from .regula_falsi import RegulaFalsi
+from .dual import Dual, HyperDual
+from .newton import NewtonSafe, Newton, Halley
+from .secant import Secant
+from . import dmath
+from . import functional
 
-__all__ = ["Bisect", "Ridder", "Brenth", "Brentq", "ConvergenceError"]
+# These are imported on first use, so that importing pyroots doesn't import numpy, numba or
+# asyncio for the users of the scalar solvers.
+_LAZY = {
+    "kernels": None,
+    "BatchBisect": "batch",
+    "BatchBrentq": "batch",
+    "BatchBrenth": "batch",
+    "BatchChandrupatla": "batch",
+    "solve_many": "parallel",
+    "solve_many_async": "parallel",
+    "solve_many_threaded": "parallel",
+    "find_all_roots": "scan",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    import importlib
+    module = _LAZY[name]
+    if module is None:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        value = getattr(importlib.import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+__all__ = ["Bisect", "Ridder", "Brenth", "Brentq", "Toms748", "ITP", "Chandrupatla", "RegulaFalsi", "NewtonSafe", "Newton", "Halley", "Secant", "BatchBisect", "BatchBrentq", "BatchBrenth", "BatchChandrupatla", "ConvergenceError", "CachedFunction", "Dual", "HyperDual", "find_bracket", "find_all_roots", "Hook", "LoggingHook", "MetricsHook", "TraceExporter", "solve_many", "solve_many_async", "solve_many_threaded"]
@@ -45,8 +45,14 @@ from __future__ import absolute_import
 
 import abc
 import logging
+from random import random
+from time import perf_counter_ns
 
-from .utils import Result, ConvergenceError, LOG_MSG, EPS, nearly_equal
+from .utils import Result, LeanResult, ConvergenceError, LOG_MSG, EPS, STATUS, nearly_equal
+from .trace import ListTrace
+from .profile import Profile, TimedFunction, TimedCoroutineFunction
+from .bracket import find_bracket
+from .hooks import EVENTS, dispatcher
 
 
 class BaseSolver(object):
@@ -59,9 +65,10 @@ class BaseSolver(object):
         "no bracket": "Root is not bracketed.",
         "convergence": "Solution converged.",
         "iterations": "Exceeded max iterations.",
+        "stagnant": "Precision not achieved. Iteration stagnant.",
     }
 
-    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, solver_name="BaseSolver", debug_precision=10):
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, solver_name="BaseSolver", debug_precision=10, history=True, hooks=(), profile=0.0):
         """
         Parameters
         ----------
@@ -71,6 +78,17 @@ class BaseSolver(object):
             Equals machine accuracy.
         :param int max_inter:
             The maximum allowed number of iterations.
+        :param history:
+            If `True`, the steps are recorded in lists. If `False`, the steps are not recorded
+            and the solver returns a `LeanResult`. It can also be a callable that returns a new
+            recorder for each solve, e.g. `pyroots.trace.ArrayTrace`.
+        :param list hooks:
+            Objects that are notified of the events of each solve, e.g.
+            `pyroots.hooks.LoggingHook()`.
+        :param float profile:
+            The fraction of the solves that are profiled, from 0 (none) to 1 (all). The
+            `Result` of a profiled solve has a `pyroots.profile.Profile` as its `profile`, with
+            the time spent in `f` and in the solver; it is `None` for the rest.
 
         """
         # sanity check
@@ -80,14 +98,50 @@ class BaseSolver(object):
             raise ArithmeticError("'epsilon' can't be smaller than EPS (epsilon=%.15f, EPS=%.15f)" % (xtol, EPS))
         if (not isinstance(max_iter, int)) or max_iter < 0:
             raise ArithmeticError("max_iter must be a positive integer, not: %r <%r>" % (max_iter, type(max_iter)))
+        if not 0 <= profile <= 1:
+            raise ArithmeticError("profile must be between 0 and 1, not: %r" % (profile,))
 
-        self.log_msg = LOG_MSG.format(precision=debug_precision)
         self.xtol = xtol
         self.epsilon = epsilon
         self.max_iter = max_iter
         self.raise_on_fail = raise_on_fail
         self.solver_name = solver_name
-        self.logger = logging.getLogger("pyroots.{solver_name}".format(solver_name=solver_name))
+        self.debug_precision = debug_precision
+        self.history = history
+        self.hooks = tuple(hooks)
+        self.profile = profile
+        self._setup_logging()
+        self._setup_hooks()
+
+    def _setup_logging(self):
+        self.log_msg = LOG_MSG.format(precision=self.debug_precision)
+        self.logger = logging.getLogger("pyroots.{solver_name}".format(solver_name=self.solver_name))
+
+    def _setup_hooks(self):
+        # `_on_<event>` is `None` if no hook handles the event, so that the solvers can skip it.
+        for event in EVENTS:
+            setattr(self, "_" + event, dispatcher(self.hooks, event))
+
+    def add_hook(self, hook):
+        """ Add `hook` to the hooks of the solver. """
+        self.hooks += (hook,)
+        self._setup_hooks()
+
+    def __getstate__(self):
+        # The logger, the log message and the event dispatchers are derived from the other
+        # attributes, so there is no need to pickle them. This keeps the solvers cheap to send
+        # to other processes.
+        state = self.__dict__.copy()
+        del state["logger"]
+        del state["log_msg"]
+        for event in EVENTS:
+            del state["_" + event]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._setup_logging()
+        self._setup_hooks()
 
     def __repr__(self):
         return """ `Pyroots.{solver_name}`:\n
@@ -97,18 +151,29 @@ class BaseSolver(object):
              raise : {raise_on_fail}
         """.format(**self.__dict__)
 
-    def _return_result(self, x0, fx0, iterations, x_steps, fx_steps, converged, condition):
+    def _new_trace(self):
+        """ Return the recorder of the steps of a new solve, or `None` if they are not recorded. """
+        if self.history is True:
+            return ListTrace()
+        if not self.history:
+            return None
+        return self.history()
+
+    def _return_result(self, x0, fx0, iterations, func_calls, converged, condition, trace=None, profile=None):
         msg = self.messages[condition]
-        result = Result(x0, fx0, iterations, converged, self.xtol, self.epsilon, x_steps, fx_steps, msg)
-        if not result.converged and self.raise_on_fail:
-            self.logger.info("Solution did not converge: %r", result)
-            raise ConvergenceError(msg)
+        if trace is None:
+            result = LeanResult(x0, fx0, iterations, func_calls, converged, STATUS[condition], profile)
         else:
-            self.logger.info("Solution converged: %r", result)
-            return result
-
-    def _debug(self, i, fcalls, xa, xb, fa, fb):
-        self.logger.debug(self.log_msg, i, fcalls, xa, xb, xb - xa, fa, fb)
+            trace.close()
+            result = Result(x0, fx0, iterations, converged, self.xtol, self.epsilon, trace.x_steps, trace.fx_steps, msg, STATUS[condition], func_calls, profile)
+        if not result.converged:
+            if self._on_fail is not None:
+                self._on_fail(self, result)
+            if self.raise_on_fail:
+                raise ConvergenceError(msg)
+        elif self._on_finish is not None:
+            self._on_finish(self, result)
+        return result
 
     def __call__(self, f, xa, xb, *args, **kwargs):
         """
@@ -136,7 +201,141 @@ class BaseSolver(object):
             converge. If `raise_on_fail` is `False` then it returns a `Result` instance.
 
         """
-        return self._solve(f, xa, xb, *args, **kwargs)
+        return self._solve(f, xa, xb, None, None, args, kwargs)
+
+    def solve(self, f, xa, xb, fa=None, fb=None, args=(), kwargs=None):
+        """
+        Same as calling the solver, but the values of `f` on the bounds of the interval may be
+        passed if they are already known, e.g. from a bracket search. The bounds whose value is
+        passed are not evaluated again and they are not included in the `Result`'s steps.
+
+        Parameters
+        ----------
+        :param function f:
+            The function whose root we are searching.
+        :param float xa:
+            The lower bound of the interval.
+        :param float xb:
+            The upper bound of the interval.
+        :param float fa:
+            The value of `f(xa)` or `None`.
+        :param float fb:
+            The value of `f(xb)` or `None`.
+        :param tuple args:
+            Function's `f` positional arguments.
+        :param dict kwargs:
+            Function's `f` keyword arguments.
+
+        """
+        return self._solve(f, xa, xb, fa, fb, args, kwargs or {})
+
+    def solve_from_guess(self, f, x0, step=None, factor=2.0, lower=None, upper=None, args=(), kwargs=None):
+        """
+        Solve `f` starting from the guess `x0` instead of a bracket.
+
+        The bracket is found by `pyroots.bracket.find_bracket()`, i.e. by expanding an interval
+        of width `step` geometrically until `f` changes sign, without leaving `[lower, upper]`.
+        Its bounds are not evaluated again. The function evaluations spent on the bracket are
+        included in the `Result`'s steps and in its `func_calls`. If no bracket is found, the
+        result's condition is "no bracket".
+
+        """
+        kwargs = kwargs or {}
+        trace = self._new_trace()
+        probe = lambda x, *args, **kwargs: self._probe(f, x, args, kwargs, trace)
+        bracket = find_bracket(probe, x0, step, factor, lower, upper, args=args, kwargs=kwargs)
+        if self._on_start is not None:
+            self._on_start(self, bracket.xa, bracket.xb)
+        result = self._run(f, bracket.xa, bracket.xb, bracket.fa, bracket.fb, args, kwargs, trace)
+        result.func_calls += bracket.func_calls
+        return result
+
+    def sweep(self, f, ps, xa, xb, args=(), kwargs=None):
+        """
+        Solve `f(x, p, *args, **kwargs) = 0` for every parameter `p` in `ps`.
+
+        The first problem is solved in `[xa, xb]`. For the next ones, the root is predicted by
+        linear extrapolation of the last two roots and the prediction is checked with one or two
+        function evaluations. If they don't bracket the root, the bracket is widened
+        geometrically towards the side where the root must lie.  If this fails too (i.e. the
+        widened bracket reached `[xa, xb]`), the problem is solved in `[xa, xb]`.
+
+        This works best when `p` varies slowly, e.g. when tracing a curve or a time series, and
+        the roots are all within `[xa, xb]`. The function evaluations spent on the bracket are
+        included in the `Result`'s steps.
+
+        :returns: A list with a `Result` instance for each `p`.
+
+        """
+        kwargs = kwargs or {}
+        lower, upper = min(xa, xb), max(xa, xb)
+        results = []
+        roots = []
+        rising = None
+        for p in ps:
+            p_args = (p,) + tuple(args)
+            trace = self._new_trace()
+            if self._on_start is not None:
+                self._on_start(self, lower, upper)
+            if roots:
+                if len(roots) == 1:
+                    guess, step = roots[-1], (upper - lower) * 1e-3
+                else:
+                    guess, step = 2 * roots[-1] - roots[-2], abs(roots[-1] - roots[-2])
+                step = max(step, 4 * self.xtol * max(1, abs(guess)))
+                result = self._warm_solve(f, lower, upper, guess, step, rising, p_args, kwargs, trace)
+            else:
+                flower = self._probe(f, lower, p_args, kwargs, trace)
+                fupper = self._probe(f, upper, p_args, kwargs, trace)
+                rising = flower < fupper
+                result = self._run(f, lower, upper, flower, fupper, p_args, kwargs, trace)
+                result.func_calls += 2
+            results.append(result)
+            # restart the predictions if something went wrong.
+            if result.converged:
+                roots = roots[-1:] + [result.x0]
+            else:
+                roots = []
+        return results
+
+    def _probe(self, f, x, args, kwargs, trace):
+        """ Evaluate `f(x)` outside of `_iterate()`, e.g. while searching for a bracket. """
+        fx = f(x, *args, **kwargs)
+        if trace is not None:
+            trace.append(x, fx)
+        return fx
+
+    def _warm_solve(self, f, lower, upper, guess, step, rising, args, kwargs, trace):
+        """ Solve a problem of a `sweep()` starting from the predicted root `guess`.  """
+        # check the predicted root
+        x1 = min(max(guess, lower), upper)
+        f1 = self._probe(f, x1, args, kwargs, trace)
+        probes = 1
+        if self.is_root(f1):
+            result = self._return_result(x1, f1, 0, 0, True, "convergence", trace)
+            result.func_calls += probes
+            return result
+
+        # Look for a sign change on the side of the guess where the root must be.
+        direction = 1 if (f1 < 0) == rising else -1
+        while True:
+            x2 = min(max(x1 + direction * step, lower), upper)
+            if x2 == x1:
+                # We reached the bounds of the sweep without a sign change.
+                result = self._run(f, lower, upper, None, None, args, kwargs, trace)
+                break
+            f2 = self._probe(f, x2, args, kwargs, trace)
+            probes += 1
+            if f1 * f2 <= 0.0:
+                if x1 > x2:
+                    x1, x2, f1, f2 = x2, x1, f2, f1
+                result = self._run(f, x1, x2, f1, f2, args, kwargs, trace)
+                break
+            x1, f1 = x2, f2
+            step *= 2
+
+        result.func_calls += probes
+        return result
 
     def is_root(self, root):
         """
@@ -146,7 +345,142 @@ class BaseSolver(object):
         """
         return nearly_equal(0, root, self.epsilon)
 
-    @abc.abstractmethod
-    def _solve(self, f, xa, xb, *args, **kwargs):
+    def _solve(self, f, xa, xb, fa, fb, args, kwargs):
         """ Return a result object or raise a ConvergenceError. """
+        if self._on_start is not None:
+            self._on_start(self, xa, xb)
+        return self._run(f, xa, xb, fa, fb, args, kwargs, self._new_trace())
+
+    def _run(self, f, xa, xb, fa, fb, args, kwargs, trace):
+        """ Drive `_iterate()`, recording the steps in `trace` unless it is `None`. """
+        return self._drive(self._iterate(xa, xb, fa, fb), f, args, kwargs, trace)
+
+    def _drive(self, steps, f, args, kwargs, trace):
+        """ Evaluate `f` on the values yielded by the generator `steps` and return the result. """
+        f = self._evaluator(f)
+        sampled = self._sampled()
+        try:
+            if not sampled:
+                outcome = self._loop(steps, f, args, kwargs, trace)
+            else:
+                timed = TimedFunction(f)
+                start = perf_counter_ns()
+                outcome = self._loop(steps, timed, args, kwargs, trace)
+                elapsed = perf_counter_ns() - start
+        except BaseException:
+            # e.g. `f` raised; close the trace anyway, so that a `FileTrace` keeps the steps.
+            self._abort(trace)
+            raise
+        if not sampled:
+            return self._finish(outcome, trace)
+        iterations = outcome[2] if outcome is not None else 0
+        return self._finish(outcome, trace, Profile(elapsed, timed.elapsed, timed.calls, iterations))
+
+    def _evaluator(self, f):
+        """
+        Return the function that `_loop()` evaluates on the yielded values; it is `f` itself,
+        unless the solver needs more than `f(x)`, e.g. its derivatives. A profiled solve counts
+        all the time spent in it as time spent in `f`.
+
+        """
+        return f
+
+    def _evaluator_async(self, f):
+        """ Same as `_evaluator()`, for a coroutine function `f`.  """
+        return f
+
+    def _sampled(self):
+        """ Return `True` if the next solve must be profiled.  """
+        profile = self.profile
+        return bool(profile) and (profile >= 1 or random() < profile)
+
+    def _loop(self, steps, f, args, kwargs, trace):
+        """ Evaluate `f` on the values yielded by the generator `steps` and return its outcome. """
+        try:
+            x = next(steps)
+            if trace is None:
+                while True:
+                    x = steps.send(f(x, *args, **kwargs))
+            record = trace.append
+            while True:
+                fx = f(x, *args, **kwargs)
+                record(x, fx)
+                x = steps.send(fx)
+        except StopIteration as stop:
+            return stop.value
+
+    async def solve_async(self, f, xa, xb, *args, fa=None, fb=None, **kwargs):
+        """
+        Same as calling the solver, but `f` is a coroutine function, which is awaited on each
+        evaluation. The event loop is free to run other tasks (e.g. other solves) while `f` is
+        being evaluated.
+
+        The values of `f` on the bounds may be passed as `fa` and `fb` if they are already
+        known, as in `solve()`; so `f` can't have keyword arguments with these names.
+
+        :returns: `Result`'s instance.
+
+        :raises: `ConvergenceError` if `raise_on_fail` is True and the function fails to
+            converge.
+
+        """
+        if self._on_start is not None:
+            self._on_start(self, xa, xb)
+        return await self._drive_async(self._iterate(xa, xb, fa, fb), f, args, kwargs, self._new_trace())
+
+    async def _drive_async(self, steps, f, args, kwargs, trace):
+        """ Same as `_drive()`, for a coroutine function `f`.  """
+        f = self._evaluator_async(f)
+        sampled = self._sampled()
+        try:
+            if not sampled:
+                outcome = await self._loop_async(steps, f, args, kwargs, trace)
+            else:
+                timed = TimedCoroutineFunction(f)
+                start = perf_counter_ns()
+                outcome = await self._loop_async(steps, timed, args, kwargs, trace)
+                elapsed = perf_counter_ns() - start
+        except BaseException:
+            self._abort(trace)
+            raise
+        if not sampled:
+            return self._finish(outcome, trace)
+        iterations = outcome[2] if outcome is not None else 0
+        return self._finish(outcome, trace, Profile(elapsed, timed.elapsed, timed.calls, iterations))
+
+    async def _loop_async(self, steps, f, args, kwargs, trace):
+        """ Same as `_loop()`, but `f` is awaited.  """
+        try:
+            x = next(steps)
+            while True:
+                fx = await f(x, *args, **kwargs)
+                if trace is not None:
+                    trace.append(x, fx)
+                x = steps.send(fx)
+        except StopIteration as stop:
+            return stop.value
+
+    def _abort(self, trace):
+        """ Close `trace` after a solve that raised. """
+        if trace is not None:
+            trace.close()
+
+    def _finish(self, outcome, trace, profile=None):
+        # `outcome` is what `_iterate()` returned; it is `None` only for the abstract solver.
+        if outcome is None:
+            return None
+        return self._return_result(*outcome, trace=trace, profile=profile)
+
+    @abc.abstractmethod
+    def _iterate(self, xa, xb, fa, fb):
+        """
+        The implementation of the method, as a generator.
+
+        It yields the `x` values that must be evaluated and it receives `f(x)` back. It returns
+        a `(x0, fx0, iterations, func_calls, converged, condition)` tuple, where `condition` is
+        a key of `messages`. `fa` and `fb` are the values of `f` on the bounds, or `None` if
+        they must be evaluated.
+
+        """
+        return iter(())
 
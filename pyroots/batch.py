@@ -0,0 +1,673 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/batch.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Vectorized solvers that solve many independent brackets over NumPy arrays.
+
+The batch solvers take arrays `xa` and `xb` (one entry per problem) and a
+function `f` that accepts an array of `x` values.  They take exactly the same
+decisions as their scalar counterparts, but every step is applied to all the
+problems that are still being solved (the "lanes").  A lane is retired as soon
+as it converges (or fails) and it is no longer passed to `f`.
+
+NumPy is an optional dependency of pyroots.  It is only needed for the solvers
+defined in this module.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+try:
+    import numpy as np
+except ImportError:         # pragma: no cover
+    np = None
+
+from math import ceil, log
+
+from .utils import EPS, ConvergenceError, CONDITIONS
+from .utils import CONVERGENCE, LOWER_BRACKET, UPPER_BRACKET, SMALL_BRACKET, NO_BRACKET, ITERATIONS
+from .base import BaseSolver
+from .bracket import Bracket, _check_search
+from .brent import _inverse_quadratic, _hyperbolic
+
+
+def nearly_equal(a, b, epsilon):
+    """ Vectorized version of `pyroots.utils.nearly_equal()`. """
+    diff = np.abs(a - b)
+    max_ab = np.maximum(np.maximum(np.abs(a), np.abs(b)), 1)
+    absolute = (max_ab >= diff) | (max_ab > 1)
+    return (a == b) | np.where(absolute, diff <= epsilon, diff < epsilon * max_ab)
+
+
+def _is_lane_array(value, size):
+    return isinstance(value, np.ndarray) and value.ndim == 1 and value.shape[0] == size
+
+
+def _select_lanes(args, kwargs, size, index):
+    """
+    Return the positional and keyword arguments of `f` for the lanes in `index`.
+
+    Arguments that are 1-D arrays with one entry per problem are sliced; any other
+    argument is shared by all the lanes and is passed unchanged.
+
+    """
+    args = tuple(arg[index] if _is_lane_array(arg, size) else arg for arg in args)
+    kwargs = dict((key, value[index] if _is_lane_array(value, size) else value) for key, value in kwargs.items())
+    return args, kwargs
+
+
+def find_brackets(f, x0, step=None, factor=2.0, lower=None, upper=None, max_iter=50, args=(), kwargs=None):
+    """
+    Vectorized version of `pyroots.bracket.find_bracket()`.
+
+    `x0`, `step`, `lower` and `upper` may be arrays; they are broadcast against each other
+    and the problems are searched simultaneously. `f` must accept arrays; on each
+    expansion it is only passed the lanes that haven't found a bracket yet. `args` and
+    `kwargs` are handled like in the batch solvers.
+
+    :returns: A `Bracket` instance whose attributes are arrays with one entry per problem.
+
+    """
+    kwargs = kwargs or {}
+    lower = -np.inf if lower is None else lower
+    upper = np.inf if upper is None else upper
+    _check_search(factor, max_iter)
+    x0, lower, upper = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (x0, lower, upper)])
+    if step is None:
+        step = 1e-2 * np.maximum(1.0, np.abs(x0))
+    x0, step, lower, upper = (np.array(x, dtype=float).ravel() for x in np.broadcast_arrays(x0, np.abs(step), lower, upper))
+    if not ((lower <= x0) & (x0 <= upper) & (lower < upper)).all():
+        raise ValueError("Some of the initial guesses are outside of the domain.")
+    size = len(x0)
+
+    xa, fa = x0, np.asarray(f(x0, *args, **kwargs), dtype=float)
+    xb = np.minimum(x0 + step, upper)
+    xb = np.where(xb == xa, np.maximum(x0 - step, lower), xb)
+    fb = np.asarray(f(xb, *args, **kwargs), dtype=float)
+    func_calls = np.full(size, 2, dtype=int)
+    swap = xb < xa
+    xa, xb = np.where(swap, xb, xa), np.where(swap, xa, xb)
+    fa, fb = np.where(swap, fb, fa), np.where(swap, fa, fb)
+
+    # The previous ends of the intervals, for the secant steps.
+    xl, fl, xr, fr = xb.copy(), fb.copy(), xa.copy(), fa.copy()
+    for _ in range(max_iter):
+        lanes = np.flatnonzero(~(fa * fb <= 0.0))
+        if not len(lanes):
+            break
+        a, b, fla, flb = xa[lanes], xb[lanes], fa[lanes], fb[lanes]
+        left = np.abs(fla) < np.abs(flb)
+        left ^= (left & (a == lower[lanes])) | (~left & (b == upper[lanes]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distance = np.where(
+                left,
+                fla * (a - xl[lanes]) / (fla - fl[lanes]),
+                flb * (xr[lanes] - b) / (flb - fr[lanes]),
+            )
+        width = factor * (b - a)
+        width = np.where((0.0 < 2 * distance) & (2 * distance < width), 2 * distance, width)
+        x = np.where(left, np.maximum(a - width, lower[lanes]), np.minimum(b + width, upper[lanes]))
+        moved = x != np.where(left, a, b)
+        if not moved.any():
+            break
+        lanes, a, b, fla, flb, left, x = (v[moved] for v in (lanes, a, b, fla, flb, left, x))
+        lane_args, lane_kwargs = _select_lanes(args, kwargs, size, lanes)
+        fx = np.asarray(f(x, *lane_args, **lane_kwargs), dtype=float)
+        func_calls[lanes] += 1
+        # On a sign change the bracket shrinks to the last expansion.
+        xl[lanes] = np.where(left, a, xl[lanes])
+        fl[lanes] = np.where(left, fla, fl[lanes])
+        xr[lanes] = np.where(left, xr[lanes], b)
+        fr[lanes] = np.where(left, fr[lanes], flb)
+        xa[lanes] = np.where(left, x, np.where(fx * flb <= 0.0, b, a))
+        fa[lanes] = np.where(left, fx, np.where(fx * flb <= 0.0, flb, fla))
+        xb[lanes] = np.where(left, np.where(fx * fla <= 0.0, a, b), x)
+        fb[lanes] = np.where(left, np.where(fx * fla <= 0.0, fla, flb), fx)
+
+    return Bracket(xa, xb, fa, fb, func_calls, fa * fb <= 0.0)
+
+
+class BatchResult(object):
+    """ Result of a batch solve.  Every attribute is an array with one entry per problem. """
+
+    _result_representation = """
+  problems : {problems}
+ converged : {converged}
+    failed : {failed}
+iterations : {iterations}
+func calls : {func_calls}
+      xtol : {xtol: 22.16f}
+   epsilon : {epsilon: 22.16f}
+""".rstrip()
+
+    def __init__(self, x0, fx0, iterations, func_calls, status, xtol, epsilon):
+        self.x0 = x0
+        self.fx0 = fx0
+        self.iterations = iterations
+        self.func_calls = func_calls
+        self.status = status
+        self.converged = status <= UPPER_BRACKET
+        self.xtol = xtol
+        self.epsilon = epsilon
+
+    def __len__(self):
+        return len(self.x0)
+
+    @property
+    def conditions(self):
+        """ A list with the condition (i.e. a key of `BaseSolver.messages`) of each lane. """
+        return [CONDITIONS[code] for code in self.status]
+
+    def __repr__(self):
+        converged = int(self.converged.sum())
+        return self._result_representation.format(
+            problems=len(self),
+            converged=converged,
+            failed=len(self) - converged,
+            iterations=int(self.iterations.sum()),
+            func_calls=int(self.func_calls.sum()),
+            xtol=self.xtol,
+            epsilon=self.epsilon,
+        )
+
+
+class _BatchSolver(BaseSolver):
+    """
+    Base class of the batch solvers.
+
+    Contrary to the scalar solvers, `raise_on_fail` defaults to `False`; when it is
+    `True` a `ConvergenceError` is raised if any of the lanes fails to converge.
+
+    The hooks receive the arrays of the brackets and the `BatchResult`; the `on_iteration`
+    event is not dispatched.
+
+    """
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=False, solver_name="BatchSolver", debug_precision=10, hooks=()):
+        if np is None:
+            raise ImportError("The batch solvers require numpy.")
+        super(_BatchSolver, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            hooks=hooks,
+            solver_name=solver_name
+        )
+
+    def __call__(self, f, xa, xb, *args, **kwargs):
+        """
+        Parameters
+        ----------
+        :param function f:
+            A vectorized function; it is called with an array of `x` values and it
+            must return an array of the same shape.
+        :param array xa:
+            The lower bounds of the intervals.
+        :param array xb:
+            The upper bounds of the intervals.
+        :param tuple *args:
+            Function's `f` positional arguments. 1-D arrays with one entry per
+            problem are passed lane by lane; everything else is passed unchanged.
+        :param dict kwargs:
+            Function's `f` keyword arguments. Handled like `args`.
+
+        Returns
+        -------
+
+        :returns: `BatchResult`'s instance.
+
+        """
+        return self.solve(f, xa, xb, args=args, kwargs=kwargs)
+
+    def solve(self, f, xa, xb, fa=None, fb=None, args=(), kwargs=None):
+        """
+        Same as calling the solver, but the arrays of the values of `f` on the bounds of the
+        intervals may be passed if they are already known.
+
+        """
+        shape = np.broadcast(*[np.asarray(x) for x in (xa, xb, fa, fb) if x is not None]).shape
+        xa, xb, fa, fb = (None if x is None else np.broadcast_to(np.asarray(x, dtype=float), shape).ravel() for x in (xa, xb, fa, fb))
+        if self._on_start is not None:
+            self._on_start(self, xa, xb)
+        return self._solve(f, xa, xb, fa, fb, args, kwargs or {})
+
+    def solve_from_guess(self, f, x0, step=None, factor=2.0, lower=None, upper=None, args=(), kwargs=None):
+        """
+        Solve the problems starting from the guesses `x0` instead of brackets.
+
+        The brackets are found by `find_brackets()` and their bounds are not evaluated again.
+        The evaluations spent on the brackets are included in the result's `func_calls`. The
+        status of the problems without a bracket is `NO_BRACKET`.
+
+        """
+        kwargs = kwargs or {}
+        bracket = find_brackets(f, x0, step, factor, lower, upper, args=args, kwargs=kwargs)
+        result = self.solve(f, bracket.xa, bracket.xb, bracket.fa, bracket.fb, args, kwargs)
+        result.func_calls += bracket.func_calls
+        return result
+
+    def sweep(self, f, ps, xa, xb, args=(), kwargs=None):
+        """ Not supported; pass the parameters as an array with one entry per lane instead. """
+        raise NotImplementedError("The batch solvers solve all the parameters at once.")
+
+    async def solve_async(self, f, xa, xb, *args, fa=None, fb=None, **kwargs):
+        """ Not supported. """
+        raise NotImplementedError("The batch solvers don't support coroutine functions.")
+
+    def is_root(self, root):
+        return nearly_equal(0.0, root, self.epsilon)
+
+    def _check_brackets(self, f, xa, xb, fa, fb, args, kwargs):
+        """
+        Apply the checks that the scalar solvers apply before their iterations.
+
+        :returns: The per problem output arrays `x0, fx0, iterations, func_calls, status`,
+            followed by the `lanes` that must be iterated and their `xa, xb, fa, fb`.
+
+        """
+        size = xa.size
+        is_root = self.is_root
+
+        # per problem output
+        x0 = np.full(size, np.nan)
+        fx0 = np.full(size, np.nan)
+        iterations = np.zeros(size, dtype=int)
+        func_calls = np.zeros(size, dtype=int)
+        status = np.full(size, ITERATIONS, dtype=np.int8)
+
+        with np.errstate(invalid="ignore", over="ignore"):
+            # check that the brackets' intervals are sufficiently big.
+            small = nearly_equal(xa, xb, self.xtol)
+            status[small] = SMALL_BRACKET
+            lanes = np.flatnonzero(~small)
+            lane_args, lane_kwargs = _select_lanes(args, kwargs, size, lanes)
+
+            # check lower bounds
+            xa, xb = xa[lanes], xb[lanes]
+            if fa is None:
+                fa = np.asarray(f(xa, *lane_args, **lane_kwargs), dtype=float)     # First function call
+                func_calls[lanes] += 1
+            else:
+                fa = fa[lanes]
+            done = is_root(fa)
+            x0[lanes[done]], fx0[lanes[done]], status[lanes[done]] = xa[done], fa[done], LOWER_BRACKET
+            if done.any():
+                keep = ~done
+                lanes, xa, xb, fa = lanes[keep], xa[keep], xb[keep], fa[keep]
+                lane_args, lane_kwargs = _select_lanes(args, kwargs, size, lanes)
+
+            # check upper bounds
+            if fb is None:
+                fb = np.asarray(f(xb, *lane_args, **lane_kwargs), dtype=float)     # Second function call
+                func_calls[lanes] += 1
+            else:
+                fb = fb[lanes]
+            done = is_root(fb)
+            x0[lanes[done]], fx0[lanes[done]], status[lanes[done]] = xb[done], fb[done], UPPER_BRACKET
+
+            # check if the roots are bracketed.
+            no_bracket = ~done & (fa * fb > 0.0)
+            status[lanes[no_bracket]] = NO_BRACKET
+            done |= no_bracket
+            if done.any():
+                keep = ~done
+                lanes, xa, xb, fa, fb = lanes[keep], xa[keep], xb[keep], fa[keep], fb[keep]
+
+        return x0, fx0, iterations, func_calls, status, lanes, xa, xb, fa, fb
+
+    def _return_result(self, x0, fx0, iterations, func_calls, status):
+        result = BatchResult(x0, fx0, iterations, func_calls, status, self.xtol, self.epsilon)
+        if not result.converged.all():
+            if self._on_fail is not None:
+                self._on_fail(self, result)
+            if self.raise_on_fail:
+                raise ConvergenceError("%d out of %d problems did not converge." % ((~result.converged).sum(), len(result)))
+        elif self._on_finish is not None:
+            self._on_finish(self, result)
+        return result
+
+
+class BatchBisect(_BatchSolver):
+    """
+    Defines a batch Solver for the equations `f(x) = 0` in the intervals `[xa, xb]` using
+    the Bisection Method.
+
+    Contrary to the scalar `Bisect`, the number of halvings is computed up front from the
+    widest bracket and `xtol`, and every lane takes exactly that many halving steps. There is
+    no per-lane branching, so the cost of a batch depends only on its size and on the width
+    of its brackets. This makes `BatchBisect` suitable for latency sensitive code and as a
+    robust fallback for the lanes that other batch solvers failed to converge.
+
+    The lanes whose final `f(x0)` is not close enough to 0 are reported as "small bracket"
+    (or "iterations" if `max_iter` was not enough to shrink their bracket below `xtol`).
+
+    """
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=False, debug_precision=10, hooks=()):
+        super(BatchBisect, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            hooks=hooks,
+            solver_name="BatchBisect"
+        )
+
+    def required_iterations(self, xa, xb):
+        """
+        Return the number of halvings needed for shrinking the widest bracket below `xtol`.
+
+        The brackets with non-finite bounds are ignored; they are never solved.
+
+        """
+        widths = np.abs(np.asarray(xb, dtype=float) - np.asarray(xa, dtype=float))
+        width = float(np.max(widths[np.isfinite(widths)], initial=0.0))
+        if width <= self.xtol:
+            return 1
+        return max(1, int(ceil(log(width / self.xtol, 2))))
+
+    def _solve(self, f, xa, xb, fa, fb, args, kwargs):
+        # local names
+        is_root = self.is_root
+        size = xa.size
+        required = self.required_iterations(xa, xb)
+        iterations = min(required, self.max_iter)
+
+        # every lane is evaluated on both bounds (unless their values are known) and on every midpoint.
+        evaluations = 0
+        if fa is None:
+            fa = np.asarray(f(xa, *args, **kwargs), dtype=float)   # First function call
+            evaluations += 1
+        if fb is None:
+            fb = np.asarray(f(xb, *args, **kwargs), dtype=float)   # Second function call
+            evaluations += 1
+        lower = is_root(fa)
+        upper = is_root(fb)
+        # a bracket with an infinite (or nan) bound can't be bisected.
+        no_bracket = (fa * fb > 0.0) | ~(np.isfinite(xa) & np.isfinite(xb))
+        small = nearly_equal(xa, xb, self.xtol)
+
+        with np.errstate(invalid="ignore", over="ignore"):
+            x1, f1, x2, f2 = xa, fa, xb, fb
+            xm, fm = xb, fb
+            for _ in range(iterations):
+                xm = 0.5 * (x1 + x2)
+                fm = np.asarray(f(xm, *args, **kwargs), dtype=float)   # New function call.
+                # close the brackets
+                same_sign = np.signbit(fm) == np.signbit(f1)
+                x1 = np.where(same_sign, xm, x1)
+                f1 = np.where(same_sign, fm, f1)
+                x2 = np.where(same_sign, x2, xm)
+                f2 = np.where(same_sign, f2, fm)
+
+        # The conditions that the scalar solvers check first are applied last, so that they
+        # take precedence.
+        status = np.where(is_root(fm), CONVERGENCE, SMALL_BRACKET if required <= iterations else ITERATIONS)
+        x0, fx0 = xm, fm
+        for condition, mask, x, fx in [
+            (NO_BRACKET, no_bracket, np.nan, np.nan),
+            (UPPER_BRACKET, upper, xb, fb),
+            (LOWER_BRACKET, lower, xa, fa),
+            (SMALL_BRACKET, small, np.nan, np.nan),
+        ]:
+            status = np.where(mask, condition, status)
+            x0 = np.where(mask, x, x0)
+            fx0 = np.where(mask, fx, fx0)
+
+        iterations = np.full(size, iterations)
+        return self._return_result(x0, fx0, iterations, iterations + evaluations, status.astype(np.int8))
+
+
+class _BatchBrent(_BatchSolver):
+
+    def _extrapolate(self, fcur, fpre, fblk, dpre, dblk):
+        raise NotImplementedError
+
+    def _solve(self, f, xa, xb, fa, fb, args, kwargs):
+        # local names
+        xtol = self.xtol
+        is_root = self.is_root
+        _extrapolate = self._extrapolate
+        size = xa.size
+
+        x0, fx0, iterations, func_calls, status, lanes, xpre, xcur, fpre, fcur = self._check_brackets(f, xa, xb, fa, fb, args, kwargs)
+        lane_args, lane_kwargs = _select_lanes(args, kwargs, size, lanes)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            xblk = np.zeros_like(xpre)
+            fblk = np.zeros_like(xpre)
+            spre = np.zeros_like(xpre)
+            scur = np.zeros_like(xpre)
+
+            # start iterations
+            i = 0
+            for i in range(self.max_iter):
+                if not lanes.size:
+                    break
+
+                flip = fpre * fcur < 0
+                xblk = np.where(flip, xpre, xblk)
+                fblk = np.where(flip, fpre, fblk)
+                spre = np.where(flip, xcur - xpre, spre)
+                scur = np.where(flip, xcur - xpre, scur)
+
+                swap = np.abs(fblk) < np.abs(fcur)
+                xpre, xcur, xblk = np.where(swap, xcur, xpre), np.where(swap, xblk, xcur), np.where(swap, xcur, xblk)
+                fpre, fcur, fblk = np.where(swap, fcur, fpre), np.where(swap, fblk, fcur), np.where(swap, fcur, fblk)
+
+                # check brackets
+                sbis = (xblk - xcur) / 2
+                done = np.abs(sbis) < xtol
+                if done.any():
+                    retired = lanes[done]
+                    x0[retired], fx0[retired], iterations[retired], status[retired] = xcur[done], fcur[done], i + 1, SMALL_BRACKET
+                    keep = ~done
+                    lanes, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, sbis = (
+                        lanes[keep], xpre[keep], xcur[keep], xblk[keep], fpre[keep], fcur[keep], fblk[keep],
+                        spre[keep], scur[keep], sbis[keep]
+                    )
+                    lane_args, lane_kwargs = _select_lanes(args, kwargs, size, lanes)
+                    if not lanes.size:
+                        break
+
+                # calculate short steps; interpolate where `xpre == xblk`, extrapolate elsewhere.
+                interpolate = xpre == xblk
+                stry_interpolate = -fcur * (xcur - xpre) / (fcur - fpre)
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = np.where(interpolate, stry_interpolate, _extrapolate(fcur, fpre, fblk, dpre, dblk))
+
+                # keep the good short steps, bisect everywhere else.
+                short = (np.abs(spre) > xtol) & (np.abs(fcur) < np.abs(fpre))
+                good = short & (2 * np.abs(stry) < np.minimum(np.abs(spre), 3 * np.abs(sbis) - xtol))
+                spre = np.where(good, scur, sbis)
+                scur = np.where(good, stry, sbis)
+
+                xpre = xcur
+                fpre = fcur
+                xcur = xcur + np.where(np.abs(scur) > xtol, scur, np.where(sbis > 0, xtol, -xtol))
+
+                fcur = np.asarray(f(xcur, *lane_args, **lane_kwargs), dtype=float)     # function evaluation
+                func_calls[lanes] += 1
+                done = is_root(fcur)
+                if done.any():
+                    retired = lanes[done]
+                    x0[retired], fx0[retired], iterations[retired], status[retired] = xcur[done], fcur[done], i, CONVERGENCE
+                    keep = ~done
+                    lanes, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur = (
+                        lanes[keep], xpre[keep], xcur[keep], xblk[keep], fpre[keep], fcur[keep], fblk[keep],
+                        spre[keep], scur[keep]
+                    )
+                    lane_args, lane_kwargs = _select_lanes(args, kwargs, size, lanes)
+
+            # whatever is left exceeded the max iterations.
+            x0[lanes], fx0[lanes], iterations[lanes] = xcur, fcur, self.max_iter
+
+        return self._return_result(x0, fx0, iterations, func_calls, status)
+
+
+class BatchBrentq(_BatchBrent):
+    """
+    Defines a batch Solver for the equations `f(x) = 0` in the intervals `[xa, xb]` using
+    Brent's Method with inverse quadratic extrapolation (i.e. the vectorized `Brentq`).
+
+    """
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=False, debug_precision=10, hooks=()):
+        super(BatchBrentq, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            hooks=hooks,
+            solver_name="BatchBrentq"
+        )
+
+    _extrapolate = staticmethod(_inverse_quadratic)
+
+
+class BatchBrenth(_BatchBrent):
+    """
+    Defines a batch Solver for the equations `f(x) = 0` in the intervals `[xa, xb]` using
+    Brent's Method with hyperbolic extrapolation (i.e. the vectorized `Brenth`).
+
+    """
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=False, debug_precision=10, hooks=()):
+        super(BatchBrenth, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            hooks=hooks,
+            solver_name="BatchBrenth"
+        )
+
+    _extrapolate = staticmethod(_hyperbolic)
+
+
+class BatchChandrupatla(_BatchSolver):
+    """
+    Defines a batch Solver for the equations `f(x) = 0` in the intervals `[xa, xb]` using
+    Chandrupatla's Method (i.e. the vectorized `Chandrupatla`).
+
+    Every iteration applies the same update to all the lanes: the choice between inverse
+    quadratic interpolation and bisection only changes the step `t`, so there are no masked
+    branches and it is considerably cheaper per lane than `BatchBrentq`.
+
+    """
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=False, debug_precision=10, hooks=()):
+        super(BatchChandrupatla, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            hooks=hooks,
+            solver_name="BatchChandrupatla"
+        )
+
+    def _solve(self, f, xa, xb, fa, fb, args, kwargs):
+        # local names
+        xtol = self.xtol
+        is_root = self.is_root
+        size = xa.size
+
+        x0, fx0, iterations, func_calls, status, lanes, x2, x1, f2, f1 = self._check_brackets(f, xa, xb, fa, fb, args, kwargs)
+        lane_args, lane_kwargs = _select_lanes(args, kwargs, size, lanes)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            # `x1` is the last point, `x2` the other end of the bracket and `x3` the point that
+            # was dropped from the bracket. The new point is `x1 + t * (x2 - x1)`.
+            xm, fm = x1, f1
+            t = np.full(lanes.size, 0.5)
+
+            # start iterations
+            i = 0
+            for i in range(1, self.max_iter + 1):
+                if not lanes.size:
+                    break
+
+                xt = x1 + t * (x2 - x1)
+                ft = np.asarray(f(xt, *lane_args, **lane_kwargs), dtype=float)     # function evaluation
+                func_calls[lanes] += 1
+
+                # close the brackets
+                same_sign = np.signbit(ft) == np.signbit(f1)
+                x3, f3 = np.where(same_sign, x1, x2), np.where(same_sign, f1, f2)
+                x2, f2 = np.where(same_sign, x2, x1), np.where(same_sign, f2, f1)
+                x1, f1 = xt, ft
+
+                # check for convergence and for the new bracket sizes.
+                closest = np.abs(f1) < np.abs(f2)
+                xm, fm = np.where(closest, x1, x2), np.where(closest, f1, f2)
+                tl = xtol * np.maximum(1.0, np.abs(xm)) / np.abs(x2 - x1)
+                converged = is_root(ft)
+                small = ~converged & (tl > 0.5)
+                done = converged | small
+                if done.any():
+                    for mask, x, fx, condition in [(converged, xt, ft, CONVERGENCE), (small, xm, fm, SMALL_BRACKET)]:
+                        retired = lanes[mask]
+                        x0[retired], fx0[retired], iterations[retired], status[retired] = x[mask], fx[mask], i, condition
+                    keep = ~done
+                    lanes, x1, f1, x2, f2, x3, f3, xm, fm, tl = (
+                        lanes[keep], x1[keep], f1[keep], x2[keep], f2[keep], x3[keep], f3[keep], xm[keep], fm[keep], tl[keep]
+                    )
+                    lane_args, lane_kwargs = _select_lanes(args, kwargs, size, lanes)
+
+                # interpolate where the inverse quadratic is monotonic in the bracket, bisect elsewhere.
+                xi = (x1 - x2) / (x3 - x2)
+                phi = (f1 - f2) / (f3 - f2)
+                interpolate = (phi ** 2 < xi) & ((1 - phi) ** 2 < 1 - xi) & (f1 != f3)
+                t = np.where(
+                    interpolate,
+                    f1 / (f2 - f1) * f3 / (f2 - f3) + (x3 - x1) / (x2 - x1) * f1 / (f3 - f1) * f2 / (f3 - f2),
+                    0.5,
+                )
+                t = np.minimum(1 - tl, np.maximum(tl, t))
+
+            # whatever is left exceeded the max iterations.
+            x0[lanes], fx0[lanes], iterations[lanes] = xm, fm, i
+
+        return self._return_result(x0, fx0, iterations, func_calls, status)
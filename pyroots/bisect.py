@@ -58,56 +58,59 @@ class Bisect(BaseSolver):
 
     """
 
-    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10):
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), profile=0.0):
         super(Bisect, self).__init__(
             epsilon=epsilon,
             xtol=xtol,
             max_iter=max_iter,
             raise_on_fail=raise_on_fail,
             debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
             solver_name="Bisect"
         )
 
-    def _solve(self, f, xa, xb, *args, **kwargs):
+    def _iterate(self, xa, xb, fa, fb):
         """ Bisect implementation.  """
         # local names
         xtol = self.xtol
+        on_iteration = self._on_iteration
 
         # initialize counters
         i = 0
-        x_steps = []
-        fx_steps = []
+        fcalls = 0
 
         # check that the bracket's interval is sufficiently big.
         if nearly_equal(xa, xb, xtol):
-            return self._return_result(None, None, i, x_steps, fx_steps, False, "small bracket")
+            return None, None, i, fcalls, False, "small bracket"
 
         # check lower bound
-        fa = f(xa, *args, **kwargs)               # First function call
-        x_steps.append(xa)
-        fx_steps.append(fa)
+        if fa is None:
+            fa = yield xa           # First function call
+            fcalls += 1
         if self.is_root(fa):
-            return self._return_result(xa, fa, i, x_steps, fx_steps, True, "lower bracket")
+            return xa, fa, i, fcalls, True, "lower bracket"
 
         # check upper bound
-        fb = f(xb, *args, **kwargs)               # Second function call
-        x_steps.append(xb)
-        fx_steps.append(fb)
-        self._debug(i, len(fx_steps), xa, xb, fa, fb)
+        if fb is None:
+            fb = yield xb           # Second function call
+            fcalls += 1
+        if on_iteration is not None:
+            on_iteration(self, i, fcalls, xa, xb, fa, fb)
         if self.is_root(fb):
-            return self._return_result(xb, fb, i, x_steps, fx_steps, True, "upper bracket")
+            return xb, fb, i, fcalls, True, "upper bracket"
 
         # check if the root is bracketed.
         if fa * fb > 0.0:
-            return self._return_result(None, None, i, x_steps, fx_steps, False, "no bracket")
+            return None, None, i, fcalls, False, "no bracket"
 
         # start iterations
         for i in range(1, self.max_iter + 1):
             # Bisect the bracket and calculate the new function value.
             xm = 0.5 * (xa + xb)
-            fm = f(xm, *args, **kwargs)           # New function call.
-            x_steps.append(xm)
-            fx_steps.append(fm)
+            fm = yield xm           # New function call.
+            fcalls += 1
 
             # close the bracket
             if copysign(1, fm) == copysign(1, fa):
@@ -116,14 +119,15 @@ class Bisect(BaseSolver):
             else:
                 xb = xm
                 fb = fm
-            self._debug(i, len(fx_steps), xa, xb, fa, fb)
+            if on_iteration is not None:
+                on_iteration(self, i, fcalls, xa, xb, fa, fb)
 
             # check for convergence.
             if self.is_root(fm):
-                return self._return_result(xm, fm, i, x_steps, fx_steps, True, "convergence")
+                return xm, fm, i, fcalls, True, "convergence"
 
             # check for the new bracket size.
             if nearly_equal(xa, xb, xtol):
-                return self._return_result(xm, fm, i, x_steps, fx_steps, False, "small bracket")
+                return xm, fm, i, fcalls, False, "small bracket"
 
-        return self._return_result(xm, fm, i, x_steps, fx_steps, False, "iterations")
+        return xm, fm, i, fcalls, False, "iterations"
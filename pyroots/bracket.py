@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/bracket.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Bracket discovery starting from an initial guess.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from collections import namedtuple
+
+
+Bracket = namedtuple("Bracket", "xa xb fa fb func_calls found")
+Bracket.__doc__ = """
+A bracket returned by `find_bracket()`.
+
+`fa` and `fb` are the values of `f` on `xa` and `xb`, so the bracket can be passed to
+`solver.solve(f, xa, xb, fa, fb)` without evaluating them again. `found` is `False` if no
+sign change was found; `[xa, xb]` is then the interval that has been searched.
+"""
+
+
+def _check_search(factor, max_iter):
+    if not factor > 1:
+        raise ValueError("factor must be greater than 1, not: %r" % factor)
+    if (not isinstance(max_iter, int)) or max_iter < 0:
+        raise ValueError("max_iter must be a positive integer, not: %r" % max_iter)
+
+
+def find_bracket(f, x0, step=None, factor=2.0, lower=None, upper=None, max_iter=50, args=(), kwargs=None):
+    """
+    Search for an interval around `x0` where `f` changes sign.
+
+    `f` is evaluated on `x0` and `x0 + step`. Then the interval is expanded geometrically
+    (by up to `factor` times its width) towards the side where `|f|` is smaller, i.e.
+    downhill, until the sign of `f` changes. The expansions are limited to twice the
+    distance of the root predicted by the secant through the last two points of the side.
+    Only the last expansion is returned, so the bracket is as tight as the search allows
+    and both of its ends have already been evaluated.
+
+    Parameters
+    ----------
+    :param function f:
+        The function whose root we are searching.
+    :param float x0:
+        The initial guess.
+    :param float step:
+        The initial width of the interval. It defaults to `1e-2 * max(1, |x0|)`.
+    :param float factor:
+        The growth factor of the width of the interval.
+    :param float lower:
+        The lower limit of the domain of `f` or `None`.
+    :param float upper:
+        The upper limit of the domain of `f` or `None`.
+    :param int max_iter:
+        The maximum allowed number of expansions.
+    :param tuple args:
+        Function's `f` positional arguments.
+    :param dict kwargs:
+        Function's `f` keyword arguments.
+
+    :returns: A `Bracket` instance.
+
+    """
+    kwargs = kwargs or {}
+    search = _search(x0, None, step, factor, lower, upper, max_iter)
+    try:
+        x = next(search)
+        while True:
+            x = search.send(f(x, *args, **kwargs))
+    except StopIteration as stop:
+        return stop.value
+
+
+def _start(x0, step, lower, upper):
+    """ Check the domain and return it, the initial step and the second point of a search. """
+    lower = float("-inf") if lower is None else lower
+    upper = float("inf") if upper is None else upper
+    step = 1e-2 * max(1.0, abs(x0)) if step is None else abs(step)
+    if not lower <= x0 <= upper or not lower < upper:
+        raise ValueError("The initial guess %r is outside of the domain [%r, %r]." % (x0, lower, upper))
+    x1 = min(x0 + step, upper)
+    if x1 == x0:
+        x1 = max(x0 - step, lower)
+    return lower, upper, step, x1
+
+
+def _search(x0, fx0, step, factor, lower, upper, max_iter):
+    """
+    The search of `find_bracket()` as a generator, which yields the `x` values that must be
+    evaluated and receives `f(x)` back, so that it can be used inside `_iterate()` of the
+    solvers. `fx0` is `f(x0)`, or `None` if it must be evaluated.
+
+    """
+    _check_search(factor, max_iter)
+    lower, upper, _, xb = _start(x0, step, lower, upper)
+
+    xa, fa = x0, fx0
+    func_calls = 0
+    if fa is None:
+        fa = yield xa
+        func_calls += 1
+    fb = yield xb
+    func_calls += 1
+    if xb < xa:
+        xa, xb, fa, fb = xb, xa, fb, fa
+
+    # The previous ends of the interval, for the secant steps.
+    xl, fl, xr, fr = xb, fb, xa, fa
+    for _ in range(max_iter):
+        if fa * fb <= 0.0:
+            break
+        left = abs(fa) < abs(fb)
+        if (left and xa == lower) or (not left and xb == upper):
+            left = not left
+        # The secant through the last two points of the side predicts how far the root is.
+        # The expansion is limited to twice that distance, so that the search neither stalls
+        # nor steps over pairs of roots when it gets close to them.
+        width = factor * (xb - xa)
+        if left:
+            distance = fa * (xa - xl) / (fa - fl) if fa != fl else 0.0
+        else:
+            distance = fb * (xr - xb) / (fb - fr) if fb != fr else 0.0
+        if 0.0 < 2 * distance < width:
+            width = 2 * distance
+        if left:
+            x = max(xa - width, lower)
+            if x == xa:
+                break
+            fx = yield x
+            if fx * fa <= 0.0:
+                xb, fb = xa, fa
+            xl, fl = xa, fa
+            xa, fa = x, fx
+        else:
+            x = min(xb + width, upper)
+            if x == xb:
+                break
+            fx = yield x
+            if fx * fb <= 0.0:
+                xa, fa = xb, fb
+            xr, fr = xb, fb
+            xb, fb = x, fx
+        func_calls += 1
+
+    return Bracket(xa, xb, fa, fb, func_calls, fa * fb <= 0.0)
@@ -48,117 +48,149 @@ from .utils import EPS, nearly_equal
 from .base import BaseSolver
 
 
-class _Brent(BaseSolver):
+def _inverse_quadratic(fcur, fpre, fblk, dpre, dblk):
+    """ The extrapolation of `Brentq`.  """
+    return -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+
+
+def _hyperbolic(fcur, fpre, fblk, dpre, dblk):
+    """ The extrapolation of `Brenth`.  """
+    return -fcur * (fblk - fpre) / (fblk * dpre - fpre * dblk)
 
-    def _extrapolation(self, *args, **kwargs):
-        raise NotImplementedError
 
-    def _solve(self, f, xa, xb, *args, **kwargs):
-        # local names
-        xtol = self.xtol
-        _extrapolate = self._extrapolate
-
-        # initialize counters
-        i = 0
-        x_steps = []
-        fx_steps = []
-
-        # rename variables in order to be consistent with scipy's code.
-        xpre, xcur = xa, xb
-        xblk, fblk, spre, scur = 0, 0, 0, 0
-
-        #check that the bracket's interval is sufficiently big.
-        if nearly_equal(xa, xb, xtol):
-            return self._return_result(None, None, i, x_steps, fx_steps, False, "small bracket")
-
-        # check lower bound
-        fpre = f(xpre, *args, **kwargs)             # First function call
-        x_steps.append(xpre)
-        fx_steps.append(fpre)
-        if self.is_root(fpre):
-            return self._return_result(xpre, fpre, i, x_steps, fx_steps, True, "lower bracket")
-
-        # check upper bound
-        fcur = f(xcur, *args, **kwargs)             # Second function call
-        x_steps.append(xcur)
-        fx_steps.append(fcur)
-        self._debug(i, len(fx_steps), xpre, xcur, fpre, fcur)
-        if self.is_root(fcur):
-            return self._return_result(xcur, fcur, i, x_steps, fx_steps, True, "upper bracket")
-
-        # check if the root is bracketed.
-        if fpre * fcur > 0.0:
-            return self._return_result(None, None, i, x_steps, fx_steps, False, "no bracket")
-
-        # start iterations
-        for i in range(self.max_iter):
-            if (fpre*fcur < 0):
-                xblk = xpre
-                fblk = fpre
-                spre = scur = xcur - xpre
-
-            if (abs(fblk) < abs(fcur)):
-                xpre = xcur
-                xcur = xblk
-                xblk = xpre
-                fpre = fcur
-                fcur = fblk
-                fblk = fpre
-
-            # check for convergence
-            #if self.is_root(fcur):
-                #return self._return_result(xcur, fcur, i + 1, x_steps, fx_steps, True, "convergence")
-
-            # check bracket
-            sbis = (xblk - xcur) / 2;
-            if abs(sbis) < xtol:
-                return self._return_result(xcur, fcur, i + 1, x_steps, fx_steps, False, "small bracket")
-
-            # calculate short step
-            #self.logger.debug("spre %f; fcur %f; fpre %f; xblk %f; sbis %f", spre, fcur, fpre, xblk, sbis)
-            if abs(spre) > xtol and abs(fcur) < abs(fpre):
-                if xpre == xblk:
-                    # interpolate
-                    stry = -fcur * (xcur - xpre) / (fcur - fpre)
-                    #self.logger.debug("Interpolate: stry %f", stry)
-                else:
-                    # extrapolate
-                    dpre = (fpre - fcur) / (xpre - xcur)
-                    dblk = (fblk - fcur) / (xblk - xcur)
-                    stry = _extrapolate(fcur, fpre, fblk, dpre, dblk)
-                    #self.logger.debug("Extrapolate: stry %f", stry)
-
-                # check short step
-                if (2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - xtol)):
-                    # good short step
-                    spre = scur
-                    scur = stry
-                    #self.logger.debug("Good step")
-                else:
-                    # bisect
-                    spre = sbis
-                    scur = sbis
-                    #self.logger.debug("Bad step, bisecting")
+def _brent(solver, xa, xb, fa, fb, _extrapolate, max_iter=None):
+    """
+    The iterations of Brent's method, as the `_iterate()` generator of `solver`.
+
+    It is a function, so that other solvers (e.g. `Secant`) can finish their solves with it.
+    `_extrapolate` is the extrapolation of the method, e.g. `_inverse_quadratic()`.
+    `max_iter` defaults to the `max_iter` of `solver`; the other solvers pass the iterations
+    that they have left.
+
+    """
+    # local names
+    xtol = solver.xtol
+    max_iter = solver.max_iter if max_iter is None else max_iter
+    on_iteration = solver._on_iteration
+    on_step = solver._on_step
+
+    # initialize counters
+    i = 0
+    fcalls = 0
+
+    # rename variables in order to be consistent with scipy's code.
+    xpre, xcur = xa, xb
+    xblk, fblk, spre, scur = 0, 0, 0, 0
+
+    #check that the bracket's interval is sufficiently big.
+    if nearly_equal(xa, xb, xtol):
+        return None, None, i, fcalls, False, "small bracket"
+
+    # check lower bound
+    fpre, fcur = fa, fb
+    if fpre is None:
+        fpre = yield xpre         # First function call
+        fcalls += 1
+    if solver.is_root(fpre):
+        return xpre, fpre, i, fcalls, True, "lower bracket"
+
+    # check upper bound
+    if fcur is None:
+        fcur = yield xcur         # Second function call
+        fcalls += 1
+    if on_iteration is not None:
+        on_iteration(solver, i, fcalls, xpre, xcur, fpre, fcur)
+    if solver.is_root(fcur):
+        return xcur, fcur, i, fcalls, True, "upper bracket"
+
+    # check if the root is bracketed.
+    if fpre * fcur > 0.0:
+        return None, None, i, fcalls, False, "no bracket"
+
+    # start iterations
+    for i in range(max_iter):
+        if (fpre*fcur < 0):
+            xblk = xpre
+            fblk = fpre
+            spre = scur = xcur - xpre
+
+        if (abs(fblk) < abs(fcur)):
+            xpre = xcur
+            xcur = xblk
+            xblk = xpre
+            fpre = fcur
+            fcur = fblk
+            fblk = fpre
+
+        # check for convergence
+        #if solver.is_root(fcur):
+            #return xcur, fcur, i + 1, fcalls, True, "convergence"
+
+        # check bracket
+        sbis = (xblk - xcur) / 2;
+        if abs(sbis) < xtol:
+            return xcur, fcur, i + 1, fcalls, False, "small bracket"
+
+        # calculate short step
+        #solver.logger.debug("spre %f; fcur %f; fpre %f; xblk %f; sbis %f", spre, fcur, fpre, xblk, sbis)
+        if abs(spre) > xtol and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # interpolate
+                step = "interpolate"
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+                #solver.logger.debug("Interpolate: stry %f", stry)
+            else:
+                # extrapolate
+                step = "extrapolate"
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = _extrapolate(fcur, fpre, fblk, dpre, dblk)
+                #solver.logger.debug("Extrapolate: stry %f", stry)
+
+            # check short step
+            if (2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - xtol)):
+                # good short step
+                spre = scur
+                scur = stry
+                #solver.logger.debug("Good step")
             else:
                 # bisect
+                step = "bisect"
                 spre = sbis
                 scur = sbis
+                #solver.logger.debug("Bad step, bisecting")
+        else:
+            # bisect
+            step = "bisect"
+            spre = sbis
+            scur = sbis
+
+        xpre = xcur;
+        fpre = fcur;
+        if (abs(scur) > xtol):
+            xcur += scur
+        else:
+            xcur += xtol if (sbis > 0) else -xtol
+
+        if on_step is not None:
+            on_step(solver, i + 1, step)
+        fcur = yield xcur     # function evaluation
+        fcalls += 1
+        if on_iteration is not None:
+            on_iteration(solver, i + 1, fcalls, xpre, xcur, fpre, fcur)
+        if solver.is_root(fcur):
+            return xcur, fcur, i, fcalls, True, "convergence"
+
+    return xcur, fcur, max_iter, fcalls, False, "iterations"
 
-            xpre = xcur;
-            fpre = fcur;
-            if (abs(scur) > xtol):
-                xcur += scur
-            else:
-                xcur += xtol if (sbis > 0) else -xtol
 
-            fcur = f(xcur, *args, **kwargs)     # function evaluation
-            x_steps.append(xcur)
-            fx_steps.append(fcur)
-            self._debug(i + 1, len(fx_steps), xpre, xcur, fpre, fcur)
-            if self.is_root(fcur):
-                return self._return_result(xcur, fcur, i, x_steps, fx_steps, True, "convergence")
+class _Brent(BaseSolver):
+
+    def _extrapolate(self, fcur, fpre, fblk, dpre, dblk):
+        raise NotImplementedError
 
-        return self._return_result(xcur, fcur, i + 1, x_steps, fx_steps, False, "iterations")
+    def _iterate(self, xa, xb, fa, fb):
+        return _brent(self, xa, xb, fa, fb, self._extrapolate)
 
 
 class Brentq(_Brent):
@@ -170,18 +202,20 @@ class Brentq(_Brent):
 
     """
 
-    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10):
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), profile=0.0):
         super(Brentq, self).__init__(
             epsilon=epsilon,
             xtol=xtol,
             max_iter=max_iter,
             raise_on_fail=raise_on_fail,
             debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
             solver_name="Brentq"
         )
 
-    def _extrapolate(self, fcur, fpre, fblk, dpre, dblk):
-        return -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+    _extrapolate = staticmethod(_inverse_quadratic)
 
 
 class Brenth(_Brent):
@@ -193,15 +227,17 @@ class Brenth(_Brent):
 
     """
 
-    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10):
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), profile=0.0):
         super(Brenth, self).__init__(
             epsilon=epsilon,
             xtol=xtol,
             max_iter=max_iter,
             raise_on_fail=raise_on_fail,
             debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
             solver_name="Brenth"
         )
 
-    def _extrapolate(self, fcur, fpre, fblk, dpre, dblk):
-        return -fcur * (fblk - fpre) / (fblk * dpre - fpre * dblk)
+    _extrapolate = staticmethod(_hyperbolic)
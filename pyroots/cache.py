@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/cache.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Memoization of expensive functions.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import threading
+from collections import OrderedDict
+
+
+def hashable(value):
+    """
+    Return a hashable form of `value`.
+
+    Lists and tuples become tuples, dicts become sorted tuples of their items, sets become
+    frozensets and arrays (i.e. objects with a `tobytes()` method) become a tuple of their
+    type, shape and bytes. `TypeError` is raised for anything else that is not hashable.
+
+    """
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+    if isinstance(value, (list, tuple)):
+        return tuple(hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, hashable(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(hashable(item) for item in value)
+    if hasattr(value, "tobytes"):
+        return (type(value).__name__, getattr(value, "shape", None), str(getattr(value, "dtype", "")), value.tobytes())
+    raise TypeError("Can't cache the evaluations of arguments of type %r." % type(value))
+
+
+class CachedFunction(object):
+    """
+    Wrap `f(x, *args, **kwargs)` with a least-recently-used cache of its values.
+
+    The cache is keyed on `x`, on its type and on a hashable form of the arguments (see
+    `hashable()`). The type keeps apart e.g. `2.0` and `Dual(2.0, 1.0)`, which compare equal,
+    so that `Newton` and the other solvers can share a cache.
+    The same instance can be passed to several solvers and solves, e.g. when solving again
+    with overlapping brackets; the evaluations of all of them are cached. It is thread safe.
+
+    Parameters
+    ----------
+    :param function f:
+        The function to be cached. It must be pure, i.e. its value must only depend on its
+        arguments.
+    :param int maxsize:
+        The maximum number of cached values. The least recently used value is evicted when
+        the cache is full. If it is `None`, the cache can grow without bound.
+
+    """
+
+    def __init__(self, f, maxsize=1024):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be a positive integer or None, not: %r" % maxsize)
+        self.f = f
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, x, *args, **kwargs):
+        if args or kwargs or type(x) is not float:
+            key = (type(x), x, hashable(args), hashable(kwargs))
+        else:
+            key = x
+        with self._lock:
+            try:
+                value = self._values[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._values.move_to_end(key)
+                self.hits += 1
+                return value
+
+        # The function is evaluated without holding the lock.
+        value = self.f(x, *args, **kwargs)
+        with self._lock:
+            self._values[key] = value
+            if self.maxsize is not None and len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def __len__(self):
+        return len(self._values)
+
+    def clear(self):
+        """ Empty the cache and reset the counters.  """
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __repr__(self):
+        return "CachedFunction(%r, maxsize=%r, size=%d, hits=%d, misses=%d)" % (
+            self.f, self.maxsize, len(self), self.hits, self.misses
+        )
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/chandrupatla.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Chandrupatla's algorithm for root finding.
+
+T. R. Chandrupatla, "A new hybrid quadratic/bisection algorithm for finding the zero of a
+nonlinear function without using derivatives", Advances in Engineering Software, 28(3),
+145-149 (1997).
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from math import copysign
+
+from .utils import EPS, nearly_equal
+from .base import BaseSolver
+
+
+class Chandrupatla(BaseSolver):
+    """
+    Defines a Solver for the equation `f(x) = 0` in the interval `[xa, xb]` using
+    Chandrupatla's Method.
+
+    Like Brent's method, it combines inverse quadratic interpolation with bisection, but it
+    only interpolates when the last three points suggest that the interpolation is safe, so
+    it has a single branch per iteration. `BatchChandrupatla` is its vectorized version.
+
+    Function `f` must be solvable in `[xa, xb]`. Also `f(xa)` and `f(xb)` must
+    have different signs.
+
+    """
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), profile=0.0):
+        super(Chandrupatla, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
+            solver_name="Chandrupatla"
+        )
+
+    def _iterate(self, xa, xb, fa, fb):
+        """ Chandrupatla implementation.  """
+        # local names
+        xtol = self.xtol
+        on_iteration = self._on_iteration
+        on_step = self._on_step
+        is_root = self.is_root
+
+        # initialize counters
+        i = 0
+        fcalls = 0
+
+        #check that the bracket's interval is sufficiently big.
+        if nearly_equal(xa, xb, xtol):
+            return None, None, i, fcalls, False, "small bracket"
+
+        # check lower bound
+        if fa is None:
+            fa = yield xa           # First function call
+            fcalls += 1
+        if is_root(fa):
+            return xa, fa, i, fcalls, True, "lower bracket"
+
+        # check upper bound
+        if fb is None:
+            fb = yield xb           # Second function call
+            fcalls += 1
+        if on_iteration is not None:
+            on_iteration(self, i, fcalls, xa, xb, fa, fb)
+        if is_root(fb):
+            return xb, fb, i, fcalls, True, "upper bracket"
+
+        # check if the root is bracketed.
+        if fa * fb > 0.0:
+            return None, None, i, fcalls, False, "no bracket"
+
+        # `x1` is the last point, `x2` the other end of the bracket and `x3` the point that
+        # was dropped from the bracket. The new point is `x1 + t * (x2 - x1)`.
+        x1, f1, x2, f2 = xb, fb, xa, fa
+        xm, fm = x1, f1
+        t, step = 0.5, "bisect"
+        for i in range(1, self.max_iter + 1):
+            xt = x1 + t * (x2 - x1)
+            if on_step is not None:
+                on_step(self, i, step)
+            ft = yield xt           # New function call.
+            fcalls += 1
+
+            # close the bracket
+            if copysign(1, ft) == copysign(1, f1):
+                x3, f3 = x1, f1
+            else:
+                x3, f3 = x2, f2
+                x2, f2 = x1, f1
+            x1, f1 = xt, ft
+            if on_iteration is not None:
+                on_iteration(self, i, fcalls, x1, x2, f1, f2)
+
+            # check for convergence.
+            if is_root(ft):
+                return xt, ft, i, fcalls, True, "convergence"
+
+            # check for the new bracket size.
+            xm, fm = (x1, f1) if abs(f1) < abs(f2) else (x2, f2)
+            tl = xtol * max(1.0, abs(xm)) / abs(x2 - x1)
+            if tl > 0.5:
+                return xm, fm, i, fcalls, False, "small bracket"
+
+            # Interpolate if the inverse quadratic through the three points is monotonic in the
+            # bracket, bisect otherwise.
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            if phi ** 2 < xi and (1 - phi) ** 2 < 1 - xi and f1 != f3:
+                t = f1 / (f2 - f1) * f3 / (f2 - f3) + (x3 - x1) / (x2 - x1) * f1 / (f3 - f1) * f2 / (f3 - f2)
+                step = "interpolate"
+            else:
+                t, step = 0.5, "bisect"
+            # stay at least `xtol` away from the ends of the bracket.
+            t = min(1 - tl, max(tl, t))
+
+        return xm, fm, i, fcalls, False, "iterations"
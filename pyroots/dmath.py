@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/dmath.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+The functions of `math` for dual and hyper-dual numbers.
+
+They are the same as the functions of `math` for floats, so a function that is written with
+them can be solved by all the solvers and differentiated with `pyroots.dual`.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+from .dual import DUALS
+
+# Constants
+pi = math.pi
+e = math.e
+inf = float("inf")
+nan = float("nan")
+
+
+def sqrt(x):
+    if isinstance(x, DUALS):
+        value = math.sqrt(x.real)
+        return x._chain(value, 0.5 / value, -0.25 / (value * x.real))
+    return math.sqrt(x)
+
+
+def exp(x):
+    if isinstance(x, DUALS):
+        value = math.exp(x.real)
+        return x._chain(value, value, value)
+    return math.exp(x)
+
+
+def expm1(x):
+    if isinstance(x, DUALS):
+        value = math.exp(x.real)
+        return x._chain(math.expm1(x.real), value, value)
+    return math.expm1(x)
+
+
+def log(x, base=None):
+    if isinstance(x, DUALS):
+        a = x.real
+        if base is None:
+            return x._chain(math.log(a), 1 / a, -1 / (a * a))
+        d = 1 / (a * math.log(base))
+        return x._chain(math.log(a, base), d, -d / a)
+    return math.log(x) if base is None else math.log(x, base)
+
+
+def log10(x):
+    if isinstance(x, DUALS):
+        a = x.real
+        d = 1 / (a * math.log(10))
+        return x._chain(math.log10(a), d, -d / a)
+    return math.log10(x)
+
+
+def log1p(x):
+    if isinstance(x, DUALS):
+        a = 1 + x.real
+        return x._chain(math.log1p(x.real), 1 / a, -1 / (a * a))
+    return math.log1p(x)
+
+
+def sin(x):
+    if isinstance(x, DUALS):
+        s, c = math.sin(x.real), math.cos(x.real)
+        return x._chain(s, c, -s)
+    return math.sin(x)
+
+
+def cos(x):
+    if isinstance(x, DUALS):
+        s, c = math.sin(x.real), math.cos(x.real)
+        return x._chain(c, -s, -c)
+    return math.cos(x)
+
+
+def tan(x):
+    if isinstance(x, DUALS):
+        t = math.tan(x.real)
+        d = 1 + t * t
+        return x._chain(t, d, 2 * t * d)
+    return math.tan(x)
+
+
+def asin(x):
+    if isinstance(x, DUALS):
+        a = x.real
+        d = 1 / math.sqrt(1 - a * a)
+        return x._chain(math.asin(a), d, a * d * d * d)
+    return math.asin(x)
+
+
+def acos(x):
+    if isinstance(x, DUALS):
+        a = x.real
+        d = 1 / math.sqrt(1 - a * a)
+        return x._chain(math.acos(a), -d, -a * d * d * d)
+    return math.acos(x)
+
+
+def atan(x):
+    if isinstance(x, DUALS):
+        a = x.real
+        d = 1 / (1 + a * a)
+        return x._chain(math.atan(a), d, -2 * a * d * d)
+    return math.atan(x)
+
+
+def sinh(x):
+    if isinstance(x, DUALS):
+        s, c = math.sinh(x.real), math.cosh(x.real)
+        return x._chain(s, c, s)
+    return math.sinh(x)
+
+
+def cosh(x):
+    if isinstance(x, DUALS):
+        s, c = math.sinh(x.real), math.cosh(x.real)
+        return x._chain(c, s, c)
+    return math.cosh(x)
+
+
+def tanh(x):
+    if isinstance(x, DUALS):
+        t = math.tanh(x.real)
+        d = 1 - t * t
+        return x._chain(t, d, -2 * t * d)
+    return math.tanh(x)
+
+
+def asinh(x):
+    if isinstance(x, DUALS):
+        a = x.real
+        d = 1 / math.sqrt(1 + a * a)
+        return x._chain(math.asinh(a), d, -a * d * d * d)
+    return math.asinh(x)
+
+
+def acosh(x):
+    if isinstance(x, DUALS):
+        a = x.real
+        d = 1 / math.sqrt(a * a - 1)
+        return x._chain(math.acosh(a), d, -a * d * d * d)
+    return math.acosh(x)
+
+
+def atanh(x):
+    if isinstance(x, DUALS):
+        a = x.real
+        d = 1 / (1 - a * a)
+        return x._chain(math.atanh(a), d, 2 * a * d * d)
+    return math.atanh(x)
+
+
+def erf(x):
+    if isinstance(x, DUALS):
+        a = x.real
+        d = 2 / math.sqrt(math.pi) * math.exp(-a * a)
+        return x._chain(math.erf(a), d, -2 * a * d)
+    return math.erf(x)
+
+
+def erfc(x):
+    if isinstance(x, DUALS):
+        a = x.real
+        d = 2 / math.sqrt(math.pi) * math.exp(-a * a)
+        return x._chain(math.erfc(a), -d, 2 * a * d)
+    return math.erfc(x)
+
+
+def pow(x, y):
+    if isinstance(x, DUALS) or isinstance(y, DUALS):
+        return x ** y
+    return math.pow(x, y)
+
+
+def hypot(x, y):
+    if isinstance(x, DUALS) or isinstance(y, DUALS):
+        return sqrt(x * x + y * y)
+    return math.hypot(x, y)
+
+
+def fabs(x):
+    return abs(x) if isinstance(x, DUALS) else math.fabs(x)
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/dual.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Dual and hyper-dual numbers for forward-mode automatic differentiation.
+
+If `f` is written with the usual operators and the functions of `pyroots.dmath`, then
+`f(Dual(x, 1))` returns `Dual(f(x), f'(x))` and `f(HyperDual(x, 1, 1, 0))` returns
+`HyperDual(f(x), f'(x), f'(x), f''(x))`, i.e. the derivatives are exact (to rounding) and
+they are computed with a single evaluation of `f`.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+import numbers
+
+
+class Dual(object):
+    """
+    The dual number `real + dual * e`, where `e * e = 0`.
+
+    The comparisons only take the real part into account. Dual numbers can't be converted to
+    `float`, so passing one to a function of `math` (instead of `pyroots.dmath`) raises a
+    `TypeError` instead of silently dropping the derivative.
+
+    """
+
+    __slots__ = ("real", "dual")
+
+    def __init__(self, real, dual=0.0):
+        self.real = real
+        self.dual = dual
+
+    def _chain(self, g0, g1, g2):
+        # `g(self)` for a function `g` whose value and derivatives at `self.real` are `g0`, `g1`
+        # and `g2`.
+        return Dual(g0, g1 * self.dual)
+
+    def __repr__(self):
+        return "Dual(%r, %r)" % (self.real, self.dual)
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real + other.real, self.dual + other.dual)
+        if isinstance(other, numbers.Real):
+            return Dual(self.real + other, self.dual)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real - other.real, self.dual - other.dual)
+        if isinstance(other, numbers.Real):
+            return Dual(self.real - other, self.dual)
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, numbers.Real):
+            return Dual(other - self.real, -self.dual)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real * other.real, self.real * other.dual + self.dual * other.real)
+        if isinstance(other, numbers.Real):
+            return Dual(self.real * other, self.dual * other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real / other.real, (self.dual * other.real - self.real * other.dual) / (other.real * other.real))
+        if isinstance(other, numbers.Real):
+            return Dual(self.real / other, self.dual / other)
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        if isinstance(other, numbers.Real):
+            return Dual(other / self.real, -other * self.dual / (self.real * self.real))
+        return NotImplemented
+
+    __div__, __rdiv__ = __truediv__, __rtruediv__
+
+    def __pow__(self, other):
+        return _power(self, other)
+
+    def __rpow__(self, other):
+        if isinstance(other, numbers.Real):
+            return _power(other, self)
+        return NotImplemented
+
+    def __neg__(self):
+        return Dual(-self.real, -self.dual)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.real < 0 else self
+
+    def __eq__(self, other):
+        return self.real == getattr(other, "real", other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self.real < getattr(other, "real", other)
+
+    def __le__(self, other):
+        return self.real <= getattr(other, "real", other)
+
+    def __gt__(self, other):
+        return self.real > getattr(other, "real", other)
+
+    def __ge__(self, other):
+        return self.real >= getattr(other, "real", other)
+
+    def __hash__(self):
+        return hash(self.real)
+
+
+class HyperDual(object):
+    """
+    The hyper-dual number `real + e1 * E1 + e2 * E2 + e12 * E1 * E2`, where
+    `E1 * E1 = E2 * E2 = 0`.
+
+    `f(HyperDual(x, 1, 1, 0))` has `f'(x)` in `e1` and `e2` and `f''(x)` in `e12`. Like
+    `Dual`, it is compared by its real part and it can't be converted to `float`.
+
+    """
+
+    __slots__ = ("real", "e1", "e2", "e12")
+
+    def __init__(self, real, e1=0.0, e2=0.0, e12=0.0):
+        self.real = real
+        self.e1 = e1
+        self.e2 = e2
+        self.e12 = e12
+
+    def _chain(self, g0, g1, g2):
+        return HyperDual(g0, g1 * self.e1, g1 * self.e2, g1 * self.e12 + g2 * self.e1 * self.e2)
+
+    def __repr__(self):
+        return "HyperDual(%r, %r, %r, %r)" % (self.real, self.e1, self.e2, self.e12)
+
+    def __add__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.real + other.real, self.e1 + other.e1, self.e2 + other.e2, self.e12 + other.e12)
+        if isinstance(other, numbers.Real):
+            return HyperDual(self.real + other, self.e1, self.e2, self.e12)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.real - other.real, self.e1 - other.e1, self.e2 - other.e2, self.e12 - other.e12)
+        if isinstance(other, numbers.Real):
+            return HyperDual(self.real - other, self.e1, self.e2, self.e12)
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, numbers.Real):
+            return HyperDual(other - self.real, -self.e1, -self.e2, -self.e12)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(
+                self.real * other.real,
+                self.real * other.e1 + self.e1 * other.real,
+                self.real * other.e2 + self.e2 * other.real,
+                self.real * other.e12 + self.e1 * other.e2 + self.e2 * other.e1 + self.e12 * other.real,
+            )
+        if isinstance(other, numbers.Real):
+            return HyperDual(self.real * other, self.e1 * other, self.e2 * other, self.e12 * other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, HyperDual):
+            quotient = self * _reciprocal(other)
+            quotient.real = self.real / other.real     # same rounding as for floats
+            return quotient
+        if isinstance(other, numbers.Real):
+            return HyperDual(self.real / other, self.e1 / other, self.e2 / other, self.e12 / other)
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        if isinstance(other, numbers.Real):
+            quotient = _reciprocal(self) * other
+            quotient.real = other / self.real
+            return quotient
+        return NotImplemented
+
+    __div__, __rdiv__ = __truediv__, __rtruediv__
+
+    def __pow__(self, other):
+        return _power(self, other)
+
+    def __rpow__(self, other):
+        if isinstance(other, numbers.Real):
+            return _power(other, self)
+        return NotImplemented
+
+    def __neg__(self):
+        return HyperDual(-self.real, -self.e1, -self.e2, -self.e12)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.real < 0 else self
+
+    __eq__ = Dual.__eq__
+    __ne__ = Dual.__ne__
+    __lt__ = Dual.__lt__
+    __le__ = Dual.__le__
+    __gt__ = Dual.__gt__
+    __ge__ = Dual.__ge__
+    __hash__ = Dual.__hash__
+
+
+DUALS = (Dual, HyperDual)
+
+
+def _reciprocal(x):
+    r = 1 / x.real
+    return x._chain(r, -r * r, 2 * r * r * r)
+
+
+def _power(x, n):
+    """ Return `x ** n`, where either `x` or `n` (or both) is a dual number. """
+    if isinstance(n, numbers.Real):
+        if n == 0:
+            return x._chain(1.0, 0.0, 0.0)
+        a = x.real
+        if n == 1:
+            return x._chain(a, 1.0, 0.0)
+        return x._chain(a ** n, n * a ** (n - 1), n * (n - 1) * a ** (n - 2))
+    if not isinstance(n, DUALS):
+        return NotImplemented
+    if isinstance(x, numbers.Real):
+        # x ** n == exp(n * log(x))
+        value = x ** n.real
+        log = math.log(x)
+        return n._chain(value, value * log, value * log * log)
+    log = x._chain(math.log(x.real), 1 / x.real, -1 / (x.real * x.real))
+    value = math.exp(log.real * n.real)
+    return (log * n)._chain(value, value, value)
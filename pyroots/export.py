@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/export.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Export of the solves (and optionally of their iterations) for offline analysis.
+
+`TraceExporter` is a hook that writes an event for each solve, in the Trace Event format of
+Chrome (which can be loaded in `chrome://tracing`, Perfetto and other trace viewers) or as
+JSON lines. The iteration events have the bracket, the values of `f` on it and the kind of
+the step (e.g. "interpolate", "extrapolate" or "bisect" for Brent's method, see
+`Hook.on_step`). The events are buffered and written in bulk.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import io
+import os
+import json
+import threading
+import contextvars
+from time import perf_counter_ns
+
+from .hooks import Hook
+from .utils import CONDITIONS
+
+FORMATS = ("chrome", "jsonl")
+
+
+class _Solve(object):
+    """ The state of a solve, from `on_start` to `on_finish`.  """
+
+    __slots__ = ("start", "last", "xa", "xb", "step", "events")
+
+    def __init__(self, start, xa, xb):
+        self.start = self.last = start
+        self.xa = xa
+        self.xb = xb
+        self.step = None
+        self.events = []
+
+
+def _number(value):
+    return None if value is None else float(value)
+
+
+class TraceExporter(Hook):
+    """
+    Write the solves of the solvers to `file`.
+
+    Parameters
+    ----------
+    :param file:
+        A path or a text file object. A path is opened (and truncated) here and it is closed
+        by `close()`; a file object is only flushed.
+    :param str format:
+        "chrome" for the Trace Event format of Chrome, i.e. a JSON array of complete ("X")
+        events, or "jsonl" for a JSON object per line.
+    :param bool iterations:
+        If `True`, an event is written for each iteration too. This is much more expensive
+        than writing the solves only.
+    :param int buffer_size:
+        The number of events that are buffered before they are written.
+
+    The timestamps are in microseconds since the creation of the exporter. The iterations of
+    the batch solvers are not exported, only a summary of each batch solve. Call `close()`
+    (or use the exporter as a context manager) to write the buffered events.
+
+    An exporter can be pickled, e.g. for `solve_many()`. The copies don't write to the file;
+    they keep their events, which `solve_many()` sends back to the exporter of the parent
+    process.
+
+    """
+
+    def __init__(self, file, format="chrome", iterations=False, buffer_size=1000):
+        if format not in FORMATS:
+            raise ValueError("Unknown format %r; it must be one of: %s" % (format, ", ".join(FORMATS)))
+        if isinstance(file, (str, bytes, os.PathLike)):
+            self._file, self._owned = io.open(file, "w"), True
+        else:
+            self._file, self._owned = file, False
+        self.format = format
+        self.iterations = iterations
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._lock = threading.Lock()
+        # The state of the solve in progress. A context variable, rather than a thread-local,
+        # keeps apart the concurrent `solve_async()` solves of an event loop too.
+        self._solve = contextvars.ContextVar("pyroots_trace_exporter_solve", default=None)
+        self._origin = perf_counter_ns()
+        self._pid = os.getpid()
+        self._first = True
+        self._closed = False
+        if not iterations:
+            # Don't let the solvers dispatch the events that aren't needed.
+            self.on_step = None
+            self.on_iteration = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_file"], state["_lock"], state["_solve"], state["_buffer"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._file, self._owned = None, False
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._solve = contextvars.ContextVar("pyroots_trace_exporter_solve", default=None)
+        self._pid = os.getpid()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _now(self):
+        return (perf_counter_ns() - self._origin) / 1e3
+
+    def on_start(self, solver, xa, xb):
+        self._solve.set(_Solve(self._now(), xa, xb))
+
+    def on_step(self, solver, i, step):
+        solve = self._solve.get()
+        if solve is not None:
+            solve.step = step
+
+    def on_iteration(self, solver, i, fcalls, xa, xb, fa, fb):
+        solve = self._solve.get()
+        if solve is None or not hasattr(fa, "__float__"):
+            return      # e.g. the arrays of a batch solver
+        now = self._now()
+        name = solve.step or ("iteration" if i else "bounds")
+        solve.step = None
+        solve.events.append({
+            "name": name, "cat": "iteration", "ts": solve.last, "dur": now - solve.last,
+            "args": {"i": i, "fcalls": fcalls, "xa": _number(xa), "xb": _number(xb), "fa": _number(fa), "fb": _number(fb)},
+        })
+        solve.last = now
+
+    def on_finish(self, solver, result):
+        now = self._now()
+        solve = self._solve.get()
+        if solve is None:
+            solve = _Solve(now, None, None)
+        self._solve.set(None)
+        status = result.status
+        if hasattr(status, "tolist"):
+            # a `BatchResult`
+            args = {
+                "problems": len(result),
+                "converged": int(result.converged.sum()),
+                "iterations": int(result.iterations.sum()),
+                "func_calls": int(result.func_calls.sum()),
+            }
+        else:
+            args = {
+                "xa": _number(solve.xa),
+                "xb": _number(solve.xb),
+                "x0": _number(result.x0),
+                "fx0": _number(result.fx0),
+                "iterations": result.iterations,
+                "func_calls": result.func_calls,
+                "condition": CONDITIONS[status],
+            }
+        event = {"name": solver.solver_name, "cat": "solve", "ts": solve.start, "dur": now - solve.start, "args": args}
+        self._write([event] + solve.events)
+
+    on_fail = on_finish
+
+    def _write(self, events):
+        tid = threading.get_ident()
+        if self.format == "chrome":
+            for event in events:
+                event.update(ph="X", pid=self._pid, tid=tid)
+        else:
+            events = [
+                dict(event.pop("args"), type=event["cat"], name=event["name"], ts=event["ts"], dur=event["dur"], tid=tid)
+                for event in events
+            ]
+        # The events of a solve are kept together, even if other threads are writing too.
+        with self._lock:
+            self._buffer.extend(events)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def _drain(self):
+        """ Return the buffered events and clear the buffer, e.g. in a worker of `solve_many()`. """
+        with self._lock:
+            events, self._buffer = self._buffer, []
+        return events
+
+    def _absorb(self, events):
+        """ Add the events of `_drain()` (e.g. of another process) to the buffer. """
+        with self._lock:
+            self._buffer.extend(events)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """ Write the buffered events. """
+        with self._lock:
+            if self._file is None:
+                return      # a copy keeps its events
+            events, self._buffer = self._buffer, []
+            if not events:
+                return
+            lines = [json.dumps(event) for event in events]
+            if self.format == "chrome":
+                # The array is closed by `close()`; the trace viewers accept it unclosed too.
+                text = ("[\n" if self._first else ",\n") + ",\n".join(lines)
+            else:
+                text = "\n".join(lines) + "\n"
+            self._first = False
+            self._file.write(text)
+            self._file.flush()
+
+    def close(self):
+        """ Write the buffered events and close the file if it was opened by the exporter. """
+        self.flush()
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._file is None:
+                return
+            if self.format == "chrome":
+                self._file.write("[]\n" if self._first else "\n]\n")
+                self._first = False
+            if self._owned:
+                self._file.close()
+            else:
+                self._file.flush()
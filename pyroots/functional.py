@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/functional.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Functions with the signatures of the bracketing root finders of `scipy.optimize`.
+
+`bisect()`, `ridder()`, `brentq()` and `brenth()` can replace their namesakes of
+`scipy.optimize`: they take the same arguments, they stop on the same criterion (the
+bracket is smaller than `xtol + rtol * abs(x)`, there is no tolerance on `f(x)`) and they
+return the root, or the root and a `RootResults` if `full_output` is `True`. They take the
+steps of scipy's implementations, so the roots and the numbers of function calls match.
+
+These functions don't create a solver, they don't keep a history, dispatch hooks or log,
+and they call `f(x)` directly when there are no `args`. They are meant for hot loops where
+the overhead of the solver objects matters. Contrary to scipy, a failure to converge raises
+a `ConvergenceError`, which is a `RuntimeError` though.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from math import sqrt
+
+from .utils import EPS, ConvergenceError
+
+XTOL = 2e-12
+RTOL = 4 * EPS
+MAXITER = 100
+
+CONVERGED = "converged"
+SIGNERR = "sign error"
+CONVERR = "convergence error"
+
+
+class RootResults(object):
+    """
+    The result of a root finder, as `scipy.optimize.RootResults`.
+
+    :param float root: the root.
+    :param int iterations: the number of iterations.
+    :param int function_calls: the number of calls of `f`.
+    :param str flag: "converged" or "convergence error".
+    :param str method: the name of the root finder.
+
+    """
+
+    __slots__ = ("root", "iterations", "function_calls", "converged", "flag", "method")
+
+    def __init__(self, root, iterations, function_calls, flag, method):
+        self.root = root
+        self.iterations = iterations
+        self.function_calls = function_calls
+        self.converged = flag == CONVERGED
+        self.flag = flag
+        self.method = method
+
+    def __repr__(self):
+        return "\n".join("%14s: %r" % (name, getattr(self, name)) for name in self.__slots__)
+
+
+def _prepare(f, args, xtol, rtol, maxiter):
+    if xtol <= 0:
+        raise ValueError("xtol too small (%g <= 0)" % xtol)
+    if rtol < RTOL:
+        raise ValueError("rtol too small (%g < %g)" % (rtol, RTOL))
+    if maxiter < 0:
+        raise ValueError("maxiter must be >= 0")
+    if not isinstance(args, tuple):
+        args = (args,)
+    if args:
+        return lambda x: f(x, *args)
+    return f
+
+
+def _results(outcome, full_output, disp, method):
+    root, iterations, function_calls, flag = outcome
+    if flag == SIGNERR:
+        raise ValueError("f(a) and f(b) must have different signs")
+    if disp and flag == CONVERR:
+        raise ConvergenceError("Failed to converge after %d iterations, value is %s" % (iterations, root))
+    if full_output:
+        return root, RootResults(root, iterations, function_calls, flag, method)
+    return root
+
+
+def _bisect(f, xa, xb, xtol, rtol, maxiter):
+    fa = f(xa)
+    fb = f(xb)
+    if fa * fb > 0.0:
+        return 0.0, 0, 2, SIGNERR
+    if fa == 0.0:
+        return xa, 1, 2, CONVERGED
+    if fb == 0.0:
+        return xb, 1, 2, CONVERGED
+    dm = xb - xa
+    for i in range(1, maxiter + 1):
+        dm *= 0.5
+        xm = xa + dm
+        fm = f(xm)
+        if fm * fa >= 0.0:
+            xa = xm
+        if fm == 0.0 or abs(dm) < xtol + rtol * abs(xm):
+            return xm, i, i + 2, CONVERGED
+    return xa, maxiter, maxiter + 2, CONVERR
+
+
+def _ridder(f, xa, xb, xtol, rtol, maxiter):
+    tol = xtol + rtol * min(abs(xa), abs(xb))
+    fa = f(xa)
+    fb = f(xb)
+    if fa * fb > 0.0:
+        return 0.0, 0, 2, SIGNERR
+    if fa == 0.0:
+        return xa, 1, 2, CONVERGED
+    if fb == 0.0:
+        return xb, 1, 2, CONVERGED
+    xn = 0.0
+    for i in range(1, maxiter + 1):
+        dm = 0.5 * (xb - xa)
+        xm = xa + dm
+        fm = f(xm)
+        dn = (1.0 if fb > fa else -1.0) * dm * fm / sqrt(fm * fm - fa * fb)
+        step = min(abs(dn), abs(dm) - 0.5 * tol)
+        xn = xm - step if dn > 0.0 else xm + step
+        fn = f(xn)
+        if (fn < 0.0) != (fm < 0.0):
+            xa, fa, xb, fb = xn, fn, xm, fm
+        elif (fn < 0.0) != (fa < 0.0):
+            xb, fb = xn, fn
+        else:
+            xa, fa = xn, fn
+        tol = xtol + rtol * xn
+        if fn == 0.0 or abs(xb - xa) < tol:
+            return xn, i, 2 * i + 2, CONVERGED
+    return xn, maxiter, 2 * maxiter + 2, CONVERR
+
+
+def _brent(f, xa, xb, xtol, rtol, maxiter, hyperbolic):
+    # The same iterations as `pyroots.brent._Brent`, with the tolerance of scipy.
+    xpre, xcur = xa, xb
+    xblk, fblk, spre, scur = 0.0, 0.0, 0.0, 0.0
+    fpre = f(xpre)
+    fcur = f(xcur)
+    if fpre == 0.0:
+        return xpre, 1, 2, CONVERGED
+    if fcur == 0.0:
+        return xcur, 1, 2, CONVERGED
+    if fpre * fcur > 0.0:
+        return 0.0, 0, 2, SIGNERR
+    for i in range(1, maxiter + 1):
+        if fpre * fcur < 0.0:
+            xblk = xpre
+            fblk = fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+
+        delta = (xtol + rtol * abs(xcur)) / 2
+        sbis = (xblk - xcur) / 2
+        if fcur == 0.0 or abs(sbis) < delta:
+            return xcur, i, i + 1, CONVERGED
+
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # interpolate
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # extrapolate
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                if hyperbolic:
+                    stry = -fcur * (fblk - fpre) / (fblk * dpre - fpre * dblk)
+                else:
+                    stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+                spre = scur
+                scur = stry
+            else:
+                spre = scur = sbis
+        else:
+            spre = scur = sbis
+
+        xpre = xcur
+        fpre = fcur
+        if abs(scur) > delta:
+            xcur += scur
+        else:
+            xcur += delta if sbis > 0 else -delta
+        fcur = f(xcur)
+    return xcur, maxiter, maxiter + 2, CONVERR
+
+
+def bisect(f, a, b, args=(), xtol=XTOL, rtol=RTOL, maxiter=MAXITER, full_output=False, disp=True):
+    """
+    Find a root of `f` in `[a, b]` using the Bisection Method.
+
+    :param f: the function; it is called as `f(x, *args)`.
+    :param float a: the lower bound of the bracket.
+    :param float b: the upper bound of the bracket.
+    :param tuple args: the extra arguments of `f`.
+    :param float xtol: the absolute tolerance of the root.
+    :param float rtol: the relative tolerance of the root; at least `4 * EPS`.
+    :param int maxiter: the maximum number of iterations.
+    :param bool full_output: if `True`, return `(x0, RootResults)` instead of `x0`.
+    :param bool disp: if `True`, raise a `ConvergenceError` if the solver doesn't converge.
+
+    A `ValueError` is raised if `f(a)` and `f(b)` have the same sign.
+
+    """
+    f = _prepare(f, args, xtol, rtol, maxiter)
+    return _results(_bisect(f, float(a), float(b), xtol, rtol, maxiter), full_output, disp, "bisect")
+
+
+def ridder(f, a, b, args=(), xtol=XTOL, rtol=RTOL, maxiter=MAXITER, full_output=False, disp=True):
+    """
+    Find a root of `f` in `[a, b]` using Ridder's Method.
+
+    The parameters are the same as those of `bisect()`.
+
+    """
+    f = _prepare(f, args, xtol, rtol, maxiter)
+    return _results(_ridder(f, float(a), float(b), xtol, rtol, maxiter), full_output, disp, "ridder")
+
+
+def brentq(f, a, b, args=(), xtol=XTOL, rtol=RTOL, maxiter=MAXITER, full_output=False, disp=True):
+    """
+    Find a root of `f` in `[a, b]` using Brent's Method with inverse quadratic extrapolation.
+
+    The parameters are the same as those of `bisect()`.
+
+    """
+    f = _prepare(f, args, xtol, rtol, maxiter)
+    return _results(_brent(f, float(a), float(b), xtol, rtol, maxiter, False), full_output, disp, "brentq")
+
+
+def brenth(f, a, b, args=(), xtol=XTOL, rtol=RTOL, maxiter=MAXITER, full_output=False, disp=True):
+    """
+    Find a root of `f` in `[a, b]` using Brent's Method with hyperbolic extrapolation.
+
+    The parameters are the same as those of `bisect()`.
+
+    """
+    f = _prepare(f, args, xtol, rtol, maxiter)
+    return _results(_brent(f, float(a), float(b), xtol, rtol, maxiter, True), full_output, disp, "brenth")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/hooks.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Hooks for instrumenting the solvers.
+
+A hook is an object with (some of) the `on_start`, `on_iteration`, `on_finish` and `on_fail`
+methods; the easiest way to write one is to subclass `Hook` and override the events you are
+interested in. Hooks are passed to the solvers with the `hooks` argument. The solvers only
+dispatch the events that at least one hook overrides, so when there are no hooks there is no
+overhead at all.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+EVENTS = ("on_start", "on_step", "on_iteration", "on_finish", "on_fail")
+
+
+class Hook(object):
+    """ A hook that does nothing. Override the events you need.  """
+
+    # `False` if the `on_iteration` events of concurrent solves shouldn't be interleaved;
+    # `solve_many_threaded()` doesn't dispatch them to such hooks.
+    concurrent_iterations = True
+
+    def on_start(self, solver, xa, xb):
+        """ Called when a solve starts. """
+
+    def on_step(self, solver, i, step):
+        """
+        Called before the evaluation of iteration `i` with the kind of its step, e.g.
+        "interpolate", "extrapolate" or "bisect". Only the solvers that choose between different
+        kinds of steps (`Brentq`, `Brenth`, `Chandrupatla`, `RegulaFalsi` and the Newton
+        solvers) dispatch it.
+        """
+
+    def on_iteration(self, solver, i, fcalls, xa, xb, fa, fb):
+        """ Called on each iteration with the current bracket and the number of function calls. """
+
+    def on_finish(self, solver, result):
+        """ Called when a solve converges. """
+
+    def on_fail(self, solver, result):
+        """ Called when a solve fails, before `ConvergenceError` is raised. """
+
+
+class LoggingHook(Hook):
+    """ Log the iterations (level DEBUG) and the results (level INFO) to the solver's logger. """
+
+    # The log lines of the iterations of different solves can't be told apart.
+    concurrent_iterations = False
+
+    def on_iteration(self, solver, i, fcalls, xa, xb, fa, fb):
+        solver.logger.debug(solver.log_msg, i, fcalls, xa, xb, xb - xa, fa, fb)
+
+    def on_finish(self, solver, result):
+        solver.logger.info("Solution converged: %r", result)
+
+    def on_fail(self, solver, result):
+        solver.logger.info("Solution did not converge: %r", result)
+
+
+def _fan_out(callbacks):
+    def dispatch(*args):
+        for callback in callbacks:
+            callback(*args)
+    return dispatch
+
+
+def dispatcher(hooks, event):
+    """
+    Return a callable that dispatches `event` to `hooks`, or `None` if no hook handles it.
+
+    The hooks that don't override the method of `Hook` are skipped.
+
+    """
+    callbacks = []
+    for hook in hooks:
+        callback = getattr(hook, event, None)
+        if callback is None or getattr(type(hook), event, None) is getattr(Hook, event):
+            continue
+        callbacks.append(callback)
+    if not callbacks:
+        return None
+    if len(callbacks) == 1:
+        return callbacks[0]
+    return _fan_out(callbacks)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/itp.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+The ITP (Interpolate, Truncate, Project) method for root finding.
+
+I. F. D. Oliveira and R. H. C. Takahashi, "An Enhancement of the Bisection Method Average
+Performance Preserving Minmax Optimality", ACM Transactions on Mathematical Software,
+47(1), 1-24 (2020).
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from math import ceil, copysign, log
+
+from .utils import EPS, nearly_equal
+from .base import BaseSolver
+
+
+# The golden ratio. `k2` must be smaller than `1 + PHI`.
+PHI = (1 + 5 ** 0.5) / 2
+
+
+class ITP(BaseSolver):
+    """
+    Defines a Solver for the equation `f(x) = 0` in the interval `[xa, xb]` using the ITP
+    method.
+
+    Each step interpolates with regula falsi, truncates the interpolation towards the
+    midpoint and projects it into an interval around the midpoint that shrinks as fast as
+    bisection would. So the method never takes more than `n0` iterations more than
+    bisection, while it converges superlinearly on well behaved functions.
+
+    Function `f` must be solvable in `[xa, xb]`. Also `f(xa)` and `f(xb)` must
+    have different signs.
+
+    """
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), k1=None, k2=2.0, n0=1, profile=0.0):
+        """
+        Parameters
+        ----------
+        :param float k1:
+            The scale of the truncation, i.e. the truncation is `k1 * (xb - xa) ** k2`. It
+            defaults to `0.2 / (xb - xa)` of the initial bracket.
+        :param float k2:
+            The order of the truncation. It must be in `[1, 1 + PHI)`.
+        :param int n0:
+            The number of iterations that the method may take in addition to the ones of
+            bisection.
+
+        The rest of the parameters are the same as the ones of the other solvers.
+
+        """
+        if k1 is not None and not k1 > 0:
+            raise ArithmeticError("k1 must be positive, not: %r" % k1)
+        if not 1 <= k2 < 1 + PHI:
+            raise ArithmeticError("k2 must be in [1, 1 + PHI), not: %r" % k2)
+        if (not isinstance(n0, int)) or n0 < 0:
+            raise ArithmeticError("n0 must be a non negative integer, not: %r <%r>" % (n0, type(n0)))
+        self.k1 = k1
+        self.k2 = k2
+        self.n0 = n0
+        super(ITP, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
+            solver_name="ITP"
+        )
+
+    def _iterate(self, xa, xb, fa, fb):
+        """ ITP implementation.  """
+        # local names
+        xtol = self.xtol
+        on_iteration = self._on_iteration
+        is_root = self.is_root
+
+        # initialize counters
+        i = 0
+        fcalls = 0
+
+        #check that the bracket's interval is sufficiently big.
+        if nearly_equal(xa, xb, xtol):
+            return None, None, i, fcalls, False, "small bracket"
+
+        # check lower bound
+        if fa is None:
+            fa = yield xa           # First function call
+            fcalls += 1
+        if is_root(fa):
+            return xa, fa, i, fcalls, True, "lower bracket"
+
+        # check upper bound
+        if fb is None:
+            fb = yield xb           # Second function call
+            fcalls += 1
+        if on_iteration is not None:
+            on_iteration(self, i, fcalls, xa, xb, fa, fb)
+        if is_root(fb):
+            return xb, fb, i, fcalls, True, "upper bracket"
+
+        # check if the root is bracketed.
+        if fa * fb > 0.0:
+            return None, None, i, fcalls, False, "no bracket"
+
+        a, b = xa, xb
+        if a > b:
+            a, b, fa, fb = b, a, fb, fa
+        k1 = 0.2 / (b - a) if self.k1 is None else self.k1
+        k2 = self.k2
+        # The bracket is solved once its half-width gets smaller than `tol`; bisection would
+        # need `n_half` iterations for that.
+        tol = xtol * max(1.0, abs(a), abs(b))
+        n_half = max(0, int(ceil(log((b - a) / (2 * tol), 2))))
+        n_max = n_half + self.n0
+
+        x, fx = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+        for i in range(1, self.max_iter + 1):
+            if b - a <= 2 * tol:
+                return x, fx, i - 1, fcalls, False, "small bracket"
+
+            # interpolate
+            xhalf = 0.5 * (a + b)
+            xf = (fb * a - fa * b) / (fb - fa)
+
+            # truncate
+            sigma = copysign(1.0, xhalf - xf)
+            delta = k1 * (b - a) ** k2
+            xt = xf + sigma * delta if delta <= abs(xhalf - xf) else xhalf
+
+            # project
+            r = tol * 2.0 ** (n_max - i + 1) - 0.5 * (b - a)
+            x = xt if abs(xt - xhalf) <= r else xhalf - sigma * r
+            if not a < x < b:
+                x = xhalf
+
+            fx = yield x
+            fcalls += 1
+            if copysign(1, fx) == copysign(1, fa):
+                a, fa = x, fx
+            else:
+                b, fb = x, fx
+            if on_iteration is not None:
+                on_iteration(self, i, fcalls, a, b, fa, fb)
+
+            # check for convergence.
+            if is_root(fx):
+                return x, fx, i, fcalls, True, "convergence"
+
+        return x, fx, i, fcalls, False, "iterations"
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/kernels.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Solver kernels: the algorithms of `Bisect`, `Ridder`, `Brentq` and `Brenth` as plain functions.
+
+The kernels take a function of a single scalar and they return a tuple
+`(x0, fx0, iterations, func_calls, status)`, where `status` is an index into
+`pyroots.utils.CONDITIONS`. When there is no root to report (e.g. the root is not
+bracketed), `x0` and `fx0` are `nan`. The kernels don't keep a history, they don't
+dispatch hooks and they don't log or raise on failure; they take exactly the same steps
+as the solver objects though.
+
+The kernels only use what `numba` can compile in nopython mode. If `numba` is installed,
+they can be called from `numba.njit` functions, i.e. they are compiled together with a
+jitted `f` and the whole solve runs in machine code::
+
+    import numba
+    from pyroots import kernels
+
+    @numba.njit
+    def f(x):
+        return x ** 3 - x ** 2 - 3 * x + 2
+
+    @numba.njit
+    def solve(a, b):
+        return kernels.brentq(f, a, b)
+
+`jit()` compiles a kernel on its own, e.g. `kernels.jit(kernels.brentq)(f, a, b)`.
+Without `numba` the kernels are plain Python functions.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from math import copysign, sqrt
+
+try:
+    import numba
+    from numba.extending import register_jitable
+except ImportError:         # pragma: no cover
+    numba = None
+    register_jitable = lambda function: function
+
+from .utils import EPS
+from .utils import CONVERGENCE, LOWER_BRACKET, UPPER_BRACKET, SMALL_BRACKET, NO_BRACKET, ITERATIONS, STAGNANT
+
+NAN = float("nan")
+
+
+def jit(kernel):
+    """
+    Return `kernel` compiled with `numba.njit`.
+
+    :param kernel: one of the kernels of this module.
+
+    """
+    if numba is None:
+        raise ImportError("Compiling the kernels requires numba.")
+    return numba.njit(kernel)
+
+
+@register_jitable
+def _nearly_equal(a, b, epsilon):
+    """ `pyroots.utils.nearly_equal()` for the kernels. """
+    if a == b:
+        return True
+    diff = abs(a - b)
+    max_ab = max(abs(a), abs(b), 1.0)
+    if max_ab >= diff or max_ab > 1.0:
+        return diff <= epsilon
+    else:
+        return diff < epsilon * max_ab
+
+
+@register_jitable
+def bisect(f, xa, xb, epsilon=1e-6, xtol=EPS, max_iter=500):
+    """
+    Find a root of `f` in `[xa, xb]` using the Bisection Method.
+
+    :param f: the function; it is called with a single float.
+    :param float xa: the lower bound of the bracket.
+    :param float xb: the upper bound of the bracket.
+    :param float epsilon: the tolerance of `f(x0)`, as in `Bisect`.
+    :param float xtol: the tolerance of the bracket, as in `Bisect`.
+    :param int max_iter: the maximum number of iterations.
+
+    """
+    if _nearly_equal(xa, xb, xtol):
+        return NAN, NAN, 0, 0, SMALL_BRACKET
+
+    fa = f(xa)
+    if _nearly_equal(0.0, fa, epsilon):
+        return xa, fa, 0, 1, LOWER_BRACKET
+    fb = f(xb)
+    if _nearly_equal(0.0, fb, epsilon):
+        return xb, fb, 0, 2, UPPER_BRACKET
+    if fa * fb > 0.0:
+        return NAN, NAN, 0, 2, NO_BRACKET
+
+    fcalls = 2
+    xm, fm = xb, fb
+    i = 0
+    for i in range(1, max_iter + 1):
+        xm = 0.5 * (xa + xb)
+        fm = f(xm)
+        fcalls += 1
+        if copysign(1.0, fm) == copysign(1.0, fa):
+            xa, fa = xm, fm
+        else:
+            xb, fb = xm, fm
+        if _nearly_equal(0.0, fm, epsilon):
+            return xm, fm, i, fcalls, CONVERGENCE
+        if _nearly_equal(xa, xb, xtol):
+            return xm, fm, i, fcalls, SMALL_BRACKET
+    return xm, fm, i, fcalls, ITERATIONS
+
+
+@register_jitable
+def ridder(f, xa, xb, epsilon=1e-6, xtol=EPS, max_iter=500):
+    """
+    Find a root of `f` in `[xa, xb]` using Ridder's Method.
+
+    The parameters are the same as those of `bisect()`.
+
+    """
+    if _nearly_equal(xa, xb, xtol):
+        return NAN, NAN, 0, 0, SMALL_BRACKET
+
+    fa = f(xa)
+    if _nearly_equal(0.0, fa, epsilon):
+        return xa, fa, 0, 1, LOWER_BRACKET
+    fb = f(xb)
+    if _nearly_equal(0.0, fb, epsilon):
+        return xb, fb, 0, 2, UPPER_BRACKET
+    if fa * fb > 0.0:
+        return NAN, NAN, 0, 2, NO_BRACKET
+
+    fcalls = 2
+    xm, fm = xb, fb
+    xm_old = xs_old = NAN
+    i = 0
+    for i in range(1, max_iter + 1):
+        xm = 0.5 * (xa + xb)
+        fm = f(xm)
+        fcalls += 1
+        if _nearly_equal(0.0, fm, epsilon):
+            return xm, fm, i, fcalls, CONVERGENCE
+
+        t = sqrt(fm ** 2 - fa * fb)
+        sign = -1.0 if fa < fb else 1.0
+        xs = xm + (xm - xa) * sign * fm / t
+        fs = f(xs)
+        fcalls += 1
+        if _nearly_equal(0.0, fs, epsilon):
+            return xs, fs, i, fcalls, CONVERGENCE
+        if i > 1 and abs(xs - xs_old) < xtol and abs(xm - xm_old) < xtol:
+            return xs, fs, i, fcalls, STAGNANT
+
+        # Re-bracket the root as tightly as possible
+        if fm * fs > 0.0:
+            if fa * fs < 0.0:
+                xb, fb = xs, fs
+            else:
+                xa, fa = xs, fs
+        else:
+            xa, fa = xm, fm
+            xb, fb = xs, fs
+        if xa > xb:
+            xa, xb = xb, xa
+            fa, fb = fb, fa
+
+        if _nearly_equal(xa, xb, xtol):
+            return xs, fs, i, fcalls, SMALL_BRACKET
+        xm_old = xm
+        xs_old = xs
+    return xm, fm, i, fcalls, ITERATIONS
+
+
+@register_jitable
+def _brent(f, xa, xb, epsilon, xtol, max_iter, hyperbolic):
+    """ The kernel of `brentq()` and `brenth()`. """
+    xpre, xcur = xa, xb
+    xblk, fblk, spre, scur = 0.0, 0.0, 0.0, 0.0
+
+    if _nearly_equal(xa, xb, xtol):
+        return NAN, NAN, 0, 0, SMALL_BRACKET
+
+    fpre = f(xpre)
+    if _nearly_equal(0.0, fpre, epsilon):
+        return xpre, fpre, 0, 1, LOWER_BRACKET
+    fcur = f(xcur)
+    if _nearly_equal(0.0, fcur, epsilon):
+        return xcur, fcur, 0, 2, UPPER_BRACKET
+    if fpre * fcur > 0.0:
+        return NAN, NAN, 0, 2, NO_BRACKET
+
+    fcalls = 2
+    i = 0
+    for i in range(max_iter):
+        if fpre * fcur < 0:
+            xblk = xpre
+            fblk = fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre = xcur
+            xcur = xblk
+            xblk = xpre
+            fpre = fcur
+            fcur = fblk
+            fblk = fpre
+
+        sbis = (xblk - xcur) / 2
+        if abs(sbis) < xtol:
+            return xcur, fcur, i + 1, fcalls, SMALL_BRACKET
+
+        if abs(spre) > xtol and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # interpolate
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # extrapolate
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                if hyperbolic:
+                    stry = -fcur * (fblk - fpre) / (fblk * dpre - fpre * dblk)
+                else:
+                    stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - xtol):
+                spre = scur
+                scur = stry
+            else:
+                spre = sbis
+                scur = sbis
+        else:
+            spre = sbis
+            scur = sbis
+
+        xpre = xcur
+        fpre = fcur
+        if abs(scur) > xtol:
+            xcur += scur
+        else:
+            xcur += xtol if sbis > 0 else -xtol
+
+        fcur = f(xcur)
+        fcalls += 1
+        if _nearly_equal(0.0, fcur, epsilon):
+            return xcur, fcur, i, fcalls, CONVERGENCE
+    return xcur, fcur, max_iter, fcalls, ITERATIONS
+
+
+@register_jitable
+def brentq(f, xa, xb, epsilon=1e-6, xtol=EPS, max_iter=500):
+    """
+    Find a root of `f` in `[xa, xb]` using Brent's Method with inverse quadratic extrapolation.
+
+    The parameters are the same as those of `bisect()`.
+
+    """
+    return _brent(f, xa, xb, epsilon, xtol, max_iter, False)
+
+
+@register_jitable
+def brenth(f, xa, xb, epsilon=1e-6, xtol=EPS, max_iter=500):
+    """
+    Find a root of `f` in `[xa, xb]` using Brent's Method with hyperbolic extrapolation.
+
+    The parameters are the same as those of `bisect()`.
+
+    """
+    return _brent(f, xa, xb, epsilon, xtol, max_iter, True)
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/metrics.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Process-wide metrics of the solves.
+
+`MetricsHook` records the condition, the iterations, the function calls and the latency of
+each solve in a `MetricsRegistry`, keyed by the `solver_name` of the solver. The registry can
+be exported in the Prometheus text format or as JSON, e.g. to spot solvers whose cost drifts
+in production::
+
+    from pyroots import Brentq
+    from pyroots.metrics import MetricsHook, REGISTRY
+
+    solver = Brentq(hooks=[MetricsHook()])
+    ...
+    print(REGISTRY.to_prometheus())
+
+The hot path doesn't take any locks: each thread updates its own shard of the metrics and
+the shards are merged when the registry is exported. The shards of the threads that have
+finished are folded into a single one, so short-lived threads don't accumulate.
+
+The solves of `solve_many()` run in other processes; their metrics are sent back with the
+results of each chunk and they are added to the registries of the parent process.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import json
+import threading
+import contextvars
+from bisect import bisect_left
+from time import perf_counter
+
+from .hooks import Hook
+from .utils import CONDITIONS
+
+# The upper bounds of the buckets of the histograms; there is always an extra `+Inf` bucket.
+COUNT_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30, 50, 100, 200, 500)
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0)
+
+# name: (type, help)
+METRICS = {
+    "pyroots_solves_total": ("counter", "The number of solves by condition."),
+    "pyroots_iterations": ("histogram", "The iterations of the solves."),
+    "pyroots_function_calls": ("histogram", "The function calls of the solves."),
+    "pyroots_solve_duration_seconds": ("histogram", "The wall time of the solves."),
+}
+
+
+class _Histogram(object):
+    """ A histogram with fixed buckets. The counts are per bucket, not cumulative. """
+
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.sum += other.sum
+
+    def snapshot(self):
+        return {"buckets": list(self.buckets), "counts": list(self.counts), "sum": self.sum, "count": sum(self.counts)}
+
+
+class _Shard(object):
+    """ The metrics of a solver that are updated by one thread. """
+
+    __slots__ = ("conditions", "iterations", "func_calls", "latency")
+
+    def __init__(self, count_buckets, latency_buckets):
+        self.conditions = dict.fromkeys(CONDITIONS, 0)
+        self.iterations = _Histogram(count_buckets)
+        self.func_calls = _Histogram(count_buckets)
+        self.latency = _Histogram(latency_buckets)
+
+    def merge(self, other):
+        for condition, count in other.conditions.items():
+            self.conditions[condition] += count
+        self.iterations.merge(other.iterations)
+        self.func_calls.merge(other.func_calls)
+        self.latency.merge(other.latency)
+
+
+class MetricsRegistry(object):
+    """
+    Counters and histograms of the solves, keyed by the `solver_name` of the solvers.
+
+    Parameters
+    ----------
+    :param tuple count_buckets:
+        The upper bounds of the buckets of the histograms of the iterations and of the
+        function calls.
+    :param tuple latency_buckets:
+        The upper bounds of the buckets of the histogram of the latency, in seconds.
+
+    """
+
+    def __init__(self, count_buckets=COUNT_BUCKETS, latency_buckets=LATENCY_BUCKETS):
+        self.count_buckets = tuple(sorted(count_buckets))
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # (solver_name, thread, shard) of the threads that may still record.
+        self._shards = []
+        # solver_name: shard with the metrics of the threads that have finished.
+        self._retired = {}
+
+    def __reduce__(self):
+        # The registry of the process stays the registry of the process when it is unpickled
+        # (e.g. in the workers of `solve_many()`); other registries are unpickled empty.
+        if self is REGISTRY:
+            return "REGISTRY"
+        return (MetricsRegistry, (self.count_buckets, self.latency_buckets))
+
+    def _retire(self):
+        """ Fold the shards of the finished threads into `_retired`; the lock must be held. """
+        live = []
+        for solver_name, thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((solver_name, thread, shard))
+            else:
+                self._aggregate(solver_name).merge(shard)
+        self._shards = live
+
+    def _aggregate(self, solver_name):
+        try:
+            return self._retired[solver_name]
+        except KeyError:
+            shard = self._retired[solver_name] = _Shard(self.count_buckets, self.latency_buckets)
+            return shard
+
+    def _shard(self, solver_name):
+        try:
+            shards = self._local.shards
+        except AttributeError:
+            shards = self._local.shards = {}
+        try:
+            return shards[solver_name]
+        except KeyError:
+            shard = shards[solver_name] = _Shard(self.count_buckets, self.latency_buckets)
+            # The lock is only taken the first time that a thread records a solver.
+            with self._lock:
+                self._retire()
+                self._shards.append((solver_name, threading.current_thread(), shard))
+            return shard
+
+    def record(self, solver_name, condition, iterations, func_calls, latency=None):
+        """ Record a solve; `condition` is a key of `BaseSolver.messages`. """
+        shard = self._shard(solver_name)
+        shard.conditions[condition] += 1
+        shard.iterations.observe(iterations)
+        shard.func_calls.observe(func_calls)
+        if latency is not None:
+            shard.latency.observe(latency)
+
+    def record_latency(self, solver_name, latency):
+        """ Record the latency of a solve, in seconds, without recording the solve. """
+        self._shard(solver_name).latency.observe(latency)
+
+    def _merged(self):
+        with self._lock:
+            self._retire()
+            shards = list(self._retired.items()) + [(solver_name, shard) for solver_name, _, shard in self._shards]
+        merged = {}
+        for solver_name, shard in shards:
+            if solver_name not in merged:
+                merged[solver_name] = _Shard(self.count_buckets, self.latency_buckets)
+            merged[solver_name].merge(shard)
+        return merged
+
+    def _drain(self):
+        """
+        Return the merged shards and reset the registry.
+
+        It is meant for the single threaded workers of `solve_many()`; the solves that other
+        threads record in the meantime may be lost.
+
+        """
+        merged = self._merged()
+        self.reset()
+        return merged
+
+    def _absorb(self, merged):
+        """ Add the merged shards of `_drain()` (e.g. of another process) to the registry. """
+        with self._lock:
+            for solver_name, shard in merged.items():
+                self._aggregate(solver_name).merge(shard)
+
+    def snapshot(self):
+        """ Return the metrics as a dict, keyed by the name of the solver. """
+        return dict(
+            (solver_name, {
+                "solves": sum(shard.conditions.values()),
+                "conditions": dict(shard.conditions),
+                "iterations": shard.iterations.snapshot(),
+                "func_calls": shard.func_calls.snapshot(),
+                "latency": shard.latency.snapshot(),
+            })
+            for solver_name, shard in self._merged().items()
+        )
+
+    def to_json(self, **kwargs):
+        """ Return the metrics as JSON. The keyword arguments are passed to `json.dumps()`. """
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self):
+        """ Return the metrics in the text format of Prometheus. """
+        merged = sorted(self._merged().items())
+        lines = []
+        for name, (kind, description) in METRICS.items():
+            lines.append("# HELP %s %s" % (name, description))
+            lines.append("# TYPE %s %s" % (name, kind))
+            for solver_name, shard in merged:
+                label = 'solver="%s"' % _escape(solver_name)
+                if kind == "counter":
+                    for condition, count in shard.conditions.items():
+                        lines.append('%s{%s,condition="%s"} %d' % (name, label, condition, count))
+                    continue
+                histogram = {
+                    "pyroots_iterations": shard.iterations,
+                    "pyroots_function_calls": shard.func_calls,
+                    "pyroots_solve_duration_seconds": shard.latency,
+                }[name]
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                    cumulative += count
+                    lines.append('%s_bucket{%s,le="%s"} %d' % (name, label, bound if bound == "+Inf" else "%g" % bound, cumulative))
+                lines.append("%s_sum{%s} %r" % (name, label, histogram.sum))
+                lines.append("%s_count{%s} %d" % (name, label, cumulative))
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """ Forget all the recorded solves. """
+        with self._lock:
+            self._retired = {}
+            for _, _, shard in self._shards:
+                fresh = _Shard(self.count_buckets, self.latency_buckets)
+                shard.conditions, shard.iterations, shard.func_calls, shard.latency = fresh.conditions, fresh.iterations, fresh.func_calls, fresh.latency
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# The registry of the process.
+REGISTRY = MetricsRegistry()
+
+
+class MetricsHook(Hook):
+    """
+    Record every solve of the solvers in `registry` (by default the registry of the process).
+
+    It works with the batch solvers too; each lane is recorded as a solve, while the latency
+    is recorded once per batch. The latency is measured from `on_start`, separately for each
+    thread and for each `solve_async()` task.
+
+    """
+
+    def __init__(self, registry=None):
+        self.registry = REGISTRY if registry is None else registry
+        # A context variable, rather than a thread-local, keeps apart the concurrent
+        # `solve_async()` solves of an event loop too.
+        self._start = contextvars.ContextVar("pyroots_metrics_hook_start", default=None)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_start"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._start = contextvars.ContextVar("pyroots_metrics_hook_start", default=None)
+
+    def on_start(self, solver, xa, xb):
+        self._start.set(perf_counter())
+
+    def on_finish(self, solver, result):
+        start = self._start.get()
+        latency = perf_counter() - start if start is not None else None
+        self._start.set(None)
+        record = self.registry.record
+        name = solver.solver_name
+        status = result.status
+        if hasattr(status, "tolist"):
+            # a `BatchResult`
+            for code, iterations, func_calls in zip(status.tolist(), result.iterations.tolist(), result.func_calls.tolist()):
+                record(name, CONDITIONS[code], iterations, func_calls)
+            if latency is not None:
+                self.registry.record_latency(name, latency)
+        else:
+            record(name, CONDITIONS[status], result.iterations, result.func_calls, latency)
+
+    on_fail = on_finish
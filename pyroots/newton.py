@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/newton.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Newton's and Halley's methods safeguarded by bisection (`rtsafe` of Numerical Recipes).
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from .utils import EPS, nearly_equal
+from .base import BaseSolver
+from .dual import Dual, HyperDual
+
+
+class _Newton(BaseSolver):
+
+    # The derivative of `f`, for the solvers that accept it.
+    fprime = None
+
+    # The kind of the steps that are not bisections, for the `on_step` hooks.
+    step_name = "newton"
+
+    def _seed(self, x):
+        """ Return the argument of `f` for `x`. """
+        return x
+
+    def _unpack(self, value):
+        """ Return the tuple of `f(x)` and of its derivatives from the value of `f`. """
+        fx, dfx = value
+        return fx, dfx
+
+    def _step(self, x, values):
+        """ Return the next estimate of the root, or `None` if there isn't one. """
+        fx, dfx = values
+        return x - fx / dfx if dfx != 0 else None
+
+    def _evaluator(self, f):
+        # `_iterate()` receives the tuple of `f(x)` and of its derivatives, so the time spent
+        # in `fprime` is profiled as time spent in `f`.
+        fprime, seed, unpack = self.fprime, self._seed, self._unpack
+        if fprime is None:
+            def evaluate(x, *args, **kwargs):
+                return unpack(f(seed(x), *args, **kwargs))
+        else:
+            def evaluate(x, *args, **kwargs):
+                return f(x, *args, **kwargs), fprime(x, *args, **kwargs)
+        return evaluate
+
+    def _evaluator_async(self, f):
+        # Same as `_evaluator()`, but `f` (and `fprime`, if it was given) are coroutine functions.
+        fprime, seed, unpack = self.fprime, self._seed, self._unpack
+        if fprime is None:
+            async def evaluate(x, *args, **kwargs):
+                return unpack(await f(seed(x), *args, **kwargs))
+        else:
+            async def evaluate(x, *args, **kwargs):
+                return await f(x, *args, **kwargs), await fprime(x, *args, **kwargs)
+        return evaluate
+
+    def _probe(self, f, x, args, kwargs, trace):
+        # The bracket searches don't need the derivative.
+        fx = f(x, *args, **kwargs) if self.fprime is not None else self._unpack(f(self._seed(x), *args, **kwargs))[0]
+        if trace is not None:
+            trace.append(x, fx)
+        return fx
+
+    def _loop(self, steps, f, args, kwargs, trace):
+        # Same as `BaseSolver._loop()`, but `f` is the evaluator, which returns `f(x)` and its
+        # derivatives, and only `f(x)` is recorded.
+        try:
+            x = next(steps)
+            while True:
+                values = f(x, *args, **kwargs)
+                if trace is not None:
+                    trace.append(x, values[0])
+                x = steps.send(values)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _loop_async(self, steps, f, args, kwargs, trace):
+        # Same as `_loop()`, but the evaluator is awaited.
+        try:
+            x = next(steps)
+            while True:
+                values = await f(x, *args, **kwargs)
+                if trace is not None:
+                    trace.append(x, values[0])
+                x = steps.send(values)
+        except StopIteration as stop:
+            return stop.value
+
+    def _iterate(self, xa, xb, fa, fb):
+        """ Safeguarded Newton implementation.  """
+        # local names
+        xtol = self.xtol
+        on_iteration = self._on_iteration
+        on_step = self._on_step
+        is_root = self.is_root
+
+        # initialize counters
+        i = 0
+        fcalls = 0
+
+        #check that the bracket's interval is sufficiently big.
+        if nearly_equal(xa, xb, xtol):
+            return None, None, i, fcalls, False, "small bracket"
+
+        # check lower bound. `f(x)` is the first of the received values. The derivatives on the
+        # bounds are unknown if `fa` or `fb` are given.
+        step = self._step
+        values_a = values_b = None
+        if fa is None:
+            values_a = yield xa     # First function call
+            fa = values_a[0]
+            fcalls += 1
+        if is_root(fa):
+            return xa, fa, i, fcalls, True, "lower bracket"
+
+        # check upper bound
+        if fb is None:
+            values_b = yield xb     # Second function call
+            fb = values_b[0]
+            fcalls += 1
+        if on_iteration is not None:
+            on_iteration(self, i, fcalls, xa, xb, fa, fb)
+        if is_root(fb):
+            return xb, fb, i, fcalls, True, "upper bracket"
+
+        # check if the root is bracketed.
+        if fa * fb > 0.0:
+            return None, None, i, fcalls, False, "no bracket"
+
+        # Start from the bound with the smaller `|f|`. If its derivative isn't known, the first
+        # step is a bisection.
+        x, fx, values = (xa, fa, values_a) if abs(fa) < abs(fb) else (xb, fb, values_b)
+        dx = dx_old = abs(xb - xa)
+        for i in range(1, self.max_iter + 1):
+            x_new = step(x, values) if values is not None else None
+            if x_new is not None and min(xa, xb) < x_new < max(xa, xb) and abs(x_new - x) <= 0.5 * dx_old:
+                dx_old, dx = dx, abs(x_new - x)
+                x, kind = x_new, self.step_name
+            else:
+                dx_old, dx = dx, 0.5 * abs(xb - xa)
+                x, kind = 0.5 * (xa + xb), "bisect"
+                if x == xa or x == xb:
+                    # `xa` and `xb` are consecutive floats.
+                    x, fx = (xa, fa) if abs(fa) < abs(fb) else (xb, fb)
+                    return x, fx, i - 1, fcalls, False, "small bracket"
+            if on_step is not None:
+                on_step(self, i, kind)
+            values = yield x        # New function call.
+            fx = values[0]
+            fcalls += 1
+
+            # keep the root bracketed
+            if (fx < 0) == (fa < 0):
+                xa, fa = x, fx
+            else:
+                xb, fb = x, fx
+            if on_iteration is not None:
+                on_iteration(self, i, fcalls, xa, xb, fa, fb)
+
+            # check for convergence.
+            if is_root(fx):
+                return x, fx, i, fcalls, True, "convergence"
+
+            # check for the new bracket size.
+            if nearly_equal(xa, xb, xtol):
+                return x, fx, i, fcalls, False, "small bracket"
+
+        return x, fx, i, fcalls, False, "iterations"
+
+
+class NewtonSafe(_Newton):
+    """
+    Defines a Solver for the equation `f(x) = 0` in the interval `[xa, xb]` using Newton's
+    Method safeguarded by bisection.
+
+    `f` must return the tuple `(f(x), f'(x))`, unless the derivative is passed as `fprime`,
+    in which case `f` returns just `f(x)`. The Newton steps are taken inside the bracket;
+    a bisection step is taken instead whenever a Newton step would leave the bracket or it
+    isn't smaller than half of the step before the last one. So the method converges
+    quadratically near simple roots and it never needs many more iterations than
+    `Bisect`. An evaluation of `f` and of its derivative counts as a single function call.
+
+    Function `f` must be solvable in `[xa, xb]`. Also `f(xa)` and `f(xb)` must
+    have different signs. With `solve_async()`, `fprime` must be a coroutine function too.
+
+    """
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), fprime=None, profile=0.0):
+        """
+        Parameters
+        ----------
+        :param function fprime:
+            The derivative of `f`, which is called with the same arguments as `f`. If it is
+            `None`, `f` must return the tuple `(f(x), f'(x))`.
+
+        The rest of the parameters are the same as the ones of the other solvers.
+
+        """
+        if fprime is not None and not callable(fprime):
+            raise ValueError("fprime must be callable or None, not: %r" % (fprime,))
+        self.fprime = fprime
+        super(NewtonSafe, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
+            solver_name="NewtonSafe"
+        )
+
+
+class Newton(_Newton):
+    """
+    Defines a Solver for the equation `f(x) = 0` in the interval `[xa, xb]` using Newton's
+    Method safeguarded by bisection, with the derivative computed by dual numbers.
+
+    Same as `NewtonSafe`, but `f` returns just `f(x)` and it must be written with the usual
+    operators and the functions of `pyroots.dmath`, so that `f` can be evaluated on a
+    `pyroots.dual.Dual`; `f(x)` and `f'(x)` are computed with a single evaluation.
+
+    Function `f` must be solvable in `[xa, xb]`. Also `f(xa)` and `f(xb)` must
+    have different signs.
+
+    """
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), profile=0.0):
+        super(Newton, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
+            solver_name="Newton"
+        )
+
+    def _seed(self, x):
+        return Dual(x, 1.0)
+
+    def _unpack(self, value):
+        # `f` may return a float if it doesn't depend on `x`.
+        if isinstance(value, Dual):
+            return value.real, value.dual
+        return value, 0.0
+
+
+class Halley(_Newton):
+    """
+    Defines a Solver for the equation `f(x) = 0` in the interval `[xa, xb]` using Halley's
+    Method safeguarded by bisection, with the derivatives computed by hyper-dual numbers.
+
+    Like `Newton`, but each step uses `f''(x)` too, so it converges cubically near simple
+    roots. `f` must be written with the usual operators and the functions of
+    `pyroots.dmath`, so that it can be evaluated on a `pyroots.dual.HyperDual`.
+
+    Function `f` must be solvable in `[xa, xb]`. Also `f(xa)` and `f(xb)` must
+    have different signs.
+
+    """
+
+    step_name = "halley"
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), profile=0.0):
+        super(Halley, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
+            solver_name="Halley"
+        )
+
+    def _seed(self, x):
+        return HyperDual(x, 1.0, 1.0, 0.0)
+
+    def _unpack(self, value):
+        if isinstance(value, HyperDual):
+            return value.real, value.e1, value.e12
+        return value, 0.0, 0.0
+
+    def _step(self, x, values):
+        fx, dfx, d2fx = values
+        denominator = 2 * dfx * dfx - fx * d2fx
+        return x - 2 * fx * dfx / denominator if denominator != 0 else None
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/parallel.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Solve lots of independent problems concurrently.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import copy
+import pickle
+import asyncio
+from functools import partial
+from multiprocessing import cpu_count
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from .metrics import MetricsHook
+from .export import TraceExporter
+
+
+# The solver and the function are pickled once and the pickle is sent with each chunk. Each
+# worker process keeps the last one it unpickled, so it unpickles them once per pool.
+_worker_payload = None
+_worker_problem = None
+
+
+def _load_payload(payload):
+    global _worker_payload, _worker_problem
+    if payload != _worker_payload:
+        _worker_problem = pickle.loads(payload)
+        _worker_payload = payload
+    return _worker_problem
+
+
+def _check_problems(brackets, args_list):
+    # The brackets may include the values of `f` on their bounds.
+    brackets = [tuple(bracket) if len(bracket) == 4 else tuple(bracket) + (None, None) for bracket in brackets]
+    args_list = [()] * len(brackets) if args_list is None else [tuple(args) for args in args_list]
+    if len(args_list) != len(brackets):
+        raise ValueError("Got %d brackets but %d sets of arguments." % (len(brackets), len(args_list)))
+    return brackets, args_list
+
+
+def _solve_problems(solver, f, brackets, args_list, kwargs):
+    solve = solver._solve
+    return [solve(f, xa, xb, fa, fb, args, kwargs) for (xa, xb, fa, fb), args in zip(brackets, args_list)]
+
+
+def _collectors(solver):
+    """
+    Return the registries of the `MetricsHook`s and the `TraceExporter`s of `solver`, in the
+    order of its hooks.
+
+    """
+    return [
+        hook.registry if isinstance(hook, MetricsHook) else hook
+        for hook in solver.hooks if isinstance(hook, (MetricsHook, TraceExporter))
+    ]
+
+
+def _solve_chunk(start, brackets, args_list, kwargs, solver=None, f=None, payload=None):
+    if payload is None:
+        return start, _solve_problems(solver, f, brackets, args_list, kwargs), None
+    # In a worker process the metrics and the exported events of the chunk are returned with
+    # its results, so that they can be added to the hooks of the parent process. The hooks are
+    # drained first, in case the worker has anything left over.
+    solver, f = _load_payload(payload)
+    collectors = _collectors(solver)
+    for collector in collectors:
+        collector._drain()
+    results = _solve_problems(solver, f, brackets, args_list, kwargs)
+    return start, results, [collector._drain() for collector in collectors]
+
+
+def _chunks(size, workers, min_chunksize):
+    """
+    Yield the `(start, stop)` indices of the chunks using guided self-scheduling.
+
+    Each chunk gets a fraction of the problems that are still pending. The first chunks are
+    big, which keeps the scheduling and pickling overhead low, while the last ones are small,
+    so the workers that finish early can pick up the remaining work while the slow chunks
+    (i.e. the ones whose problems need lots of iterations) are being solved.
+
+    """
+    start = 0
+    while start < size:
+        chunksize = max(min_chunksize, (size - start) // (2 * workers))
+        stop = min(size, start + chunksize)
+        yield start, stop
+        start = stop
+
+
+def solve_many(solver, f, brackets, args_list=None, kwargs=None, workers=None, min_chunksize=1):
+    """
+    Solve `f(x, *args) = 0` for each bracket and each `args` using a pool of processes.
+
+    The solver and `f` are pickled only once and each worker unpickles them only once; the
+    problems are sent in chunks. Both of them (and the arguments) must be picklable, e.g. `f`
+    must be a module level function.
+
+    Parameters
+    ----------
+    :param BaseSolver solver:
+        The solver that will be used for all the problems.
+    :param function f:
+        The function whose roots we are searching.
+    :param list brackets:
+        A sequence of `(xa, xb)` tuples, one for each problem. If the values of `f` on the
+        bounds are known, `(xa, xb, fa, fb)` tuples can be used instead (see `solver.solve()`).
+    :param list args_list:
+        A sequence with the positional arguments of `f` for each problem. If it is `None`,
+        `f` is called without positional arguments.
+    :param dict kwargs:
+        Keyword arguments of `f`, shared by all the problems.
+    :param int workers:
+        The number of processes. It defaults to the number of CPUs. If it is 1, the problems
+        are solved in the current process.
+    :param int min_chunksize:
+        The minimum number of problems that are sent to a worker at once.
+
+    Returns
+    -------
+
+    :returns: A list with the `Result` of each problem, in the order of `brackets`.
+
+    :raises: `ConvergenceError` if the solver's `raise_on_fail` is True and any problem fails
+        to converge.
+
+    """
+    brackets, args_list = _check_problems(brackets, args_list)
+    kwargs = kwargs or {}
+    workers = workers or cpu_count()
+
+    if workers == 1:
+        return _solve_problems(solver, f, brackets, args_list, kwargs)
+
+    payload = pickle.dumps((solver, f), pickle.HIGHEST_PROTOCOL)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        solve_chunk = partial(_solve_chunk, payload=payload)
+        return _schedule(executor, solve_chunk, brackets, args_list, kwargs, workers, min_chunksize, _collectors(solver))
+
+
+def solve_many_threaded(solver, f, brackets, args_list=None, kwargs=None, workers=None, min_chunksize=1):
+    """
+    Solve `f(x, *args) = 0` for each bracket and each `args` using a pool of threads.
+
+    This is the alternative of `solve_many()` for functions that spend most of their time in
+    code that releases the GIL (e.g. NumPy or C extensions), or for free-threaded builds of
+    CPython. Nothing needs to be pickled. The solver is shared by all the threads; the solvers
+    don't keep any state between solves, so this is safe. The `on_iteration` event is not
+    dispatched to the hooks whose `concurrent_iterations` is `False` (e.g. `LoggingHook`
+    doesn't log the iterations), since the events of the various problems would be
+    interleaved.
+
+    The parameters are the same as the ones of `solve_many()`, except that `workers` is the
+    number of threads.
+
+    Returns
+    -------
+
+    :returns: A list with the `Result` of each problem, in the order of `brackets`.
+
+    :raises: `ConvergenceError` if the solver's `raise_on_fail` is True and any problem fails
+        to converge.
+
+    """
+    brackets, args_list = _check_problems(brackets, args_list)
+    kwargs = kwargs or {}
+    workers = workers or cpu_count()
+
+    solver = copy.copy(solver)
+    solver.hooks = tuple(hook if getattr(hook, "concurrent_iterations", True) else _without_iterations(hook) for hook in solver.hooks)
+    solver._setup_hooks()
+    if workers == 1:
+        return _solve_problems(solver, f, brackets, args_list, kwargs)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        solve_chunk = partial(_solve_chunk, solver=solver, f=f)
+        return _schedule(executor, solve_chunk, brackets, args_list, kwargs, workers, min_chunksize)
+
+
+def _without_iterations(hook):
+    """ Return a copy of `hook` that doesn't handle the `on_iteration` event. """
+    hook = copy.copy(hook)
+    hook.on_iteration = None
+    return hook
+
+
+def _schedule(executor, solve_chunk, brackets, args_list, kwargs, workers, min_chunksize, collectors=()):
+    """ Solve the problems in chunks using `executor` and return the results.  """
+    results = [None] * len(brackets)
+
+    def collect(future):
+        offset, chunk_results, collected = future.result()
+        results[offset:offset + len(chunk_results)] = chunk_results
+        for collector, drained in zip(collectors, collected or ()):
+            collector._absorb(drained)
+
+    # Keep a couple of chunks per worker in flight and hand out the next (smaller) ones as
+    # soon as any of them completes.
+    pending = set()
+    for start, stop in _chunks(len(brackets), workers, min_chunksize):
+        pending.add(executor.submit(solve_chunk, start, brackets[start:stop], args_list[start:stop], kwargs))
+        if len(pending) < 2 * workers:
+            continue
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            collect(future)
+    for future in pending:
+        collect(future)
+    return results
+
+
+async def solve_many_async(solver, f, brackets, args_list=None, kwargs=None, limit=100):
+    """
+    Solve `f(x, *args) = 0` for each bracket and each `args`, where `f` is a coroutine function.
+
+    The problems are solved concurrently on the running event loop, with at most `limit` of
+    them in progress at any time. This is useful when evaluating `f` means waiting for I/O,
+    e.g. for a remote service, since the waits of the problems overlap.
+
+    The parameters are the same as the ones of `solve_many()`, except from `limit`, which
+    replaces `workers`.
+
+    Returns
+    -------
+
+    :returns: A list with the `Result` of each problem, in the order of `brackets`.
+
+    :raises: `ConvergenceError` if the solver's `raise_on_fail` is True and any problem fails
+        to converge.
+
+    """
+    brackets, args_list = _check_problems(brackets, args_list)
+    kwargs = kwargs or {}
+    semaphore = asyncio.Semaphore(limit)
+
+    async def solve(xa, xb, fa, fb, args):
+        async with semaphore:
+            return await solver.solve_async(f, xa, xb, *args, fa=fa, fb=fb, **kwargs)
+
+    return await asyncio.gather(*[solve(xa, xb, fa, fb, args) for (xa, xb, fa, fb), args in zip(brackets, args_list)])
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/profile.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Profiling of the solves: the time spent in `f` and the overhead of the solver.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from time import perf_counter_ns
+
+
+class Profile(object):
+    """
+    The breakdown of the time of a solve.
+
+    The times are measured with `time.perf_counter_ns()`, from the first to the last step of
+    the solver; the bracket searches of `solve_from_guess()` and `sweep()` are not included.
+    The time that isn't spent in `f` is the overhead of the solver, e.g. its arithmetic, the
+    recording of the steps and the hooks.
+
+    """
+
+    __slots__ = ("total_ns", "f_ns", "calls", "iterations")
+
+    def __init__(self, total_ns, f_ns, calls, iterations):
+        self.total_ns = total_ns
+        self.f_ns = f_ns
+        self.calls = calls
+        self.iterations = iterations
+
+    @property
+    def total_time(self):
+        """ The time of the solve in seconds. """
+        return self.total_ns * 1e-9
+
+    @property
+    def f_time(self):
+        """ The time spent in `f` in seconds. """
+        return self.f_ns * 1e-9
+
+    @property
+    def solver_time(self):
+        """ The time spent in the solver in seconds, i.e. the total time minus the time in `f`. """
+        return (self.total_ns - self.f_ns) * 1e-9
+
+    @property
+    def time_per_iteration(self):
+        """ The total time divided by the number of iterations, or `None` if there were none. """
+        return self.total_time / self.iterations if self.iterations else None
+
+    def __repr__(self):
+        return "Profile(total_time=%.3g, f_time=%.3g, solver_time=%.3g, calls=%d, iterations=%d)" % (
+            self.total_time, self.f_time, self.solver_time, self.calls, self.iterations
+        )
+
+
+class TimedFunction(object):
+    """ Wrap `f`, accumulating the time spent in it (in ns) and the number of its calls. """
+
+    __slots__ = ("f", "elapsed", "calls")
+
+    def __init__(self, f):
+        self.f = f
+        self.elapsed = 0
+        self.calls = 0
+
+    def __call__(self, x, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return self.f(x, *args, **kwargs)
+        finally:
+            self.elapsed += perf_counter_ns() - start
+            self.calls += 1
+
+
+class TimedCoroutineFunction(TimedFunction):
+    """ Same as `TimedFunction`, for a coroutine function `f`; the time includes the waits.  """
+
+    __slots__ = ()
+
+    async def __call__(self, x, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return await self.f(x, *args, **kwargs)
+        finally:
+            self.elapsed += perf_counter_ns() - start
+            self.calls += 1
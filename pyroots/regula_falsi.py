@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/regula_falsi.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Modified regula falsi (false position) methods for root finding.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from .utils import EPS, nearly_equal
+from .base import BaseSolver
+
+
+def _illinois(fa, fb, fx):
+    return 0.5 * fa
+
+
+def _pegasus(fa, fb, fx):
+    return fa * fb / (fb + fx)
+
+
+def _anderson_bjorck(fa, fb, fx):
+    m = 1 - fx / fb
+    return fa * (m if m > 0 else 0.5)
+
+
+class RegulaFalsi(BaseSolver):
+    """
+    Defines a Solver for the equation `f(x) = 0` in the interval `[xa, xb]` using a modified
+    Regula Falsi Method.
+
+    Plain regula falsi keeps one end of the bracket fixed for long periods on convex
+    functions and converges slowly. The modifications scale down the value of `f` on the
+    retained end whenever that happens: "illinois" halves it, "pegasus" scales it by
+    `fb / (fb + fx)` and "anderson-bjorck" by `1 - fx / fb` (or by a half if that isn't
+    positive). They need one function call per iteration and converge superlinearly.
+
+    Function `f` must be solvable in `[xa, xb]`. Also `f(xa)` and `f(xb)` must
+    have different signs.
+
+    """
+
+    methods = {
+        "illinois": _illinois,
+        "pegasus": _pegasus,
+        "anderson-bjorck": _anderson_bjorck,
+    }
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), method="illinois", profile=0.0):
+        """
+        Parameters
+        ----------
+        :param str method:
+            The modification; one of "illinois", "pegasus" and "anderson-bjorck".
+
+        The rest of the parameters are the same as the ones of the other solvers.
+
+        """
+        if method not in self.methods:
+            raise ValueError("Unknown method %r; it must be one of: %s" % (method, ", ".join(sorted(self.methods))))
+        self.method = method
+        super(RegulaFalsi, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
+            solver_name="RegulaFalsi"
+        )
+
+    def _iterate(self, xa, xb, fa, fb):
+        """ Regula Falsi implementation.  """
+        # local names
+        xtol = self.xtol
+        on_iteration = self._on_iteration
+        on_step = self._on_step
+        is_root = self.is_root
+        scale = self.methods[self.method]
+
+        # initialize counters
+        i = 0
+        fcalls = 0
+
+        #check that the bracket's interval is sufficiently big.
+        if nearly_equal(xa, xb, xtol):
+            return None, None, i, fcalls, False, "small bracket"
+
+        # check lower bound
+        if fa is None:
+            fa = yield xa           # First function call
+            fcalls += 1
+        if is_root(fa):
+            return xa, fa, i, fcalls, True, "lower bracket"
+
+        # check upper bound
+        if fb is None:
+            fb = yield xb           # Second function call
+            fcalls += 1
+        if on_iteration is not None:
+            on_iteration(self, i, fcalls, xa, xb, fa, fb)
+        if is_root(fb):
+            return xb, fb, i, fcalls, True, "upper bracket"
+
+        # check if the root is bracketed.
+        if fa * fb > 0.0:
+            return None, None, i, fcalls, False, "no bracket"
+
+        # `xb` is always the last point and `xa` the retained end of the bracket. `ga` is the
+        # scaled value of `f(xa)` that is used for the interpolation.
+        # If `|f|` hasn't been halved in three iterations a bisection step is forced; this
+        # keeps the methods from crawling towards a root while `f` is flat.
+        x, fx, ga = xb, fb, fa
+        best, stalled = min(abs(fa), abs(fb)), 0
+        for i in range(1, self.max_iter + 1):
+            step = "interpolate"
+            if stalled < 3:
+                x = (xa * fb - xb * ga) / (fb - ga)
+            else:
+                x, ga = xb, fa      # bisect, and drop the scaling of the retained end
+            if not min(xa, xb) < x < max(xa, xb):
+                x, step = 0.5 * (xa + xb), "bisect"
+                if x == xa or x == xb:
+                    # `xa` and `xb` are consecutive floats.
+                    x, fx = (xa, fa) if abs(fa) < abs(fb) else (xb, fb)
+                    return x, fx, i - 1, fcalls, False, "small bracket"
+            if on_step is not None:
+                on_step(self, i, step)
+            fx = yield x            # New function call.
+            fcalls += 1
+
+            # close the bracket
+            if fx * fb < 0.0:
+                xa, fa, ga = xb, fb, fb
+            else:
+                ga = scale(ga, fb, fx)
+            xb, fb = x, fx
+            if abs(fx) <= 0.5 * best:
+                best, stalled = abs(fx), 0
+            else:
+                stalled += 1
+            if on_iteration is not None:
+                on_iteration(self, i, fcalls, xa, xb, fa, fb)
+
+            # check for convergence.
+            if is_root(fx):
+                return x, fx, i, fcalls, True, "convergence"
+
+            # check for the new bracket size.
+            if nearly_equal(xa, xb, xtol):
+                return x, fx, i, fcalls, False, "small bracket"
+
+        return x, fx, i, fcalls, False, "iterations"
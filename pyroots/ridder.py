@@ -59,61 +59,65 @@ class Ridder(BaseSolver):
 
     """
 
-    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10):
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), profile=0.0):
         super(Ridder, self).__init__(
             epsilon=epsilon,
             xtol=xtol,
             max_iter=max_iter,
             raise_on_fail=raise_on_fail,
             debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
             solver_name="Ridder"
         )
 
-    def _solve(self, f, xa, xb, *args, **kwargs):
+    def _iterate(self, xa, xb, fa, fb):
         """ Ridder implementation.  """
         # local names
         xtol = self.xtol
+        on_iteration = self._on_iteration
 
         # initialize counters
         i = 0
-        x_steps = []
-        fx_steps = []
+        fcalls = 0
 
         #check that the bracket's interval is sufficiently big.
         if nearly_equal(xa, xb, xtol):
-            return self._return_result(None, None, i, x_steps, fx_steps, False, "small bracket")
+            return None, None, i, fcalls, False, "small bracket"
 
         # check lower bound
-        fa = f(xa, *args, **kwargs)               # First function call
-        x_steps.append(xa)
-        fx_steps.append(fa)
+        if fa is None:
+            fa = yield xa           # First function call
+            fcalls += 1
         if self.is_root(fa):
-            return self._return_result(xa, fa, i, x_steps, fx_steps, True, "lower bracket")
+            return xa, fa, i, fcalls, True, "lower bracket"
 
         # check upper bound
-        fb = f(xb, *args, **kwargs)               # Second function call
-        x_steps.append(xb)
-        fx_steps.append(fb)
-        self._debug(i, len(fx_steps), xa, xb, fa, fb)
+        if fb is None:
+            fb = yield xb           # Second function call
+            fcalls += 1
+        if on_iteration is not None:
+            on_iteration(self, i, fcalls, xa, xb, fa, fb)
         if self.is_root(fb):
-            return self._return_result(xb, fb, i, x_steps, fx_steps, True, "upper bracket")
+            return xb, fb, i, fcalls, True, "upper bracket"
 
         # check if the root is bracketed.
         if fa * fb > 0.0:
-            return self._return_result(None, None, i, x_steps, fx_steps, False, "no bracket")
+            return None, None, i, fcalls, False, "no bracket"
 
         # start iterations
         for i in range(1, self.max_iter + 1):
             # Bisect the bracket and calculate the new function value.
             xm = 0.5 * (xa + xb)
-            fm = f(xm, *args, **kwargs)           # New function call.
-            x_steps.append(xm)
-            fx_steps.append(fm)
-            self._debug(i, len(fx_steps), xa, xm, fa, fm)
+            fm = yield xm           # New function call.
+            fcalls += 1
+            if on_iteration is not None:
+                on_iteration(self, i, fcalls, xa, xm, fa, fm)
 
             # check for convergence.
             if self.is_root(fm):
-                return self._return_result(xm, fm, i, x_steps, fx_steps, True, "convergence")
+                return xm, fm, i, fcalls, True, "convergence"
 
             # `t` is the denominator followingly
             # if `t == 0` then the ridder's method cannot be applied due to a
@@ -132,13 +136,13 @@ class Ridder(BaseSolver):
             # reference though.
             sign = -1 if fa < fb else 1
             xs = xm + (xm - xa) * sign * fm / t
-            fs = f(xs, **kwargs)
-            x_steps.append(xs)
-            fx_steps.append(fs)
-            self._debug(i, len(fx_steps), xa, xs, fa, fs)
+            fs = yield xs
+            fcalls += 1
+            if on_iteration is not None:
+                on_iteration(self, i, fcalls, xa, xs, fa, fs)
 
             if self.is_root(fs):
-                return self._return_result(xs, fs, i, x_steps, fx_steps, True, "convergence")
+                return xs, fs, i, fcalls, True, "convergence"
 
             # When ftol is very small (e.g. 1e-15) then there are cases that the
             # method can't converge in a reasonable amount of iterations.
@@ -148,9 +152,7 @@ class Ridder(BaseSolver):
             # during the iterations.
             # NOTE: Perhaps this check is not very robust.
             if i > 1 and abs(xs - xs_old) < xtol and abs(xm - xm_old) < xtol:
-                result = self._return_result(xs, fs, i, x_steps, fx_steps, False, "Precision not achieved. Iteration stagnant.")
-                self.logger.debug(result)
-                return result
+                return xs, fs, i, fcalls, False, "stagnant"
 
 
             # Re-bracket the root as tightly as possible
@@ -173,10 +175,10 @@ class Ridder(BaseSolver):
             #print(abs(max(xa, xb)) * xtol)
             #if abs(xb - xa) < abs(max(xa, xb)) * xtol:
             if nearly_equal(xa, xb, xtol):
-                return self._return_result(xs, fs, i, x_steps, fx_steps, False, "small bracket")
+                return xs, fs, i, fcalls, False, "small bracket"
 
             # Store values of the previous iteration.
             xm_old = xm
             xs_old = xs
 
-        return self._return_result(xm, fm, i, x_steps, fx_steps, False, "iterations")
+        return xm, fm, i, fcalls, False, "iterations"
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/scan.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Find all the roots of a function in an interval.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+try:
+    import numpy as np
+except ImportError:         # pragma: no cover
+    np = None
+
+from .utils import EPS
+from .brent import Brentq
+from .parallel import solve_many, solve_many_threaded
+
+
+def _sample(f, a, b, samples, vectorized, args, kwargs):
+    """ Return the equally spaced samples of `f` in `[a, b]`. """
+    if vectorized:
+        if np is None:
+            raise ImportError("Vectorized sampling requires numpy.")
+        xs = np.linspace(a, b, samples + 1)
+        fs = np.broadcast_to(np.asarray(f(xs, *args, **kwargs), dtype=float), xs.shape)
+        return xs.tolist(), fs.tolist()
+    xs = [a + (b - a) * i / samples for i in range(samples)] + [b]
+    return xs, [f(x, *args, **kwargs) for x in xs]
+
+
+def _sign_changes(xs, fs):
+    """ Return the `(xa, xb, fa, fb)` brackets of the consecutive points where `f` changes sign. """
+    brackets = []
+    last = len(xs) - 2
+    for i in range(len(xs) - 1):
+        fa, fb = fs[i], fs[i + 1]
+        # A root on a point is only bracketed once, by the interval that starts on it.
+        if fa * fb < 0.0 or fa == 0.0 or (fb == 0.0 and i == last):
+            brackets.append((xs[i], xs[i + 1], fa, fb))
+    return brackets
+
+
+def _tangent_regions(xs, fs):
+    """ Yield the indices of the local minima of `|f|` between points of the same sign. """
+    for i in range(1, len(xs) - 1):
+        f0, f1, f2 = fs[i - 1], fs[i], fs[i + 1]
+        if f0 * f1 > 0.0 and f1 * f2 > 0.0 and abs(f1) < abs(f0) and abs(f1) <= abs(f2):
+            yield i
+
+
+def _refine(f, points, levels, args, kwargs):
+    """
+    Search the neighbourhood of a local minimum of `|f|` for a pair of roots.
+
+    `points` are three equally spaced `(x, f(x))` points of the same sign, the middle one
+    being the minimum. On each level, the midpoints of the two halves are evaluated and the
+    search continues around the new minimum. The search stops when the parabola through
+    the points predicts that `f` doesn't get much closer to 0.
+
+    :returns: The brackets that have been found (if any), the minimum and its neighbour and
+        the number of function evaluations.
+
+    """
+    func_calls = 0
+    for _ in range(levels):
+        (x0, f0), (x1, f1), (x2, f2) = points
+        curvature = f0 - 2 * f1 + f2
+        vertex = f1 - (f2 - f0) ** 2 / (8 * curvature) if curvature != 0.0 else f1
+        if (vertex * f1 > 0.0 and abs(vertex) > abs(f1) / 2) or x2 - x0 < 4 * EPS * max(1.0, abs(x1)):
+            break
+        xm0, xm1 = (x0 + x1) / 2, (x1 + x2) / 2
+        points = [(x0, f0), (xm0, f(xm0, *args, **kwargs)), (x1, f1), (xm1, f(xm1, *args, **kwargs)), (x2, f2)]
+        func_calls += 2
+        brackets = _sign_changes(*zip(*points))
+        if brackets:
+            return brackets, None, func_calls
+        k = min(range(1, 4), key=lambda k: abs(points[k][1]))
+        points = points[k - 1:k + 2]
+    (x1, f1), (x2, f2) = points[1:]
+    return [], (x1, x2, f1, f2), func_calls
+
+
+def _beside_root(f, x0, x1, f1, levels, args, kwargs):
+    """
+    Search the interval between a sample `x0` where `f` is 0 and the sample `x1` for another root.
+
+    The root on `x0` hides a root that is close to it, since `f(x0)` has no sign. On each
+    level, the midpoint is evaluated and the parabola through the three points predicts
+    whether `f` crosses 0 again next to `x0`, i.e. whether its slope on `x0` points away from
+    `f1`. If it does, the search continues on the half next to `x0`.
+
+    :returns: The brackets that have been found (if any) and the number of function
+        evaluations.
+
+    """
+    func_calls = 0
+    for _ in range(levels):
+        if f1 == 0.0 or abs(x1 - x0) < 4 * EPS * max(1.0, abs(x0)):
+            break
+        xm = (x0 + x1) / 2
+        fm = f(xm, *args, **kwargs)
+        func_calls += 1
+        if fm * f1 <= 0.0:
+            return [(xm, x1, fm, f1) if xm < x1 else (x1, xm, f1, fm)], func_calls
+        if (4 * fm - f1) * f1 > 0.0:
+            break
+        x1, f1 = xm, fm
+    return [], func_calls
+
+
+def find_all_roots(f, a, b, solver=None, samples=100, vectorized=False, refine=20, workers=1, threaded=False, args=(), kwargs=None):
+    """
+    Find all the roots of `f` in `[a, b]`.
+
+    `f` is sampled on `samples + 1` equally spaced points and every sign change is solved
+    with `solver`. The values of `f` on the samples are passed to the solver, so the bounds
+    of the brackets are not evaluated again.
+
+    A pair of roots that fall between two samples doesn't change the sign of the samples;
+    it shows up as a local minimum of `|f|`. These regions are refined adaptively (by
+    halving the spacing of the samples up to `refine` times) for as long as `f` looks like
+    it approaches 0. If a sign change is found, it is solved too; if not, the minimum is
+    reported as a root if `solver.is_root()` accepts it (e.g. for roots of even
+    multiplicity, like the root of `x ** 2`). Likewise, the intervals next to a sample that is
+    a root are refined, in case another root is close to it.
+
+    Parameters
+    ----------
+    :param function f:
+        The function whose roots we are searching.
+    :param float a:
+        The lower bound of the interval.
+    :param float b:
+        The upper bound of the interval.
+    :param BaseSolver solver:
+        The solver of the brackets. It defaults to `Brentq()`.
+    :param int samples:
+        The number of intervals that `[a, b]` is split in. Roots that are closer than the
+        spacing of the samples may only be found by the refinement.
+    :param bool vectorized:
+        If `True`, `f` is called once with the array of all the samples (requires numpy).
+    :param int refine:
+        The maximum number of refinements of a local minimum of `|f|` (or of an interval next
+        to a root on a sample); 0 disables them.
+    :param int workers:
+        If it is greater than 1, the brackets are solved by `solve_many()` with that many
+        processes, or by `solve_many_threaded()` if `threaded` is `True`.
+    :param tuple args:
+        Function's `f` positional arguments.
+    :param dict kwargs:
+        Function's `f` keyword arguments.
+
+    Returns
+    -------
+
+    :returns: A list with the `Result` of each root, in ascending order. The evaluations of
+        the samples are not included in the results.
+
+    :raises: `ConvergenceError` if the solver's `raise_on_fail` is True and the solution of any
+        bracket fails to converge.
+
+    """
+    kwargs = kwargs or {}
+    solver = Brentq() if solver is None else solver
+    if not a < b:
+        raise ValueError("The interval [%r, %r] is empty." % (a, b))
+    if (not isinstance(samples, int)) or samples < 1:
+        raise ValueError("samples must be a positive integer, not: %r" % samples)
+
+    xs, fs = _sample(f, a, b, samples, vectorized, args, kwargs)
+    brackets = _sign_changes(xs, fs)
+    if refine:
+        for i in _tangent_regions(xs, fs):
+            found, minimum, _ = _refine(f, list(zip(xs[i - 1:i + 2], fs[i - 1:i + 2])), refine, args, kwargs)
+            brackets.extend(found)
+            if minimum is not None and solver.is_root(minimum[2]):
+                brackets.append(minimum)
+        for i in range(len(xs)):
+            if fs[i] == 0.0:
+                for j in (i - 1, i + 1):
+                    if 0 <= j < len(xs):
+                        brackets.extend(_beside_root(f, xs[i], xs[j], fs[j], refine, args, kwargs)[0])
+    brackets.sort()
+
+    if workers > 1:
+        solve = solve_many_threaded if threaded else solve_many
+        return solve(solver, f, brackets, [args] * len(brackets), kwargs, workers=workers)
+    return [solver.solve(f, xa, xb, fa, fb, args, kwargs) for xa, xb, fa, fb in brackets]
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/secant.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+The secant and Steffensen's methods, which don't need a bracket.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+from .utils import EPS, nearly_equal
+from .bracket import _check_search, _start, _search
+from .base import BaseSolver
+from .brent import _brent, _inverse_quadratic
+
+# The maximum number of expansions of the bracket search, as in `find_bracket()`.
+SEARCH_ITER = 50
+# A step that is this many times longer than both the previous one and the scale of `x` is
+# taken as divergence, e.g. on the flat tail of `exp(-x)`, where it would overflow `f`. The
+# scale matters for the first step, since the points of `solve_from_guess()` are very close.
+MAX_GROWTH = 100
+
+
+class Secant(BaseSolver):
+    """
+    Defines a Solver for the equation `f(x) = 0` starting from two points `x0` and `x1`,
+    using the secant method, or Steffensen's method.
+
+    The starting points don't need to bracket the root, e.g. `solve_from_guess()` starts
+    from a single guess. The iteration converges superlinearly near simple roots. As soon
+    as two points bracket the root, or if the iteration diverges or stalls (i.e. `|f|` isn't
+    halved in two successive iterations, or a step is too long or it leaves the domain of
+    `f`), the root is solved with `Brentq`; if there is no bracket yet, it is searched for with
+    `pyroots.bracket.find_bracket()` starting from the best point. The function calls and
+    the iterations of all of them are included in the `Result`.
+
+    """
+
+    methods = ("secant", "steffensen")
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), method="secant", profile=0.0):
+        """
+        Parameters
+        ----------
+        :param str method:
+            "secant" or "steffensen". Steffensen's method converges quadratically, but it
+            needs two function calls per iteration and `f(x)` must be of the same scale as
+            `x`, since `x + f(x)` is evaluated.
+
+        The rest of the parameters are the same as the ones of the other solvers.
+
+        """
+        if method not in self.methods:
+            raise ValueError("Unknown method %r; it must be one of: %s" % (method, ", ".join(self.methods)))
+        self.method = method
+        super(Secant, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
+            solver_name="Secant"
+        )
+
+    def solve_from_guess(self, f, x0, step=None, factor=2.0, lower=None, upper=None, args=(), kwargs=None):
+        """
+        Solve `f` starting from the guess `x0`.
+
+        The second starting point is `x0 + step`. `step`, `factor`, `lower` and `upper` are
+        the parameters of the bracket search if the iteration diverges (see
+        `BaseSolver.solve_from_guess()`). The points never leave `[lower, upper]`.
+
+        """
+        kwargs = kwargs or {}
+        _check_search(factor, SEARCH_ITER)
+        lower, upper, step, x1 = _start(x0, step, lower, upper)
+        trace = self._new_trace()
+        if self._on_start is not None:
+            self._on_start(self, x0, x1)
+        return self._drive(self._iterate(x0, x1, None, None, step, factor, lower, upper), f, args, kwargs, trace)
+
+    def _iterate(self, xa, xb, fa, fb, step=None, factor=2.0, lower=float("-inf"), upper=float("inf")):
+        """ Secant and Steffensen implementation. `xa` and `xb` are the starting points. """
+        # local names
+        xtol = self.xtol
+        on_iteration = self._on_iteration
+        is_root = self.is_root
+        steffensen = self.method == "steffensen"
+
+        # initialize counters
+        i = 0
+        fcalls = 0
+
+        # check the starting points
+        x0, x1, f0, f1 = xa, xb, fa, fb
+        if nearly_equal(x0, x1, xtol):
+            return None, None, i, fcalls, False, "small bracket"
+        if f0 is None:
+            f0 = yield x0           # First function call
+            fcalls += 1
+        if is_root(f0):
+            return x0, f0, i, fcalls, True, "convergence"
+        if f1 is None:
+            f1 = yield x1           # Second function call
+            fcalls += 1
+        if on_iteration is not None:
+            on_iteration(self, i, fcalls, x0, x1, f0, f1)
+        if is_root(f1):
+            return x1, f1, i, fcalls, True, "convergence"
+        if steffensen and abs(f0) < abs(f1):
+            x0, x1, f0, f1 = x1, x0, f1, f0
+
+        stalled = 0
+        if f0 * f1 > 0.0:
+            for i in range(1, self.max_iter + 1):
+                if steffensen:
+                    # The secant through `x1` and `x1 + f(x1)`.
+                    x0 = x1 + f1
+                    if not (math.isfinite(x0) and lower <= x0 <= upper):
+                        break
+                    f0 = yield x0       # New function call.
+                    fcalls += 1
+                    if is_root(f0):
+                        return x0, f0, i, fcalls, True, "convergence"
+                    if f0 * f1 <= 0.0:
+                        break
+                if f1 == f0:
+                    break
+                x = x1 - f1 * (x1 - x0) / (f1 - f0)
+                if not (math.isfinite(x) and lower <= x <= upper) or abs(x - x1) > MAX_GROWTH * max(abs(x1 - x0), abs(x1)):
+                    break
+                fx = yield x            # New function call.
+                fcalls += 1
+                x0, f0, x1, f1 = x1, f1, x, fx
+                if on_iteration is not None:
+                    on_iteration(self, i, fcalls, x0, x1, f0, f1)
+
+                # check for convergence.
+                if is_root(fx):
+                    return x, fx, i, fcalls, True, "convergence"
+
+                # check for a bracket, for divergence and for stagnation.
+                if f0 * f1 <= 0.0:
+                    break
+                stalled = stalled + 1 if abs(f1) > 0.5 * abs(f0) else 0
+                if stalled == 2:
+                    break
+                if nearly_equal(x0, x1, xtol):
+                    return x, fx, i, fcalls, False, "stagnant"
+            else:
+                return x1, f1, i, fcalls, False, "iterations"
+
+        if f0 * f1 <= 0.0:
+            xa, xb, fa, fb = (x0, x1, f0, f1) if x0 < x1 else (x1, x0, f1, f0)
+        else:
+            # Search for a bracket starting from the best point.
+            x, fx = (x0, f0) if abs(f0) < abs(f1) else (x1, f1)
+            bracket = yield from _search(x, fx, step, factor, lower, upper, SEARCH_ITER)
+            fcalls += bracket.func_calls
+            if not bracket.found:
+                return x, fx, i, fcalls, False, "no bracket"
+            xa, xb, fa, fb = bracket.xa, bracket.xb, bracket.fa, bracket.fb
+
+        # Brent's method gets the iterations that are left.
+        x, fx, iterations, func_calls, converged, condition = yield from _brent(self, xa, xb, fa, fb, _inverse_quadratic, self.max_iter - i)
+        return x, fx, i + iterations, fcalls + func_calls, converged, condition
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/toms748.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Alefeld, Potra and Shi's algorithm 748 for root finding.
+
+G. E. Alefeld, F. A. Potra and Y. Shi, "Algorithm 748: Enclosing Zeros of Continuous
+Functions", ACM Transactions on Mathematical Software, 21(3), 327-344 (1995).
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from math import frexp
+
+from .utils import EPS, nearly_equal
+from .base import BaseSolver
+
+
+def _distinct(*fs):
+    """ Return True if the values are sufficiently apart for the inverse cubic interpolation. """
+    for i, fi in enumerate(fs):
+        for fj in fs[i + 1:]:
+            if not abs(fi - fj) > 32 * EPS:
+                return False
+    return True
+
+
+def _inverse_cubic(a, b, d, e, fa, fb, fd, fe):
+    """ Return the zero of the cubic `x(f)` that passes through the four points. """
+    xs = (a, b, d, e)
+    fs = (fa, fb, fd, fe)
+    c = 0.0
+    for i in range(4):
+        weight = xs[i]
+        for j in range(4):
+            if i != j:
+                weight *= fs[j] / (fs[j] - fs[i])
+        c += weight
+    return c
+
+
+def _newton_quadratic(a, b, d, fa, fb, fd, steps):
+    """
+    Approximate the zero of the quadratic that passes through the three points with `steps`
+    Newton steps, starting from the end of `[a, b]` where the quadratic has the sign of its
+    curvature.
+    """
+    B = (fb - fa) / (b - a)
+    A = ((fd - fb) / (d - b) - B) / (d - a)
+    if A == 0.0:
+        r = a - fa / B
+        return r if a < r < b else 0.5 * (a + b)
+    r = a if (A > 0) == (fa > 0) else b
+    for _ in range(steps):
+        r1 = r - ((A * (r - b) + B) * (r - a) + fa) / (B + A * (2 * r - a - b))
+        if not a < r1 < b:
+            return r if a < r < b else 0.5 * (a + b)
+        r = r1
+    return r
+
+
+def _bracket(a, b, fa, fb, c, fc):
+    """ Replace the end of `[a, b]` that has the sign of `f(c)` with `c` and return it as `d`.  """
+    if (fa > 0) == (fc > 0):
+        return c, b, fc, fb, a, fa
+    return a, c, fa, fc, b, fb
+
+
+class Toms748(BaseSolver):
+    """
+    Defines a Solver for the equation `f(x) = 0` in the interval `[xa, xb]` using Alefeld,
+    Potra and Shi's algorithm 748.
+
+    Each iteration takes `k` inverse cubic interpolation (or Newton-quadratic) steps and a
+    double-length secant step, and it bisects the bracket if it didn't shrink by half. With
+    `k=2` (algorithm 4.2 of the paper) its asymptotic efficiency index is higher than the
+    one of Brent's method, while the bisections keep its worst case bounded.
+
+    Function `f` must be solvable in `[xa, xb]`. Also `f(xa)` and `f(xb)` must
+    have different signs.
+
+    """
+
+    # The bracket must shrink by this factor on each iteration, or it is bisected.
+    MU = 0.5
+
+    def __init__(self, epsilon=1e-6, xtol=EPS, max_iter=500, raise_on_fail=True, debug_precision=10, history=True, hooks=(), k=2, profile=0.0):
+        """
+        Parameters
+        ----------
+        :param int k:
+            The number of interpolation steps per iteration.
+
+        The rest of the parameters are the same as the ones of the other solvers.
+
+        """
+        if (not isinstance(k, int)) or k < 1:
+            raise ArithmeticError("k must be a positive integer, not: %r <%r>" % (k, type(k)))
+        self.k = k
+        super(Toms748, self).__init__(
+            epsilon=epsilon,
+            xtol=xtol,
+            max_iter=max_iter,
+            raise_on_fail=raise_on_fail,
+            debug_precision=debug_precision,
+            history=history,
+            hooks=hooks,
+            profile=profile,
+            solver_name="Toms748"
+        )
+
+    def _iterate(self, xa, xb, fa, fb):
+        """ TOMS 748 implementation.  """
+        # local names
+        xtol = self.xtol
+        on_iteration = self._on_iteration
+        is_root = self.is_root
+
+        # initialize counters
+        i = 0
+        fcalls = 0
+
+        #check that the bracket's interval is sufficiently big.
+        if nearly_equal(xa, xb, xtol):
+            return None, None, i, fcalls, False, "small bracket"
+
+        # check lower bound
+        if fa is None:
+            fa = yield xa           # First function call
+            fcalls += 1
+        if is_root(fa):
+            return xa, fa, i, fcalls, True, "lower bracket"
+
+        # check upper bound
+        if fb is None:
+            fb = yield xb           # Second function call
+            fcalls += 1
+        if on_iteration is not None:
+            on_iteration(self, i, fcalls, xa, xb, fa, fb)
+        if is_root(fb):
+            return xb, fb, i, fcalls, True, "upper bracket"
+
+        # check if the root is bracketed.
+        if fa * fb > 0.0:
+            return None, None, i, fcalls, False, "no bracket"
+
+        a, b = xa, xb
+        if a > b:
+            a, b, fa, fb = b, a, fb, fa
+
+        if self.max_iter < 1:
+            x0, fx0 = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+            return x0, fx0, i, fcalls, False, "iterations"
+
+        # The first iteration is a secant step.
+        i = 1
+        c = a - fa * (b - a) / (fb - fa)
+        if not a < c < b:
+            c = 0.5 * (a + b)
+        fc = yield c
+        fcalls += 1
+        a, b, fa, fb, d, fd = _bracket(a, b, fa, fb, c, fc)
+        if on_iteration is not None:
+            on_iteration(self, i, fcalls, a, b, fa, fb)
+        if is_root(fc):
+            return c, fc, i, fcalls, True, "convergence"
+        # `d` is the end that was replaced last and `e` the one before it.
+        e = fe = None
+
+        for i in range(2, self.max_iter + 1):
+            width = b - a
+            for step in range(self.k + 2):
+                if step < self.k:
+                    # inverse cubic interpolation if the values are distinct, otherwise
+                    # Newton steps on the quadratic through a, b and d.
+                    c = None
+                    if e is not None and _distinct(fa, fb, fd, fe):
+                        c = _inverse_cubic(a, b, d, e, fa, fb, fd, fe)
+                        if not a < c < b:
+                            c = None
+                    if c is None:
+                        c = _newton_quadratic(a, b, d, fa, fb, fd, step + 2)
+                elif step == self.k:
+                    # double-length secant step from the end with the smallest |f|.
+                    u, fu = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+                    c = u - 2 * fu * (b - a) / (fb - fa)
+                    if abs(c - u) > 0.5 * (b - a):
+                        c = 0.5 * (a + b)
+                    elif nearly_equal(c, u, EPS):
+                        # The values of the ends differ by many orders of magnitude, or the
+                        # root is very close to `u`.
+                        if frexp(fu)[1] < frexp(fb if u == a else fa)[1] - 50:
+                            c = (31 * u + (b if u == a else a)) / 32
+                        else:
+                            c = u + (1 if u == a else -1) * 4 * xtol * max(1.0, abs(u))
+                        if not a < c < b:
+                            c = 0.5 * (a + b)
+                elif b - a > self.MU * width:
+                    c = 0.5 * (a + b)
+                else:
+                    break
+
+                if not a < c < b:
+                    # `a` and `b` are consecutive floats.
+                    x0, fx0 = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+                    return x0, fx0, i, fcalls, False, "small bracket"
+                fc = yield c
+                fcalls += 1
+                e, fe = d, fd
+                a, b, fa, fb, d, fd = _bracket(a, b, fa, fb, c, fc)
+                if on_iteration is not None:
+                    on_iteration(self, i, fcalls, a, b, fa, fb)
+                if is_root(fc):
+                    return c, fc, i, fcalls, True, "convergence"
+
+                # check for the new bracket size.
+                if nearly_equal(a, b, xtol):
+                    x0, fx0 = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+                    return x0, fx0, i, fcalls, False, "small bracket"
+
+        x0, fx0 = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+        return x0, fx0, i, fcalls, False, "iterations"
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file pyroots/trace.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Recorders for the steps of the solvers.
+
+A recorder is created for each solve by the `history` factory of the solver. It must have an
+`append(x, fx)` method, which is called on each function evaluation, a `close()` method,
+which is called when the solve ends, and the `x_steps` and `fx_steps` attributes, which end
+up in the `Result`.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import os
+import struct
+import itertools
+import threading
+from array import array
+
+
+class ListTrace(object):
+    """ Records the steps in lists. This is what the solvers use by default. """
+
+    __slots__ = ("x_steps", "fx_steps")
+
+    def __init__(self):
+        self.x_steps = []
+        self.fx_steps = []
+
+    def append(self, x, fx):
+        self.x_steps.append(x)
+        self.fx_steps.append(fx)
+
+    def close(self):
+        pass
+
+
+class ArrayTrace(object):
+    """
+    Records the steps in `array('d')` buffers, i.e. 8 bytes per value.
+
+    If `maxlen` is given, the buffers are preallocated and used as ring buffers; only the last
+    `maxlen` steps are kept. `count` is the total number of recorded steps.
+
+    Use it as the `history` of a solver, e.g. `Brentq(history=ArrayTrace)` or
+    `Brentq(history=functools.partial(ArrayTrace, maxlen=16))`.
+
+    """
+
+    __slots__ = ("maxlen", "count", "_x", "_fx")
+
+    def __init__(self, maxlen=None):
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("maxlen must be a positive integer, not: %r" % maxlen)
+        self.maxlen = maxlen
+        self.count = 0
+        if maxlen is None:
+            self._x = array("d")
+            self._fx = array("d")
+        else:
+            self._x = array("d", [0.0]) * maxlen
+            self._fx = array("d", [0.0]) * maxlen
+
+    def append(self, x, fx):
+        if self.maxlen is None:
+            self._x.append(x)
+            self._fx.append(fx)
+        else:
+            index = self.count % self.maxlen
+            self._x[index] = x
+            self._fx[index] = fx
+        self.count += 1
+
+    def close(self):
+        pass
+
+    def _ordered(self, buffer):
+        if self.maxlen is None:
+            return buffer
+        if self.count <= self.maxlen:
+            return buffer[:self.count]
+        index = self.count % self.maxlen
+        return buffer[index:] + buffer[:index]
+
+    @property
+    def x_steps(self):
+        """ The recorded `x` values, oldest first. """
+        return self._ordered(self._x)
+
+    @property
+    def fx_steps(self):
+        """ The recorded `f(x)` values, oldest first. """
+        return self._ordered(self._fx)
+
+
+class FileTrace(object):
+    """
+    Appends the steps of all the solves to a binary file.
+
+    Each step is stored as a little-endian `(solve id, x, f(x))` record (the `RECORD` struct).
+    The steps of each solve are buffered and written in bulk. The solve ids are increasing
+    integers, one for each solve that used this `FileTrace`. The file can be read back with
+    `FileTrace.read()`.
+
+    Use the instance as the `history` of the solvers, e.g.::
+
+        with FileTrace("steps.bin") as trace:
+            solver = Brentq(history=trace)
+            ...
+
+    The `Result`'s steps are empty; they are only stored in the file. The steps of a solve
+    whose function raised are written too.
+
+    A `FileTrace` can be pickled, e.g. for `solve_many()`. The copies append to the same file;
+    the ids of their solves start from `pid << 32`, so they don't clash with each other.
+
+    """
+
+    RECORD = struct.Struct("<qdd")
+
+    def __init__(self, path, buffer_size=4096):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._file = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_file"], state["_lock"], state["_ids"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._file = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(os.getpid() << 32)
+
+    def __call__(self):
+        return _FileTraceRecorder(self, next(self._ids))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, solve_id, x_steps, fx_steps):
+        pack = self.RECORD.pack
+        data = b"".join(pack(solve_id, x, fx) for x, fx in zip(x_steps, fx_steps))
+        with self._lock:
+            if self._file is None:
+                # The steps are already buffered by the recorders. Without a buffer of its
+                # own, the file doesn't need to be closed (e.g. by a worker process) to be
+                # complete.
+                self._file = open(self.path, "ab", buffering=0)
+            self._file.write(data)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @classmethod
+    def read(cls, path):
+        """ Return a list with the `(solve id, x, f(x))` records of the file in `path`.  """
+        with open(path, "rb") as fobj:
+            return list(cls.RECORD.iter_unpack(fobj.read()))
+
+
+class _FileTraceRecorder(object):
+    """ The recorder of a single solve of a `FileTrace`.  """
+
+    __slots__ = ("trace", "solve_id", "_x", "_fx")
+
+    x_steps = ()
+    fx_steps = ()
+
+    def __init__(self, trace, solve_id):
+        self.trace = trace
+        self.solve_id = solve_id
+        self._x = array("d")
+        self._fx = array("d")
+
+    def append(self, x, fx):
+        self._x.append(x)
+        self._fx.append(fx)
+        if len(self._x) >= self.trace.buffer_size:
+            self._flush()
+
+    def _flush(self):
+        self.trace.write(self.solve_id, self._x, self._fx)
+        del self._x[:]
+        del self._fx[:]
+
+    def close(self):
+        if self._x:
+            self._flush()
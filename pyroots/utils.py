@@ -48,6 +48,11 @@ import sys
 
 # Constants
 EPS = sys.float_info.epsilon
+# The status code of a result is the index of its condition (i.e. of a key of
+# `BaseSolver.messages`) in this tuple.
+CONDITIONS = ("convergence", "lower bracket", "upper bracket", "small bracket", "no bracket", "iterations", "stagnant")
+CONVERGENCE, LOWER_BRACKET, UPPER_BRACKET, SMALL_BRACKET, NO_BRACKET, ITERATIONS, STAGNANT = range(len(CONDITIONS))
+STATUS = dict((condition, status) for status, condition in enumerate(CONDITIONS))
 LOG_MSG = "Iter: %3d; fcall: %3d; x=[% .{precision}f, % .{precision}f]; Δx=% .{precision}f; f=[% .{precision}f, %+.{precision}f]"
 
 
@@ -80,17 +85,19 @@ func calls : {func_calls:3d}
   fx_steps : {fx_steps}
 """.rstrip()
 
-    def __init__(self, x0, fx0, iterations, converged, xtol, epsilon, x_steps, fx_steps, msg=""):
+    def __init__(self, x0, fx0, iterations, converged, xtol, epsilon, x_steps, fx_steps, msg="", status=None, func_calls=None, profile=None):
         self.x0 = x0
         self.fx0 = fx0
         self.iterations = iterations
-        self.func_calls = len(fx_steps)
+        self.func_calls = len(fx_steps) if func_calls is None else func_calls
         self.converged = converged
         self.msg = msg
+        self.status = status
         self.xtol = xtol
         self.epsilon = epsilon
         self.x_steps = x_steps
         self.fx_steps = fx_steps
+        self.profile = profile
 
     def __repr__(self):
         if self.x0 is None:
@@ -100,6 +107,32 @@ func calls : {func_calls:3d}
         return representation.format(**self.__dict__)
 
 
+class LeanResult(object):
+    """
+    Solver's result without the history of the steps.
+
+    Instead of a message, it has a `status` code; `CONDITIONS[status]` is the key of the
+    message in `BaseSolver.messages`.
+
+    """
+
+    __slots__ = ("x0", "fx0", "iterations", "func_calls", "converged", "status", "profile")
+
+    def __init__(self, x0, fx0, iterations, func_calls, converged, status, profile=None):
+        self.x0 = x0
+        self.fx0 = fx0
+        self.iterations = iterations
+        self.func_calls = func_calls
+        self.converged = converged
+        self.status = status
+        self.profile = profile
+
+    def __repr__(self):
+        return "LeanResult(x0=%r, fx0=%r, iterations=%d, func_calls=%d, converged=%r, status=%d)" % (
+            self.x0, self.fx0, self.iterations, self.func_calls, self.converged, self.status
+        )
+
+
 def nearly_equal(a, b, epsilon):
     """
     Return `True` if the "difference" between `a` and `b` is smaller than `epsilon`, `False` otherwise.
@@ -159,5 +192,5 @@ class PyRootsError(Exception):
     pass
 
 
-class ConvergenceError(PyRootsError):
+class ConvergenceError(PyRootsError, RuntimeError):
     pass
@@ -16,9 +16,9 @@ from __future__ import absolute_import
 
 import pytest
 
-from pyroots import Bisect, Ridder, Brentq, Brenth
+from pyroots import Bisect, Ridder, Brentq, Brenth, Toms748, ITP, Chandrupatla, RegulaFalsi
 
 
-@pytest.fixture(params=[Bisect, Ridder, Brenth, Brentq])
+@pytest.fixture(params=[Bisect, Ridder, Brenth, Brentq, Toms748, ITP, Chandrupatla, RegulaFalsi])
 def Solver(request):
     return request.param
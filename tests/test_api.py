@@ -43,8 +43,12 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from __future__ import absolute_import
 
+import subprocess
+import sys
+
 import pytest
 
+import pyroots
 from pyroots.base import BaseSolver
 
 
@@ -64,3 +68,12 @@ class TestAPI(object):
         self.solver(f, 0, 7, v=2, w=3, y=3, z=4)
         # mix positional and keyword arguments
         self.solver(f, 0, 7, 2, w=3, z=4)
+
+
+def test_lazy_imports():
+    code = "import sys, pyroots; print(sorted(m for m in ('numpy', 'numba', 'asyncio', 'pyroots.kernels', 'pyroots.batch') if m in sys.modules))"
+    assert subprocess.check_output([sys.executable, "-c", code]).decode().strip() == "[]"
+    for name in pyroots.__all__ + ["kernels"]:
+        assert getattr(pyroots, name) is not None
+    with pytest.raises(AttributeError):
+        pyroots.missing
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_async.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for solving with coroutine functions.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import asyncio
+
+import pytest
+
+from pyroots import solve_many_async
+from pyroots.utils import ConvergenceError, nearly_equal
+
+
+async def f(x, a, b=0.0):
+    await asyncio.sleep(0)
+    return x ** 2 - a + b
+
+
+def test_solve_async_matches_the_sync_solver(Solver):
+    solver = Solver(epsilon=1e-10)
+    result = asyncio.run(solver.solve_async(f, 0, 3, 2, b=0.0))
+    expected = solver(lambda x, a, b: x ** 2 - a + b, 0, 3, 2, b=0.0)
+    assert result.converged
+    assert result.x0 == expected.x0
+    assert result.x_steps == expected.x_steps
+
+
+def test_solve_async_raises_on_fail(Solver):
+    with pytest.raises(ConvergenceError):
+        asyncio.run(Solver().solve_async(f, 5, 6, 2))
+    result = asyncio.run(Solver(raise_on_fail=False).solve_async(f, 5, 6, 2))
+    assert result.converged is False
+    assert result.msg == Solver.messages["no bracket"]
+
+
+def test_solve_async_known_bound_values(Solver):
+    solver = Solver(epsilon=1e-10)
+    expected = asyncio.run(solver.solve_async(f, 0, 3, 2))
+    result = asyncio.run(solver.solve_async(f, 0, 3, 2, fa=-2.0, fb=7.0))
+    assert result.x0 == expected.x0
+    assert result.func_calls == expected.func_calls - 2
+    assert result.x_steps == expected.x_steps[2:]
+
+
+def test_solve_async_profile(Solver):
+    result = asyncio.run(Solver(profile=1).solve_async(f, 0, 3, 2))
+    assert result.profile is not None
+    assert result.profile.calls == result.func_calls
+    assert 0 < result.profile.f_ns <= result.profile.total_ns
+    assert asyncio.run(Solver().solve_async(f, 0, 3, 2)).profile is None
+
+
+def test_solve_many_async(Solver):
+    a_values = [1.0 + i for i in range(100)]
+    results = asyncio.run(solve_many_async(Solver(epsilon=1e-10), f, [(0, 20)] * 100, [(a,) for a in a_values], limit=10))
+    for a, result in zip(a_values, results):
+        assert result.converged
+        assert nearly_equal(result.x0, a ** 0.5, 1e-8)
+
+
+def test_solve_many_async_respects_the_limit(Solver):
+    running = []
+    peak = []
+
+    async def g(x):
+        running.append(x)
+        peak.append(len(running))
+        await asyncio.sleep(0.001)
+        running.remove(x)
+        return x - 1
+
+    asyncio.run(solve_many_async(Solver(), g, [(0, 3)] * 20, limit=4))
+    assert max(peak) == 4
+
+
+def test_solve_many_async_known_bound_values(Solver):
+    brackets = [(0, 20, -2.0, 398.0), (0, 20)]
+    results = asyncio.run(solve_many_async(Solver(), f, brackets, [(2.0,), (2.0,)]))
+    assert results[0].x0 == results[1].x0
+    assert results[0].func_calls == results[1].func_calls - 2
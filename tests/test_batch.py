@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_batch.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for the vectorized batch solvers.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from math import pi
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyroots import Brentq, Brenth, Chandrupatla, BatchBisect, BatchBrentq, BatchBrenth, BatchChandrupatla
+from pyroots.utils import ConvergenceError
+
+
+@pytest.fixture(params=[(BatchBrentq, Brentq), (BatchBrenth, Brenth), (BatchChandrupatla, Chandrupatla)])
+def solvers(request):
+    return request.param
+
+
+def test_lanes_match_the_scalar_solver(solvers):
+    BatchSolver, Solver = solvers
+    f = lambda x, a: x ** 3 - x ** 2 - 3 * x + a
+    xa = np.array([-2.5, 0.0, 1.0, -1e-8, 1.0, -3.0, 0.5])
+    xb = np.array([0.0, 1.0, 2.5, -2e-8, 2.0, 3.0, 1.5])
+    a = np.array([2.0, 2.0, 2.0, 2.0, 10.0, -1.0, 0.5])
+    batch = BatchSolver(epsilon=1e-10, xtol=1e-6)(f, xa, xb, a)
+    solver = Solver(epsilon=1e-10, xtol=1e-6, raise_on_fail=False)
+    for lane in range(len(xa)):
+        result = solver(f, xa[lane], xb[lane], a[lane])
+        assert batch.converged[lane] == result.converged
+        assert batch.iterations[lane] == result.iterations
+        assert batch.func_calls[lane] == result.func_calls
+        assert solver.messages[batch.conditions[lane]] == result.msg
+        if result.x0 is not None:
+            assert batch.x0[lane] == result.x0
+            assert batch.fx0[lane] == result.fx0
+
+
+def test_chandrupatla_lanes_match_the_scalar_solver():
+    f = lambda x, a: np.exp(x) * x - a
+    a = np.linspace(0.1, 100.0, 200)
+    xa, xb = np.full_like(a, -1.0), np.linspace(4.0, 6.0, 200)
+    batch = BatchChandrupatla(epsilon=1e-12)(f, xa, xb, a)
+    solver = Chandrupatla(epsilon=1e-12, raise_on_fail=False)
+    for lane in range(len(a)):
+        result = solver(lambda x: np.exp(x) * x - a[lane], xa[lane], xb[lane])
+        assert batch.x0[lane] == result.x0
+        assert batch.func_calls[lane] == result.func_calls
+        assert batch.iterations[lane] == result.iterations
+
+
+def test_bracket_conditions(solvers):
+    BatchSolver, _ = solvers
+    f = lambda x: x
+    xa = np.array([-1e-4, -1.0, 1.0, -1e-8, -1.0])
+    xb = np.array([1.0, 1e-4, 2.0, -2e-8, 1.0])
+    result = BatchSolver(epsilon=1e-2, xtol=1e-4)(f, xa, xb)
+    assert result.conditions == ["lower bracket", "upper bracket", "no bracket", "small bracket", "convergence"]
+    assert result.converged.tolist() == [True, True, False, False, True]
+    assert result.func_calls.tolist() == [1, 2, 2, 0, 3]
+
+
+def test_shared_and_keyword_arguments(solvers):
+    BatchSolver, _ = solvers
+    f = lambda x, a, b=0.0: x ** 2 - a + b
+    a = np.linspace(1.0, 100.0, 50)
+    result = BatchSolver(epsilon=1e-12)(f, np.zeros_like(a), np.full_like(a, 20.0), a, b=0.0)
+    assert result.converged.all()
+    assert np.allclose(result.x0, np.sqrt(a))
+
+
+def test_max_iterations(solvers):
+    BatchSolver, _ = solvers
+    f = lambda x: x ** 3 - x - 2
+    result = BatchSolver(max_iter=1)(f, [1.0, 1.0], [2.0, 2.0])
+    assert result.conditions == ["iterations", "iterations"]
+    assert result.iterations.tolist() == [1, 1]
+    assert result.func_calls.tolist() == [3, 3]
+
+
+def test_raise_on_fail(solvers):
+    BatchSolver, _ = solvers
+    f = lambda x: np.tan(x)
+    with pytest.raises(ConvergenceError):
+        BatchSolver(raise_on_fail=True)(f, [pi / 2 + 0.1, -1.0], [pi / 2 - 0.1, 1.0])
+
+
+def test_bisect_takes_a_fixed_number_of_iterations():
+    f = lambda x, a: x ** 2 - a
+    a = np.array([0.5, 2.0, 3.0, 50.0])
+    xtol = 1e-9
+    solver = BatchBisect(epsilon=1e-6, xtol=xtol)
+    required = solver.required_iterations(np.zeros_like(a), np.full_like(a, 10.0))
+    assert 2 ** -required * 10.0 <= xtol < 2 ** -(required - 1) * 10.0
+    result = solver(f, np.zeros_like(a), np.full_like(a, 10.0), a)
+    assert result.iterations.tolist() == [required] * len(a)
+    assert result.func_calls.tolist() == [required + 2] * len(a)
+    assert result.converged.all()
+    assert np.allclose(result.x0, np.sqrt(a), atol=1e-8)
+
+
+def test_bisect_bracket_conditions():
+    f = lambda x: x
+    xa = np.array([-1e-4, -1.0, 1.0, -1e-8, -1.0])
+    xb = np.array([1.0, 1e-4, 2.0, -2e-8, 1.0])
+    result = BatchBisect(epsilon=1e-2, xtol=1e-4)(f, xa, xb)
+    assert result.conditions == ["lower bracket", "upper bracket", "no bracket", "small bracket", "convergence"]
+    assert result.x0[0] == xa[0]
+    assert result.x0[1] == xb[1]
+
+
+def test_bisect_without_iterations():
+    f = lambda x: x ** 3 - x - 2
+    result = BatchBisect(max_iter=0)(f, [1.0, 0.0], [2.0, 3.0])
+    assert result.conditions == ["iterations", "iterations"]
+    assert result.iterations.tolist() == [0, 0]
+    assert result.func_calls.tolist() == [2, 2]
+    assert result.x0.tolist() == [2.0, 3.0]
+
+
+def test_bisect_non_finite_brackets():
+    f = lambda x, a: x ** 2 - a
+    inf = float("inf")
+    xa = np.array([0.0, -inf, 0.0, np.nan])
+    xb = np.array([10.0, 10.0, inf, 10.0])
+    solver = BatchBisect(epsilon=1e-10)
+    assert solver.required_iterations(xa, xb) == solver.required_iterations(xa[:1], xb[:1])
+    result = solver(f, xa, xb, np.full(4, 2.0))
+    assert result.conditions == ["convergence", "no bracket", "no bracket", "no bracket"]
+    assert np.isclose(result.x0[0], 2.0 ** 0.5)
+    assert np.isnan(result.x0[1:]).all()
+
+
+def test_bisect_max_iterations():
+    f = lambda x: x ** 3 - x - 2
+    result = BatchBisect(max_iter=3)(f, [1.0], [2.0])
+    assert result.conditions == ["iterations"]
+    assert result.iterations.tolist() == [3]
+
+
+def test_bisect_as_fallback():
+    # Brent gets stuck on the pole of `tan`, bisection closes the bracket anyway.
+    f = lambda x: np.tan(x)
+    xa = np.array([pi / 2 + 0.1, -1.0])
+    xb = np.array([pi / 2 - 0.1, 1.0])
+    result = BatchBrentq(xtol=1e-6)(f, xa, xb)
+    failed = ~result.converged
+    assert failed.tolist() == [True, False]
+    fallback = BatchBisect(xtol=1e-6)(f, xa[failed], xb[failed])
+    assert np.allclose(fallback.x0, pi / 2, atol=1e-6)
+
+
+@pytest.mark.parametrize("BatchSolver", [BatchBisect, BatchBrentq, BatchBrenth, BatchChandrupatla])
+def test_solve_with_known_bound_values(BatchSolver):
+    a = np.array([2.0, 3.0, 5.0])
+    f = lambda x, a: x ** 2 - a
+    xa, xb = np.zeros_like(a), np.full_like(a, 3.0)
+    known = BatchSolver(epsilon=1e-10).solve(f, xa, xb, fa=f(xa, a), fb=f(xb, a), args=(a,))
+    evaluated = BatchSolver(epsilon=1e-10)(f, xa, xb, a)
+    assert np.array_equal(known.x0, evaluated.x0)
+    assert np.array_equal(known.func_calls, evaluated.func_calls - 2)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_bracket.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for the bracket discovery.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import pytest
+
+from pyroots import find_bracket
+from pyroots.utils import ConvergenceError
+
+
+def f(x, a=2):
+    return x ** 2 - a
+
+
+class Counted(object):
+    def __init__(self, f):
+        self.f = f
+        self.xs = []
+
+    def __call__(self, x, *args, **kwargs):
+        self.xs.append(x)
+        return self.f(x, *args, **kwargs)
+
+
+@pytest.mark.parametrize("x0", [0.5, 1.0, 1.4, 3.0, 10.0, -0.5])
+def test_find_bracket(x0):
+    counted = Counted(f)
+    bracket = find_bracket(counted, x0)
+    assert bracket.found
+    assert bracket.xa < bracket.xb
+    assert bracket.fa == f(bracket.xa)
+    assert bracket.fb == f(bracket.xb)
+    assert bracket.fa * bracket.fb <= 0
+    assert bracket.func_calls == len(counted.xs)
+    assert bracket.xa in counted.xs and bracket.xb in counted.xs
+
+
+def test_find_bracket_close_roots():
+    # the secant steps don't step over a pair of close roots
+    bracket = find_bracket(lambda x: (x - 3) ** 2 - 1e-6, 0.0)
+    assert bracket.found
+    assert bracket.xa <= 2.999 <= bracket.xb < 3.001
+
+
+def test_find_bracket_args():
+    bracket = find_bracket(f, 0.5, args=(9,))
+    assert bracket.xa <= 3 <= bracket.xb
+    assert find_bracket(f, 0.5, kwargs={"a": 9}) == bracket
+
+
+def test_find_bracket_domain():
+    bracket = find_bracket(f, 0.0, lower=-1, upper=1)
+    assert not bracket.found
+    assert (bracket.xa, bracket.xb) == (-1, 1)
+    # The guess may be on the limit of the domain
+    bracket = find_bracket(f, 5.0, upper=5.0)
+    assert bracket.found
+    assert bracket.xb <= 5.0
+    with pytest.raises(ValueError):
+        find_bracket(f, 2.0, lower=3.0)
+    with pytest.raises(ValueError):
+        find_bracket(f, 2.0, factor=1.0)
+
+
+def test_find_bracket_not_found():
+    bracket = find_bracket(lambda x: x ** 2 + 1, 0.0, max_iter=10)
+    assert not bracket.found
+    assert bracket.func_calls == 12
+
+
+def test_solve_from_guess(Solver):
+    counted = Counted(f)
+    result = Solver().solve_from_guess(counted, 0.5, step=0.1)
+    assert result.converged
+    assert result.x0 == pytest.approx(2 ** 0.5)
+    # the bracket is not evaluated again.
+    assert len(counted.xs) == len(set(counted.xs)) == result.func_calls
+    assert result.x_steps == counted.xs
+
+
+def test_solve_from_guess_lean(Solver):
+    counted = Counted(f)
+    result = Solver(history=False).solve_from_guess(counted, 10.0, args=(3,))
+    assert result.converged
+    assert result.x0 == pytest.approx(3 ** 0.5)
+    assert result.func_calls == len(counted.xs)
+
+
+def test_solve_from_guess_no_bracket(Solver):
+    g = lambda x: x ** 2 + 1
+    with pytest.raises(ConvergenceError):
+        Solver().solve_from_guess(g, 0.0, lower=-1, upper=1)
+    result = Solver(raise_on_fail=False).solve_from_guess(g, 0.0, lower=-1, upper=1)
+    assert not result.converged
+    assert result.msg == "Root is not bracketed."
+
+
+def test_find_brackets():
+    np = pytest.importorskip("numpy")
+    from pyroots.batch import find_brackets
+    a = np.array([2.0, 3.0, 5.0, 100.0, -1.0])
+    x0 = np.array([0.5, 1.0, 10.0, 0.1, 0.0])
+    brackets = find_brackets(f, x0, args=(a,), max_iter=20)
+    for i in range(len(a)):
+        bracket = find_bracket(f, x0[i], args=(a[i],), max_iter=20)
+        assert brackets.xa[i] == bracket.xa
+        assert brackets.xb[i] == bracket.xb
+        assert brackets.func_calls[i] == bracket.func_calls
+        assert brackets.found[i] == bracket.found
+
+
+def test_batch_solve_from_guess():
+    np = pytest.importorskip("numpy")
+    from pyroots import BatchBrentq
+    a = np.linspace(1, 100, 50)
+    result = BatchBrentq(epsilon=1e-10).solve_from_guess(f, np.ones_like(a), lower=0, args=(a,))
+    assert result.converged.all()
+    assert np.allclose(result.x0, np.sqrt(a))
+    assert (result.func_calls >= 2).all()
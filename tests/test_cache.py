@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_cache.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for the evaluation cache.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import threading
+
+import pytest
+
+from pyroots import CachedFunction, Bisect, Newton
+from pyroots.cache import hashable
+
+
+class Counted(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, x, a=2, **kwargs):
+        self.calls += 1
+        return x ** 2 - a
+
+
+def test_hits_and_misses():
+    f = Counted()
+    cached = CachedFunction(f)
+    assert cached(3) == 7
+    assert cached(3) == 7
+    assert cached(3, 4) == 5
+    assert cached(3, a=4) == 5
+    assert f.calls == 3
+    assert (cached.hits, cached.misses) == (1, 3)
+    assert len(cached) == 3
+
+
+def test_lru_eviction():
+    f = Counted()
+    cached = CachedFunction(f, maxsize=2)
+    cached(1)
+    cached(2)
+    cached(1)       # 1 becomes the most recently used
+    cached(3)       # evicts 2
+    assert len(cached) == 2
+    cached(1)
+    assert f.calls == 3
+    cached(2)
+    assert f.calls == 4
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        CachedFunction(Counted(), maxsize=0)
+
+
+def test_clear():
+    cached = CachedFunction(Counted())
+    cached(1)
+    cached(1)
+    cached.clear()
+    assert (len(cached), cached.hits, cached.misses) == (0, 0, 0)
+
+
+def test_unhashable_arguments():
+    f = Counted()
+    cached = CachedFunction(f)
+    cached(1, a=2, options={"tol": [1, 2]})
+    cached(1, a=2, options={"tol": [1, 2]})
+    assert f.calls == 1
+    cached(1, a=2, options={"tol": [1, 3]})
+    assert f.calls == 2
+
+
+def test_hashable():
+    assert hashable(1.5) == 1.5
+    assert hashable([1, [2, 3]]) == (1, (2, 3))
+    assert hashable({"b": 1, "a": {2}}) == (("a", frozenset([2])), ("b", 1))
+    with pytest.raises(TypeError):
+        hashable([object.__new__(type("Unhashable", (object,), {"__hash__": None}))])
+
+
+def test_hashable_arrays():
+    np = pytest.importorskip("numpy")
+    assert hashable(np.arange(3.0)) == hashable(np.arange(3.0))
+    assert hashable(np.arange(3.0)) != hashable(np.arange(3))
+    assert hashable(np.arange(4.0).reshape(2, 2)) != hashable(np.arange(4.0))
+
+
+def test_shared_between_solvers(Solver):
+    f = Counted()
+    cached = CachedFunction(f)
+    first = Solver()(cached, 0, 20, 2)
+    calls = f.calls
+    second = Solver()(cached, 0, 20, 2)
+    assert first.x0 == second.x0
+    assert f.calls == calls
+    assert cached.hits == second.func_calls
+
+
+@pytest.mark.parametrize("order", [(Newton, Bisect), (Bisect, Newton)])
+def test_shared_between_newton_and_bracketing_solvers(order):
+    # `Newton` evaluates `f` on dual numbers, which compare equal to their real part.
+    cached = CachedFunction(Counted())
+    expected = dict((Solver, Solver()(Counted(), 0, 3)) for Solver in order)
+    for Solver in order:
+        result = Solver()(cached, 0, 3)
+        assert result.x0 == expected[Solver].x0
+        assert result.iterations == expected[Solver].iterations
+        assert isinstance(result.fx0, float)
+
+
+def test_thread_safety():
+    f = Counted()
+    cached = CachedFunction(f, maxsize=50)
+
+    def work():
+        for x in range(200):
+            assert cached(x % 75) == (x % 75) ** 2 - 2
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cached) <= 50
+    assert cached.hits + cached.misses == 800
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_dual.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Tests for the dual numbers and `pyroots.dmath`.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+import pytest
+
+from pyroots import Dual, HyperDual, dmath
+
+
+# (function, first derivative, second derivative, x)
+FUNCTIONS = [
+    (lambda x: 3 * x * x - x / 2 + 1, lambda x: 6 * x - 0.5, lambda x: 6, 0.7),
+    (lambda x: 1 / (1 + x) - (2 - x) / x, lambda x: -1 / (1 + x) ** 2 + 2 / x ** 2, lambda x: 2 / (1 + x) ** 3 - 4 / x ** 3, 0.7),
+    (lambda x: x ** 3.5, lambda x: 3.5 * x ** 2.5, lambda x: 8.75 * x ** 1.5, 0.7),
+    (lambda x: 2 ** x, lambda x: 2 ** x * math.log(2), lambda x: 2 ** x * math.log(2) ** 2, 0.7),
+    (lambda x: x ** x, lambda x: x ** x * (math.log(x) + 1), lambda x: x ** x * ((math.log(x) + 1) ** 2 + 1 / x), 0.7),
+    (dmath.sqrt, lambda x: 0.5 / math.sqrt(x), lambda x: -0.25 * x ** -1.5, 0.7),
+    (dmath.exp, math.exp, math.exp, 0.7),
+    (dmath.log, lambda x: 1 / x, lambda x: -1 / x ** 2, 0.7),
+    (dmath.log10, lambda x: 1 / (x * math.log(10)), lambda x: -1 / (x * x * math.log(10)), 0.7),
+    (dmath.sin, math.cos, lambda x: -math.sin(x), 0.7),
+    (dmath.cos, lambda x: -math.sin(x), lambda x: -math.cos(x), 0.7),
+    (dmath.tan, lambda x: 1 / math.cos(x) ** 2, lambda x: 2 * math.tan(x) / math.cos(x) ** 2, 0.7),
+    (dmath.asin, lambda x: 1 / math.sqrt(1 - x * x), lambda x: x / (1 - x * x) ** 1.5, 0.7),
+    (dmath.atan, lambda x: 1 / (1 + x * x), lambda x: -2 * x / (1 + x * x) ** 2, 0.7),
+    (dmath.tanh, lambda x: 1 / math.cosh(x) ** 2, lambda x: -2 * math.tanh(x) / math.cosh(x) ** 2, 0.7),
+    (dmath.acosh, lambda x: 1 / math.sqrt(x * x - 1), lambda x: -x / (x * x - 1) ** 1.5, 1.7),
+    (dmath.erf, lambda x: 2 / math.sqrt(math.pi) * math.exp(-x * x), lambda x: -4 * x / math.sqrt(math.pi) * math.exp(-x * x), 0.7),
+    (lambda x: abs(dmath.sin(x) - 1), lambda x: -math.cos(x), lambda x: math.sin(x), 0.7),
+]
+
+
+@pytest.mark.parametrize("f, df, d2f, x", FUNCTIONS)
+def test_derivatives(f, df, d2f, x):
+    dual = f(Dual(x, 1.0))
+    hyper = f(HyperDual(x, 1.0, 1.0, 0.0))
+    assert dual.real == hyper.real == pytest.approx(f(x), rel=1e-15)
+    assert dual.dual == pytest.approx(df(x), rel=1e-12)
+    assert hyper.e1 == hyper.e2 == pytest.approx(df(x), rel=1e-12)
+    assert hyper.e12 == pytest.approx(d2f(x), rel=1e-12)
+
+
+def test_dmath_on_floats():
+    assert dmath.sin(0.7) == math.sin(0.7)
+    assert dmath.log(8, 2) == math.log(8, 2)
+    assert dmath.hypot(3, 4) == 5.0
+
+
+def test_comparisons():
+    x = Dual(2.0, 1.0)
+    assert x > 1 and x < 3 and x == 2 and 1 < x
+    assert HyperDual(2.0, 1.0) <= Dual(2.0)
+    assert max(x, 1.0) is x
+
+
+def test_no_float_conversion():
+    # `math` would silently drop the derivative.
+    with pytest.raises(TypeError):
+        math.sin(Dual(0.7, 1.0))
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_exporter.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Tests for the trace exporter.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import io
+import json
+import pickle
+import asyncio
+
+import pytest
+
+from pyroots import Brentq, Ridder, BatchBrentq, TraceExporter, solve_many, solve_many_async, solve_many_threaded
+
+
+cubic = lambda x: x ** 3 - x ** 2 - 3 * x + 2
+
+
+def square(x, a):
+    return x ** 2 - a
+
+
+def test_chrome(tmpdir):
+    path = str(tmpdir.join("trace.json"))
+    with TraceExporter(path, iterations=True) as exporter:
+        solver = Brentq(hooks=[exporter])
+        result = solver(cubic, 0.5, 1.5)
+    events = json.load(open(path))
+    assert all(event["ph"] == "X" for event in events)
+    solves = [event for event in events if event["cat"] == "solve"]
+    iterations = [event for event in events if event["cat"] == "iteration"]
+    assert len(solves) == 1
+    assert solves[0]["name"] == "Brentq"
+    assert solves[0]["args"]["x0"] == result.x0
+    assert solves[0]["args"]["func_calls"] == result.func_calls
+    assert solves[0]["args"]["condition"] == "convergence"
+    assert len(iterations) > result.iterations
+    assert iterations[0]["name"] == "bounds"
+    assert set(event["name"] for event in iterations[1:]) <= {"interpolate", "extrapolate", "bisect"}
+
+
+def test_jsonl():
+    stream = io.StringIO()
+    exporter = TraceExporter(stream, format="jsonl")
+    solver = Ridder(hooks=[exporter], raise_on_fail=False)
+    solver(cubic, 0.5, 1.5)
+    solver(lambda x: x, 1, 2)
+    exporter.close()
+    assert not stream.closed
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record["type"] for record in records] == ["solve", "solve"]
+    assert [record["condition"] for record in records] == ["convergence", "no bracket"]
+
+
+def test_buffering():
+    stream = io.StringIO()
+    exporter = TraceExporter(stream, format="jsonl", buffer_size=3)
+    solver = Brentq(hooks=[exporter])
+    for _ in range(2):
+        solver(cubic, 0.5, 1.5)
+    assert stream.getvalue() == ""
+    solver(cubic, 0.5, 1.5)
+    assert len(stream.getvalue().splitlines()) == 3
+    solver(cubic, 0.5, 1.5)
+    exporter.flush()
+    assert len(stream.getvalue().splitlines()) == 4
+
+
+def test_empty_chrome():
+    stream = io.StringIO()
+    TraceExporter(stream).close()
+    assert json.loads(stream.getvalue()) == []
+
+
+def test_batch():
+    np = pytest.importorskip("numpy")
+    stream = io.StringIO()
+    exporter = TraceExporter(stream, format="jsonl", iterations=True)
+    solver = BatchBrentq(hooks=[exporter])
+    solver(lambda x, c: x ** 2 - c, np.zeros(3), np.full(3, 3.0), np.array([1.0, 2.0, 4.0]))
+    exporter.close()
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(records) == 1
+    assert records[0]["name"] == "BatchBrentq"
+    assert records[0]["problems"] == 3
+
+
+def _solves(stream):
+    """ Return the `(solve, iterations)` of the records of a JSON-lines export.  """
+    solves = []
+    for line in stream.getvalue().splitlines():
+        record = json.loads(line)
+        if record["type"] == "solve":
+            solves.append((record, []))
+        else:
+            solves[-1][1].append(record)
+    return solves
+
+
+def test_concurrent_async_solves():
+    async def f(x, a):
+        await asyncio.sleep(0)
+        return x ** 2 - a
+
+    brackets, args_list = [(0, 3), (10, 20)], [(2.0,), (200.0,)]
+    expected = io.StringIO()
+    with TraceExporter(expected, format="jsonl", iterations=True) as exporter:
+        for (xa, xb), args in zip(brackets, args_list):
+            asyncio.run(Brentq(hooks=[exporter]).solve_async(f, xa, xb, *args))
+    stream = io.StringIO()
+    with TraceExporter(stream, format="jsonl", iterations=True) as exporter:
+        asyncio.run(solve_many_async(Brentq(hooks=[exporter]), f, brackets, args_list))
+    solves = sorted(_solves(stream), key=lambda solve: solve[0]["xa"])
+    assert len(solves) == 2
+    for (solve, iterations), (expected_solve, expected_iterations) in zip(solves, _solves(expected)):
+        assert (solve["xa"], solve["xb"], solve["x0"]) == (expected_solve["xa"], expected_solve["xb"], expected_solve["x0"])
+        assert [(it["name"], it["xa"], it["xb"]) for it in iterations] == [(it["name"], it["xa"], it["xb"]) for it in expected_iterations]
+
+
+def test_pickle(tmpdir):
+    path = str(tmpdir.join("trace.json"))
+    with TraceExporter(path) as exporter:
+        clone = pickle.loads(pickle.dumps(Brentq(hooks=[exporter]))).hooks[0]
+        clone.buffer_size = 1
+        Brentq(hooks=[clone])(cubic, 0.5, 1.5)
+        assert len(clone._drain()) == 1
+        clone.close()
+    assert json.load(open(path)) == []
+
+
+def test_solve_many_workers_report_to_the_parent(tmpdir):
+    path = str(tmpdir.join("trace.json"))
+    with TraceExporter(path) as exporter:
+        solver = Brentq(hooks=[exporter])
+        results = solve_many(solver, square, [(0, 10)] * 30, [(a,) for a in range(1, 31)], workers=2)
+    solves = json.load(open(path))
+    assert len(solves) == 30
+    assert sorted(solve["args"]["x0"] for solve in solves) == sorted(result.x0 for result in results)
+
+
+def test_solve_many_threaded_exports_the_iterations():
+    brackets, args_list = [(0, 10)] * 20, [(a,) for a in range(1, 21)]
+    exports = []
+    for solve in (solve_many, solve_many_threaded):
+        stream = io.StringIO()
+        with TraceExporter(stream, format="jsonl", iterations=True) as exporter:
+            solve(Brentq(hooks=[exporter]), square, brackets, args_list, workers=1 if solve is solve_many else 4)
+        exports.append(sorted((solve["xa"], solve["x0"], len(iterations)) for solve, iterations in _solves(stream)))
+    assert exports[0] == exports[1]
+    assert all(iterations > 0 for _, _, iterations in exports[1])
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        TraceExporter(io.StringIO(), format="csv")
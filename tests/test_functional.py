@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_functional.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Tests for the functions with the signatures of `scipy.optimize`.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+import pytest
+
+from pyroots import functional
+from pyroots import ConvergenceError
+
+
+NAMES = ["bisect", "ridder", "brentq", "brenth"]
+
+PROBLEMS = [
+    (lambda x: x ** 3 - x ** 2 - 3 * x + 2, 0.5, 1.5),
+    (lambda x: math.sin(x) - x / 2, math.pi / 2, math.pi),
+    (lambda x: x ** 3 - 2 * x - 5, 2, 3),
+    (lambda x: math.exp(x) - 2, -4, 4 / 3),
+    (lambda x: x ** 20 - 1, 0, 5),
+    (lambda x: math.tanh(x - 0.3) ** 3, -1, 2),
+    (lambda x: x - 1, 1, 3),
+    (lambda x: x - 3, 1, 3),
+]
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_roots(name):
+    solve = getattr(functional, name)
+    for f, a, b in PROBLEMS[:5]:
+        root, results = solve(f, a, b, full_output=True)
+        assert results.converged
+        assert results.flag == "converged"
+        assert results.method == name
+        assert results.root == root
+        assert solve(f, a, b) == root
+        assert abs(f(root)) < 1e-9
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_same_steps_as_scipy(name):
+    optimize = pytest.importorskip("scipy.optimize")
+    for f, a, b in PROBLEMS:
+        for xtol in (2e-12, 1e-6):
+            expected = getattr(optimize, name)(f, a, b, xtol=xtol, full_output=True, disp=False)
+            root, results = getattr(functional, name)(f, a, b, xtol=xtol, full_output=True, disp=False)
+            assert root == expected[0]
+            assert results.iterations == expected[1].iterations
+            assert results.function_calls == expected[1].function_calls
+            assert results.converged == expected[1].converged
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_args(name):
+    solve = getattr(functional, name)
+    assert solve(lambda x, c: x ** 2 - c, 0, 3, args=(4,)) == pytest.approx(2)
+    assert solve(lambda x, c: x ** 2 - c, 0, 3, args=4) == pytest.approx(2)
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_errors(name):
+    solve = getattr(functional, name)
+    with pytest.raises(ValueError):
+        solve(lambda x: x, 1, 2)
+    with pytest.raises(ValueError):
+        solve(lambda x: x, -1, 2, xtol=0)
+    with pytest.raises(ValueError):
+        solve(lambda x: x, -1, 2, rtol=1e-17)
+    with pytest.raises(ConvergenceError):
+        solve(math.sin, 3, 4, maxiter=2)
+    with pytest.raises(RuntimeError):
+        solve(math.sin, 3, 4, maxiter=2)
+    root, results = solve(math.sin, 3, 4, maxiter=2, full_output=True, disp=False)
+    assert not results.converged
+    assert results.flag == "convergence error"
+    assert results.iterations == 2
+
+
+def test_submodules_are_not_shadowed():
+    import pyroots.bisect
+    import pyroots.ridder
+    from pyroots import Bisect, Ridder
+
+    assert pyroots.bisect.Bisect is Bisect
+    assert pyroots.ridder.Ridder is Ridder
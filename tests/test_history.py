@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_history.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for the solvers that don't record the history of the steps.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import asyncio
+
+import pytest
+
+from pyroots.utils import CONDITIONS, ConvergenceError, LeanResult, Result
+
+
+linear = lambda x: x
+cubic = lambda x: x ** 3 - x ** 2 - 3 * x + 2
+
+
+@pytest.mark.parametrize("f, a, b", [
+    (linear, -1e-4, 1),         # lower bracket
+    (linear, -1, 1e-4),         # upper bracket
+    (linear, 1, 2),             # no bracket
+    (linear, -1e-8, -2e-8),     # small bracket
+    (cubic, 0.5, 1.5),
+    (cubic, 1, 2.5),
+])
+def test_lean_result_matches_the_full_one(Solver, f, a, b):
+    full = Solver(epsilon=1e-2, xtol=1e-4, raise_on_fail=False)(f, a, b)
+    lean = Solver(epsilon=1e-2, xtol=1e-4, raise_on_fail=False, history=False)(f, a, b)
+    assert isinstance(full, Result)
+    assert isinstance(lean, LeanResult)
+    assert (lean.x0, lean.fx0, lean.iterations, lean.converged) == (full.x0, full.fx0, full.iterations, full.converged)
+    assert lean.func_calls == full.func_calls
+    assert lean.status == full.status
+    assert Solver.messages[CONDITIONS[lean.status]] == full.msg
+
+
+def test_lean_result_has_no_dict(Solver):
+    result = Solver(history=False)(lambda x: x - 1, 0, 3)
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(result, "x_steps")
+    assert "LeanResult" in repr(result)
+
+
+def test_lean_raise_on_fail(Solver):
+    with pytest.raises(ConvergenceError):
+        Solver(history=False)(lambda x: x, 1, 2)
+
+
+def test_lean_sweep(Solver):
+    f = lambda x, p: x ** 3 + x - p
+    ps = [1 + 0.05 * i for i in range(20)]
+    lean = Solver(epsilon=1e-10, history=False).sweep(f, ps, -5, 5)
+    full = Solver(epsilon=1e-10).sweep(f, ps, -5, 5)
+    assert [result.x0 for result in lean] == [result.x0 for result in full]
+    assert [result.func_calls for result in lean] == [result.func_calls for result in full]
+
+
+def test_lean_solve_async(Solver):
+    async def f(x):
+        return x ** 2 - 2
+
+    lean = asyncio.run(Solver(epsilon=1e-10, history=False).solve_async(f, 0, 2))
+    full = Solver(epsilon=1e-10)(lambda x: x ** 2 - 2, 0, 2)
+    assert isinstance(lean, LeanResult)
+    assert (lean.x0, lean.func_calls) == (full.x0, full.func_calls)
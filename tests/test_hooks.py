@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_hooks.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for the hooks of the solvers.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import pickle
+import logging
+
+import pytest
+
+from pyroots import Hook, LoggingHook
+from pyroots.hooks import dispatcher
+from pyroots.utils import ConvergenceError
+
+
+f = lambda x: x ** 3 - x - 2
+
+
+class Recorder(Hook):
+    def __init__(self):
+        self.events = []
+
+    def on_start(self, solver, xa, xb):
+        self.events.append(("start", xa, xb))
+
+    def on_iteration(self, solver, i, fcalls, xa, xb, fa, fb):
+        self.events.append(("iteration", i, fcalls))
+
+    def on_finish(self, solver, result):
+        self.events.append(("finish", result.converged))
+
+    def on_fail(self, solver, result):
+        self.events.append(("fail", result.converged))
+
+
+class FinishCounter(Hook):
+    def __init__(self):
+        self.count = 0
+
+    def on_finish(self, solver, result):
+        self.count += 1
+
+
+def test_no_hooks_no_dispatch(Solver, caplog):
+    solver = Solver()
+    assert solver._on_start is solver._on_iteration is solver._on_finish is solver._on_fail is None
+    with caplog.at_level(logging.DEBUG, logger="pyroots"):
+        solver(f, 1, 2)
+    assert not caplog.records
+
+
+def test_only_overridden_events_are_dispatched(Solver):
+    solver = Solver(hooks=[FinishCounter()])
+    assert solver._on_finish is not None
+    assert solver._on_start is solver._on_iteration is solver._on_fail is None
+    assert dispatcher([Hook()], "on_iteration") is None
+
+
+def test_events(Solver):
+    recorder = Recorder()
+    result = Solver(hooks=[recorder])(f, 1, 2)
+    events = recorder.events
+    assert events[0] == ("start", 1, 2)
+    assert events[-1] == ("finish", True)
+    iterations = [event for event in events if event[0] == "iteration"]
+    assert iterations
+    assert iterations[-1][2] == result.func_calls
+
+
+def test_fail_event(Solver):
+    recorder = Recorder()
+    with pytest.raises(ConvergenceError):
+        Solver(hooks=[recorder])(f, 2, 3)
+    assert recorder.events[-1] == ("fail", False)
+
+
+def test_multiple_hooks(Solver):
+    counters = [FinishCounter(), FinishCounter()]
+    solver = Solver(hooks=counters[:1])
+    solver.add_hook(counters[1])
+    solver(f, 1, 2)
+    assert [counter.count for counter in counters] == [1, 1]
+
+
+def test_logging_hook(Solver, caplog):
+    with caplog.at_level(logging.DEBUG, logger="pyroots"):
+        Solver(hooks=[LoggingHook()])(f, 1, 2)
+    levels = [record.levelno for record in caplog.records]
+    assert logging.DEBUG in levels
+    assert levels[-1] == logging.INFO
+    assert caplog.records[-1].getMessage().startswith("Solution converged")
+
+
+def test_pickling_with_hooks(Solver):
+    solver = pickle.loads(pickle.dumps(Solver(hooks=[FinishCounter(), LoggingHook()])))
+    assert solver._on_finish is not None
+    assert solver(f, 1, 2).converged
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_itp.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for the ITP solver.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+import pytest
+
+from pyroots import ITP, Bisect
+from pyroots.utils import EPS
+
+
+def step(x):
+    return -1.0 if x < 1 / 3 else 1.0
+
+
+@pytest.mark.parametrize("n0", [0, 1, 5])
+def test_worst_case_bound(n0):
+    # `f` is never close to 0, so the bracket must be shrunk to the tolerance.
+    result = ITP(n0=n0, raise_on_fail=False)(step, 0, 1)
+    assert result.msg == "Bracket is smaller than tolerance."
+    n_half = math.ceil(math.log(1 / (2 * EPS), 2))
+    assert result.iterations <= n_half + n0
+    assert abs(result.x0 - 1 / 3) <= 2 * EPS
+
+
+@pytest.mark.parametrize("k1, k2", [(None, 2.0), (0.1, 1.0), (1.0, 2.5), (0.01, 1.5)])
+def test_parameters(k1, k2):
+    f = lambda x: x * math.exp(x) - 1
+    result = ITP(epsilon=1e-12, k1=k1, k2=k2)(f, -1, 4)
+    assert result.x0 == pytest.approx(0.5671432904097838)
+    # never more than `n0` iterations more than bisection.
+    assert result.func_calls <= Bisect(epsilon=1e-12)(f, -1, 4).func_calls + 1
+
+
+def test_superlinear():
+    f = lambda x: math.exp(x) - 2
+    result = ITP(epsilon=1e-14)(f, -4, 4 / 3)
+    assert result.converged
+    assert result.iterations < 15
+
+
+@pytest.mark.parametrize("kwargs", [{"k1": 0}, {"k2": 0.5}, {"k2": 2.7}, {"n0": -1}, {"n0": 1.5}])
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ArithmeticError):
+        ITP(**kwargs)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_kernels.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Tests for the solver kernels.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+import pytest
+
+from pyroots import Bisect, Ridder, Brentq, Brenth, kernels
+from pyroots.utils import NO_BRACKET, SMALL_BRACKET
+
+
+KERNELS = [(Bisect, kernels.bisect), (Ridder, kernels.ridder), (Brentq, kernels.brentq), (Brenth, kernels.brenth)]
+
+PROBLEMS = [
+    (lambda x: x ** 3 - x ** 2 - 3 * x + 2, 0.5, 1.5),
+    (lambda x: math.sin(x) - x / 2, math.pi / 2, math.pi),
+    (lambda x: x ** 3 - 2 * x - 5, 2, 3),
+    (lambda x: math.exp(x) - 2, -4, 4 / 3),
+    (lambda x: x ** 20 - 1, 0, 5),
+    (lambda x: x - 1, 1, 3),
+    (lambda x: x - 3, 1, 3),
+]
+
+
+@pytest.mark.parametrize("Solver, kernel", KERNELS)
+@pytest.mark.parametrize("epsilon", [1e-6, 1e-12])
+def test_same_steps_as_the_solvers(Solver, kernel, epsilon):
+    solver = Solver(epsilon=epsilon, raise_on_fail=False, history=False)
+    for f, xa, xb in PROBLEMS:
+        result = solver(f, xa, xb)
+        assert kernel(f, xa, xb, epsilon=epsilon) == (result.x0, result.fx0, result.iterations, result.func_calls, result.status)
+
+
+@pytest.mark.parametrize("Solver, kernel", KERNELS)
+def test_failures(Solver, kernel):
+    x0, fx0, iterations, func_calls, status = kernel(lambda x: x, 1, 2)
+    assert math.isnan(x0) and math.isnan(fx0)
+    assert (func_calls, status) == (2, NO_BRACKET)
+    assert kernel(lambda x: x, 1, 1)[-1] == SMALL_BRACKET
+    result = Solver(max_iter=3, raise_on_fail=False, history=False)(math.sin, 3, 4)
+    assert kernel(math.sin, 3, 4, max_iter=3) == (result.x0, result.fx0, result.iterations, result.func_calls, result.status)
+
+
+@pytest.mark.parametrize("Solver, kernel", KERNELS)
+def test_numba(Solver, kernel):
+    numba = pytest.importorskip("numba")
+
+    @numba.njit
+    def f(x):
+        return x ** 3 - x ** 2 - 3 * x + 2
+
+    @numba.njit
+    def solve(xa, xb):
+        return kernel(f, xa, xb)
+
+    assert solve(0.5, 1.5) == kernel(f.py_func, 0.5, 1.5)
+    assert kernels.jit(kernel)(f, 0.5, 1.5) == kernel(f.py_func, 0.5, 1.5)
+
+
+def test_jit_without_numba(monkeypatch):
+    monkeypatch.setattr(kernels, "numba", None)
+    with pytest.raises(ImportError):
+        kernels.jit(kernels.brentq)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_metrics.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Tests for the metrics registry.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import json
+import pickle
+import asyncio
+import threading
+
+import pytest
+
+from pyroots import Brentq, MetricsHook, solve_many, solve_many_threaded
+from pyroots.metrics import MetricsRegistry, REGISTRY
+
+
+cubic = lambda x: x ** 3 - x ** 2 - 3 * x + 2
+
+
+def square(x, a):
+    return x * x - a
+
+
+def test_solves_are_recorded(Solver):
+    registry = MetricsRegistry()
+    solver = Solver(hooks=[MetricsHook(registry)], raise_on_fail=False)
+    results = [solver(cubic, 0.5, 1.5), solver(cubic, 0.5, 1.5), solver(lambda x: x, 1, 2)]
+    metrics = registry.snapshot()[solver.solver_name]
+    assert metrics["solves"] == 3
+    assert metrics["conditions"]["convergence"] == 2
+    assert metrics["conditions"]["no bracket"] == 1
+    assert metrics["iterations"]["sum"] == sum(result.iterations for result in results)
+    assert metrics["func_calls"]["sum"] == sum(result.func_calls for result in results)
+    assert metrics["latency"]["count"] == 3
+
+
+def test_threads(Solver):
+    registry = MetricsRegistry()
+    solver = Solver(hooks=[MetricsHook(registry)])
+
+    def work():
+        for _ in range(200):
+            solver(cubic, 0.5, 1.5)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics = registry.snapshot()[solver.solver_name]
+    assert metrics["solves"] == metrics["iterations"]["count"] == 800
+
+
+def test_concurrent_async_solves():
+    async def f(x, delay):
+        await asyncio.sleep(delay)
+        return x * x - 2
+
+    async def main(solver):
+        # The slow solve starts first and finishes last.
+        await asyncio.gather(solver.solve_async(f, 0, 3, 0.02), solver.solve_async(f, 0, 3, 0.0))
+
+    registry = MetricsRegistry(latency_buckets=(0.05,))
+    asyncio.run(main(Brentq(hooks=[MetricsHook(registry)])))
+    assert registry.snapshot()["Brentq"]["latency"]["counts"] == [1, 1]
+
+
+def test_histogram_buckets():
+    registry = MetricsRegistry(count_buckets=(2, 5), latency_buckets=(1,))
+    for iterations in [1, 2, 3, 5, 6, 100]:
+        registry.record("S", "convergence", iterations, 2 * iterations, 0.5)
+    metrics = registry.snapshot()["S"]
+    assert metrics["iterations"]["counts"] == [2, 2, 2]
+    assert metrics["func_calls"]["counts"] == [1, 1, 4]
+    assert metrics["latency"]["counts"] == [6, 0]
+
+
+def test_prometheus():
+    registry = MetricsRegistry(count_buckets=(2, 5), latency_buckets=(1,))
+    registry.record("Brentq", "convergence", 3, 5, 0.5)
+    registry.record("Brentq", "no bracket", 0, 2, 0.25)
+    lines = registry.to_prometheus().splitlines()
+    assert "# TYPE pyroots_iterations histogram" in lines
+    assert 'pyroots_solves_total{solver="Brentq",condition="no bracket"} 1' in lines
+    assert 'pyroots_iterations_bucket{solver="Brentq",le="2"} 1' in lines
+    assert 'pyroots_iterations_bucket{solver="Brentq",le="5"} 2' in lines
+    assert 'pyroots_iterations_bucket{solver="Brentq",le="+Inf"} 2' in lines
+    assert 'pyroots_function_calls_sum{solver="Brentq"} 7' in lines
+    assert 'pyroots_solve_duration_seconds_sum{solver="Brentq"} 0.75' in lines
+    assert 'pyroots_solve_duration_seconds_count{solver="Brentq"} 2' in lines
+
+
+def test_json_and_reset():
+    registry = MetricsRegistry()
+    registry.record("Brentq", "convergence", 3, 5)
+    assert json.loads(registry.to_json())["Brentq"]["solves"] == 1
+    registry.reset()
+    assert json.loads(registry.to_json())["Brentq"]["solves"] == 0
+    registry.record("Brentq", "convergence", 3, 5)
+    assert registry.snapshot()["Brentq"]["solves"] == 1
+
+
+def test_batch_solver():
+    np = pytest.importorskip("numpy")
+    from pyroots import BatchBrentq
+
+    registry = MetricsRegistry()
+    solver = BatchBrentq(hooks=[MetricsHook(registry)])
+    result = solver(lambda x, a: x * x - a, np.zeros(3), np.full(3, 3.0), np.array([1.0, 2.0, 16.0]))
+    metrics = registry.snapshot()["BatchBrentq"]
+    assert metrics["conditions"]["convergence"] == 2
+    assert metrics["conditions"]["no bracket"] == 1
+    assert metrics["iterations"]["sum"] == result.iterations.sum()
+    assert metrics["latency"]["count"] == 1
+
+
+def test_finished_threads_are_merged():
+    registry = MetricsRegistry()
+    solver = Brentq(hooks=[MetricsHook(registry)])
+    for _ in range(5):
+        solve_many_threaded(solver, square, [(0, 10)] * 40, [(a,) for a in range(1, 41)], workers=4)
+    assert len(registry._shards) <= 4
+    metrics = registry.snapshot()["Brentq"]
+    assert metrics["solves"] == metrics["func_calls"]["count"] == 200
+
+
+def test_pickling():
+    registry = MetricsRegistry(count_buckets=(2, 5))
+    registry.record("Brentq", "convergence", 3, 5)
+    solver = Brentq(hooks=[MetricsHook(registry), MetricsHook()])
+    clone = pickle.loads(pickle.dumps(solver))
+    assert clone.hooks[0].registry.count_buckets == (2, 5)
+    assert clone.hooks[0].registry.snapshot() == {}
+    assert clone.hooks[1].registry is REGISTRY
+    clone(cubic, 0.5, 1.5)
+    assert clone.hooks[0].registry.snapshot()["Brentq"]["solves"] == 1
+
+
+def test_solve_many_workers_report_to_the_parent():
+    registry = MetricsRegistry()
+    registry.record("Brentq", "convergence", 3, 5)
+    before = REGISTRY.snapshot().get("Brentq", {}).get("solves", 0)
+    solver = Brentq(hooks=[MetricsHook(registry), MetricsHook()])
+    solve_many(solver, square, [(0, 10)] * 50, [(a,) for a in range(1, 51)], workers=2)
+    assert registry.snapshot()["Brentq"]["solves"] == 51
+    assert REGISTRY.snapshot()["Brentq"]["solves"] == before + 50
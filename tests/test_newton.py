@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_newton.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Tests for the Newton solvers.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import asyncio
+import math
+
+import pytest
+
+from pyroots import NewtonSafe, Newton, Halley, Brentq, Bisect, dmath
+
+
+def cubic(x):
+    return x ** 3 - 2 * x - 5, 3 * x ** 2 - 2
+
+
+def test_f_and_fprime():
+    solver = NewtonSafe(epsilon=1e-12)
+    result = solver(cubic, 2, 3)
+    separate = NewtonSafe(epsilon=1e-12, fprime=lambda x: cubic(x)[1])(lambda x: cubic(x)[0], 2, 3)
+    assert result.converged
+    assert result.x0 == pytest.approx(2.0945514815423265)
+    assert (separate.x0, separate.func_calls, separate.x_steps) == (result.x0, result.func_calls, result.x_steps)
+    assert result.fx_steps == [cubic(x)[0] for x in result.x_steps]
+
+
+@pytest.mark.parametrize("f, df, xa, xb", [
+    (lambda x: x ** 3 - 2 * x - 5, lambda x: 3 * x ** 2 - 2, 2, 3),
+    (lambda x: math.exp(x) - 2, math.exp, -4, 4 / 3),
+    (lambda x: x * math.exp(x) - 1, lambda x: (x + 1) * math.exp(x), -1, 4),
+    (lambda x: math.sin(x) - x / 2, lambda x: math.cos(x) - 0.5, math.pi / 2, math.pi),
+])
+def test_fewer_calls_than_brent(f, df, xa, xb):
+    result = NewtonSafe(epsilon=1e-12, fprime=df)(f, xa, xb)
+    assert result.converged
+    assert result.func_calls < Brentq(epsilon=1e-12)(f, xa, xb).func_calls
+
+
+@pytest.mark.parametrize("f, df, xa, xb", [
+    (math.atan, lambda x: 1 / (1 + x * x), -10, 30),            # Newton diverges from the bounds
+    (lambda x: x ** 3 - x - 3, lambda x: 3 * x * x - 1, -3, 3),     # f'(x) = 0 inside the bracket
+    (lambda x: x ** 20 - 1, lambda x: 20 * x ** 19, 0, 5),
+])
+def test_steps_stay_in_the_bracket(f, df, xa, xb):
+    result = NewtonSafe(epsilon=1e-12, fprime=df)(f, xa, xb)
+    assert result.converged
+    assert all(xa <= x <= xb for x in result.x_steps)
+    assert result.func_calls <= Bisect(epsilon=1e-12)(f, xa, xb).func_calls
+
+
+def test_bracket_of_consecutive_floats():
+    # f never gets close to 0, so the bracket is shrunk until it can't be shrunk any more.
+    step = lambda x: (-1.0 if x < 1 / 3 else 1.0, 0.0)
+    result = NewtonSafe(raise_on_fail=False)(step, 0, 1)
+    assert result.msg == NewtonSafe.messages["small bracket"]
+    assert result.x0 == pytest.approx(1 / 3)
+
+
+def test_known_bounds_and_guess():
+    solver = NewtonSafe(epsilon=1e-12)
+    result = solver.solve(cubic, 2, 3, fa=-1, fb=16)
+    assert result.converged
+    assert result.x_steps[0] == 2.5          # the derivatives on the bounds are unknown
+    result = solver.solve_from_guess(cubic, 10)
+    assert result.x0 == pytest.approx(2.0945514815423265)
+
+
+def test_solve_async():
+    async def f(x, a):
+        await asyncio.sleep(0)
+        return x ** 2 - a, 2 * x
+
+    result = asyncio.run(NewtonSafe(epsilon=1e-12).solve_async(f, 0, 3, 2))
+    assert result.x0 == NewtonSafe(epsilon=1e-12)(lambda x, a: (x ** 2 - a, 2 * x), 0, 3, 2).x0
+
+
+def test_invalid_fprime():
+    with pytest.raises(ValueError):
+        NewtonSafe(fprime=1.0)
+
+
+SMOOTH = [
+    (lambda x: x ** 3 - 2 * x - 5, 2, 3),
+    (lambda x: dmath.exp(x) - 2, -4, 4 / 3),
+    (lambda x: x * dmath.exp(x) - 1, -1, 4),
+    (lambda x: dmath.sin(x) - x / 2, math.pi / 2, math.pi),
+    (lambda x: 1 / x - dmath.sin(x) + 1, -1.3, -0.5),
+]
+
+
+@pytest.mark.parametrize("Solver", [Newton, Halley])
+@pytest.mark.parametrize("f, xa, xb", SMOOTH)
+def test_automatic_derivatives(Solver, f, xa, xb):
+    result = Solver(epsilon=1e-12)(f, xa, xb)
+    assert result.converged
+    assert result.fx_steps == [f(x) for x in result.x_steps]
+    assert result.func_calls < Brentq(epsilon=1e-12)(f, xa, xb).func_calls
+
+
+def test_newton_matches_newton_safe():
+    f = lambda x: x * dmath.exp(x) - 1
+    df = lambda x: (x + 1) * math.exp(x)
+    result = Newton(epsilon=1e-12)(f, -1, 4)
+    assert result.x_steps == pytest.approx(NewtonSafe(epsilon=1e-12, fprime=df)(f, -1, 4).x_steps)
+
+
+def test_halley_needs_fewer_calls():
+    f = lambda x: (x - 1) ** 3
+    assert Halley(epsilon=1e-12)(f, -2, 1.5).func_calls < Newton(epsilon=1e-12)(f, -2, 1.5).func_calls
+
+
+@pytest.mark.parametrize("Solver", [Newton, Halley])
+def test_automatic_derivatives_fall_back_to_bisection(Solver):
+    # f'(x) = 0 at x = 0 and Newton's method diverges from the bounds of the bracket.
+    f = lambda x: dmath.atan(x ** 3)
+    result = Solver(epsilon=1e-12)(f, -10, 30)
+    assert result.converged
+    assert all(-10 <= x <= 30 for x in result.x_steps)
+
+
+@pytest.mark.parametrize("Solver", [Newton, Halley])
+def test_automatic_derivatives_of_a_constant(Solver):
+    # `f` returns a float instead of a dual number on the upper part of the bracket.
+    f = lambda x: x - 0.25 if x < 0.5 else 1.0
+    result = Solver(epsilon=1e-12)(f, 0, 1)
+    assert result.x0 == 0.25
+
+
+@pytest.mark.parametrize("Solver", [Newton, Halley])
+def test_derivative_solvers_are_not_newton_safe(Solver):
+    solver = Solver(epsilon=1e-12, max_iter=50)
+    assert not isinstance(solver, NewtonSafe)
+    assert solver.fprime is None
+    assert solver.max_iter == 50
+    assert solver.solver_name == Solver.__name__
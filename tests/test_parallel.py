@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_parallel.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for solving problems in a pool of processes.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import pickle
+import logging
+
+import pytest
+
+from pyroots import solve_many, solve_many_threaded, Hook, LoggingHook
+from pyroots.parallel import _chunks
+from pyroots.utils import ConvergenceError, nearly_equal
+
+
+class IterationCounter(Hook):
+    def __init__(self):
+        self.events = []
+
+    def on_iteration(self, solver, i, fcalls, xa, xb, fa, fb):
+        self.events.append(i)
+
+
+def f(x, a, b=0.0):
+    return x ** 2 - a + b
+
+
+def test_solver_pickling(Solver):
+    solver = Solver(epsilon=1e-8, max_iter=100, debug_precision=4)
+    state = pickle.dumps(solver)
+    assert b"Logger" not in state
+    clone = pickle.loads(state)
+    assert clone.logger is solver.logger
+    assert clone.log_msg == solver.log_msg
+    assert clone(f, 0, 3, 2).x0 == solver(f, 0, 3, 2).x0
+
+
+def test_chunks_cover_all_the_problems():
+    chunks = list(_chunks(1000, 4, 3))
+    assert chunks[0] == (0, 125)
+    assert chunks[-1][1] == 1000
+    assert all(stop - start >= 3 for start, stop in chunks[:-1])
+    assert all(previous[1] == current[0] for previous, current in zip(chunks, chunks[1:]))
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_solve_many(Solver, workers):
+    a_values = [1.0 + i for i in range(200)]
+    solver = Solver(epsilon=1e-10)
+    brackets = [(0, 20)] * len(a_values)
+    results = solve_many(solver, f, brackets, [(a,) for a in a_values], kwargs={"b": 0.0}, workers=workers)
+    assert len(results) == len(a_values)
+    for a, result in zip(a_values, results):
+        assert result.converged
+        assert nearly_equal(result.x0, a ** 0.5, 1e-8)
+
+
+@pytest.mark.parametrize("solve", [solve_many, solve_many_threaded])
+def test_solve_many_known_bound_values(Solver, solve):
+    brackets = [(0, 20, f(0, a), f(20, a)) for a in (2.0, 3.0)] + [(0, 20)]
+    results = solve(Solver(), f, brackets, [(2.0,), (3.0,), (5.0,)], workers=2)
+    assert [result.func_calls for result in results[:2]] == [r.func_calls - 2 for r in solve(Solver(), f, [(0, 20)] * 2, [(2.0,), (3.0,)], workers=2)]
+    assert nearly_equal(results[2].x0, 5.0 ** 0.5, 1e-6)
+
+
+def test_solve_many_raises_on_fail(Solver):
+    brackets = [(0, 3), (5, 6)]
+    with pytest.raises(ConvergenceError):
+        solve_many(Solver(), f, brackets, [(2,), (2,)], workers=2)
+    results = solve_many(Solver(raise_on_fail=False), f, brackets, [(2,), (2,)], workers=2)
+    assert [result.converged for result in results] == [True, False]
+
+
+def test_solve_many_checks_the_arguments(Solver):
+    with pytest.raises(ValueError):
+        solve_many(Solver(), f, [(0, 3), (0, 3)], [(2,)])
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_solve_many_threaded(Solver, workers, caplog):
+    a_values = [1.0 + i for i in range(200)]
+    iterations = IterationCounter()
+    solver = Solver(epsilon=1e-10, hooks=[LoggingHook(), iterations])
+    with caplog.at_level(logging.DEBUG, logger="pyroots"):
+        results = solve_many_threaded(solver, f, [(0, 20)] * 200, [(a,) for a in a_values], workers=workers)
+    # `LoggingHook` logs the results but not the iterations; the other hooks see them all.
+    assert [record for record in caplog.records if record.levelno == logging.INFO]
+    assert not [record for record in caplog.records if record.levelno == logging.DEBUG]
+    threaded = len(iterations.events)
+    del iterations.events[:]
+    for a, result in zip(a_values, results):
+        assert result.converged
+        assert nearly_equal(result.x0, a ** 0.5, 1e-8)
+        assert result.x_steps == solver(f, 0, 20, a).x_steps
+    assert threaded == len(iterations.events) > 0
+
+
+def test_solve_many_threaded_raises_on_fail(Solver):
+    with pytest.raises(ConvergenceError):
+        solve_many_threaded(Solver(), f, [(0, 3), (5, 6)], [(2,), (2,)], workers=2)
+
+
+def test_workers_unpickle_the_payload_once(monkeypatch):
+    from pyroots import Brentq, parallel
+
+    payload = pickle.dumps((Brentq(), f))
+    loads, original_loads = [], pickle.loads
+    monkeypatch.setattr(parallel, "_worker_payload", None)
+    monkeypatch.setattr(pickle, "loads", lambda data: loads.append(data) or original_loads(data))
+    for start in (0, 1):
+        offset, results, _ = parallel._solve_chunk(start, [(0, 3, None, None)], [(2.0,)], {}, payload=payload)
+        assert offset == start
+        assert nearly_equal(results[0].x0, 2.0 ** 0.5, 1e-6)
+    assert len(loads) == 1
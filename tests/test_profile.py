@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_profile.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Tests for the profiling of the solves.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import asyncio
+import time
+
+import pytest
+
+from pyroots import NewtonSafe
+from pyroots.profile import Profile
+
+
+def slow(x):
+    time.sleep(1e-3)
+    return x ** 3 - x ** 2 - 3 * x + 2
+
+
+@pytest.mark.parametrize("history", [True, False])
+def test_profile(Solver, history):
+    result = Solver(profile=1, history=history)(slow, 0.5, 1.5)
+    profile = result.profile
+    assert isinstance(profile, Profile)
+    assert profile.calls == result.func_calls
+    assert profile.iterations == result.iterations
+    assert profile.f_time >= 1e-3 * profile.calls
+    assert 0 < profile.solver_time < profile.f_time
+    assert profile.total_time == pytest.approx(profile.f_time + profile.solver_time)
+    assert profile.time_per_iteration == pytest.approx(profile.total_time / result.iterations)
+
+
+def test_no_profile(Solver):
+    assert Solver()(slow, 0.5, 1.5).profile is None
+    assert Solver(history=False)(slow, 0.5, 1.5).profile is None
+
+
+def test_sampling(Solver, monkeypatch):
+    values = iter([0.05, 0.5, 0.15, 0.09])
+    monkeypatch.setattr("pyroots.base.random", lambda: next(values))
+    solver = Solver(profile=0.1)
+    profiled = [solver(lambda x: x - 1, 0, 3).profile is not None for _ in range(4)]
+    assert profiled == [True, False, False, True]
+
+
+def test_failed_solve():
+    solver = NewtonSafe(profile=1, raise_on_fail=False)
+    result = solver(lambda x: (x * x + 1, 2 * x), 0, 3)
+    assert result.converged is False
+    assert result.profile.calls == 2
+    assert result.profile.time_per_iteration is None
+
+
+@pytest.mark.parametrize("profile", [-0.1, 1.5])
+def test_invalid_profile(Solver, profile):
+    with pytest.raises(ArithmeticError):
+        Solver(profile=profile)
+
+
+def test_fprime_time():
+    # The time spent in `fprime` is time spent in `f`, not in the solver.
+    def fprime(x):
+        time.sleep(2e-3)
+        return 3 * x ** 2 - 2 * x - 3
+
+    result = NewtonSafe(profile=1, fprime=fprime)(lambda x: x ** 3 - x ** 2 - 3 * x + 2, 0.5, 1.5)
+    profile = result.profile
+    assert profile.f_time >= 2e-3 * profile.calls
+    assert profile.solver_time < 1e-3 * profile.calls
+
+
+def test_fprime_time_async():
+    async def f(x):
+        return x ** 3 - x ** 2 - 3 * x + 2
+
+    async def fprime(x):
+        await asyncio.sleep(2e-3)
+        return 3 * x ** 2 - 2 * x - 3
+
+    result = asyncio.run(NewtonSafe(profile=1, fprime=fprime).solve_async(f, 0.5, 1.5))
+    profile = result.profile
+    assert profile.f_time >= 2e-3 * profile.calls
+    assert profile.solver_time < 1e-3 * profile.calls
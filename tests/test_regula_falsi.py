@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_regula_falsi.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Tests for the RegulaFalsi solver.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+import pytest
+
+from pyroots import RegulaFalsi, Ridder, Bisect
+
+
+METHODS = sorted(RegulaFalsi.methods)
+
+SMOOTH = [
+    (lambda x: math.sin(x) - x / 2, math.pi / 2, math.pi),
+    (lambda x: x ** 3 - 2 * x - 5, 2, 3),
+    (lambda x: math.exp(x) - 2, -4, 4 / 3),
+    (lambda x: 1 / x - math.sin(x) + 1, -1.3, -0.5),
+]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_fewer_calls_than_ridder(method):
+    calls = ridder_calls = 0
+    for f, xa, xb in SMOOTH:
+        result = RegulaFalsi(epsilon=1e-12, method=method)(f, xa, xb)
+        assert result.converged
+        calls += result.func_calls
+        ridder_calls += Ridder(epsilon=1e-12)(f, xa, xb).func_calls
+    assert calls < ridder_calls
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_flat_function(method):
+    # Unmodified regula falsi needs hundreds of iterations for this one.
+    f = lambda x: x ** 20 - 1
+    result = RegulaFalsi(epsilon=1e-12, method=method)(f, 0, 5)
+    assert result.x0 == pytest.approx(1)
+    assert result.func_calls < Bisect(epsilon=1e-12)(f, 0, 5).func_calls
+
+
+def test_methods_differ():
+    f = lambda x: x * math.exp(x) - 1
+    points = set()
+    for method in METHODS:
+        result = RegulaFalsi(epsilon=1e-12, method=method)(f, -1, 4)
+        assert result.x0 == pytest.approx(0.5671432904097838)
+        points.add(tuple(result.x_steps))
+    assert len(points) == len(METHODS)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        RegulaFalsi(method="secant")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_scan.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for finding all the roots of a function in an interval.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+import pytest
+
+from pyroots import find_all_roots, Brentq, Ridder
+from pyroots.utils import ConvergenceError
+
+
+def test_find_all_roots(Solver):
+    results = find_all_roots(math.sin, 0.5, 20, solver=Solver(epsilon=1e-10))
+    assert [round(result.x0, 6) for result in results] == [round(k * math.pi, 6) for k in range(1, 7)]
+    assert all(result.converged for result in results)
+
+
+def test_bounds_are_not_evaluated_again():
+    xs = []
+
+    def f(x):
+        xs.append(x)
+        return math.cos(x)
+
+    results = find_all_roots(f, 0, 10, samples=20)
+    assert len(results) == 3
+    for result in results:
+        assert result.func_calls == len(result.x_steps)
+        assert result.x_steps[0] not in xs[:21]
+
+
+def test_roots_on_the_samples():
+    results = find_all_roots(lambda x: x * (x - 1) * (x - 2), 0, 2, samples=4)
+    assert [result.x0 for result in results] == [0, 1, 2]
+    assert [result.func_calls for result in results] == [0, 0, 0]
+
+
+@pytest.mark.parametrize("other", [0.3005, 0.2995])
+def test_root_next_to_a_root_on_a_sample(other):
+    f = lambda x: (x - 0.3) * (x - other)
+    results = find_all_roots(f, 0, 1, samples=10, solver=Brentq(epsilon=1e-12))
+    assert [round(result.x0, 8) for result in results] == sorted([0.3, other])
+
+
+def test_no_roots():
+    assert find_all_roots(lambda x: x ** 2 + 1, -5, 5) == []
+
+
+def test_refinement_finds_close_roots():
+    f = lambda x: (x - 3.013) ** 2 - 1e-4
+    results = find_all_roots(f, 0, 10, samples=10, solver=Ridder(epsilon=1e-10))
+    assert [round(result.x0, 8) for result in results] == [3.003, 3.023]
+    assert find_all_roots(f, 0, 10, samples=10, refine=0) == []
+
+
+def test_refinement_finds_double_roots():
+    results = find_all_roots(lambda x: (x - 3.05) ** 2, 0, 10, samples=10)
+    assert len(results) == 1
+    assert results[0].x0 == pytest.approx(3.05, abs=1e-3)
+
+
+def test_args():
+    results = find_all_roots(lambda x, a, b=0: math.sin(a * x) + b, 0.5, 4, args=(2,), kwargs={"b": 0})
+    assert [round(result.x0, 6) for result in results] == [round(k * math.pi / 2, 6) for k in range(1, 3)]
+
+
+def test_vectorized():
+    np = pytest.importorskip("numpy")
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return np.cos(x)
+
+    results = find_all_roots(f, 0, 30, vectorized=True)
+    assert len(results) == 10
+    assert isinstance(calls[0], np.ndarray)
+    assert len(calls) == 1 + sum(result.func_calls for result in results)
+
+
+@pytest.mark.parametrize("threaded", [True, False])
+def test_parallel(threaded):
+    results = find_all_roots(math.sin, 0.5, 20, workers=2, threaded=threaded)
+    assert [round(result.x0, 6) for result in results] == [round(k * math.pi, 6) for k in range(1, 7)]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        find_all_roots(math.sin, 1, 0)
+    with pytest.raises(ValueError):
+        find_all_roots(math.sin, 0, 1, samples=0)
+
+
+def test_raise_on_fail():
+    with pytest.raises(ConvergenceError):
+        find_all_roots(math.sin, 0.5, 20, solver=Ridder(max_iter=1))
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_secant.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+"""
+Tests for the Secant solver.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+import pytest
+
+from pyroots import Secant, Brentq
+
+
+METHODS = list(Secant.methods)
+
+# (function, guess, bracket)
+WARM = [
+    (lambda x: x ** 3 - 2 * x - 5, 2.1, (2, 3)),
+    (lambda x: math.exp(x) - 2, 0.7, (-4, 4 / 3)),
+    (lambda x: x * math.exp(x) - 1, 0.6, (-1, 4)),
+    (lambda x: math.sin(x) - x / 2, 1.9, (math.pi / 2, math.pi)),
+]
+
+
+def test_warm_start():
+    calls = bracketed_calls = 0
+    for f, guess, (xa, xb) in WARM:
+        result = Secant(epsilon=1e-12).solve_from_guess(f, guess)
+        expected = Brentq(epsilon=1e-12)(f, xa, xb)
+        assert result.converged
+        assert result.x0 == pytest.approx(expected.x0)
+        calls += result.func_calls
+        bracketed_calls += expected.func_calls
+    assert calls < 0.75 * bracketed_calls
+
+
+@pytest.mark.parametrize("f, guess", [
+    (lambda x: math.exp(x) - 10, 1.0),
+    (lambda x: x ** 3 - 2 * x - 5, 1.0),
+    (lambda x: x ** 2 - 612, 10),
+])
+def test_far_guess(f, guess):
+    # The guess is many default steps away from the root; the first secant step is long.
+    result = Secant().solve_from_guess(f, guess)
+    assert result.converged
+    assert result.func_calls <= Brentq().solve_from_guess(f, guess).func_calls
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("f, guess, root", [
+    (math.atan, 5, 0),                                  # the secant overshoots
+    (lambda x: math.exp(-x) - 0.5, 10, math.log(2)),    # the secant would overflow `f`
+    (lambda x: x ** 20 - 1, 1.1, 1),                    # Steffensen stalls
+    (lambda x: x ** 2 - 2, 10, math.sqrt(2)),
+])
+def test_fallback(method, f, guess, root):
+    result = Secant(epsilon=1e-12, method=method).solve_from_guess(f, guess)
+    assert result.converged
+    assert result.x0 == pytest.approx(root, abs=1e-12)
+    assert result.func_calls == len(result.x_steps)
+    assert result.fx_steps == [f(x) for x in result.x_steps]
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("max_iter", [0, 1, 2, 3, 5, 8])
+def test_fallback_iterations(method, max_iter):
+    # Brent's method only gets the iterations that the secant phase left.
+    for f, guess in [(math.atan, 5), (lambda x: x ** 20 - 1, 1.1), (lambda x: math.exp(-x) - 0.5, 10)]:
+        result = Secant(epsilon=1e-12, max_iter=max_iter, method=method, raise_on_fail=False).solve_from_guess(f, guess)
+        assert result.iterations <= max_iter
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_domain(method):
+    result = Secant(method=method).solve_from_guess(lambda x: math.sqrt(x) - 3, 1, lower=0)
+    assert result.x0 == pytest.approx(9)
+    assert min(result.x_steps) >= 0
+
+
+def test_two_starting_points():
+    f = lambda x: x ** 3 - 2 * x - 5
+    result = Secant(epsilon=1e-12)(f, 5, 6)
+    assert result.x0 == pytest.approx(2.0945514815423265)
+    assert result.x_steps[:2] == [5, 6]
+
+
+def test_no_root():
+    result = Secant(raise_on_fail=False).solve_from_guess(lambda x: x ** 2 + 1, 3)
+    assert result.converged is False
+    assert result.msg == Secant.messages["no bracket"]
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        Secant(method="newton")
+
+
+def test_secant_is_not_a_brentq():
+    assert not isinstance(Secant(), Brentq)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_sweep.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for warm-started parameter sweeps and for solving with known bound values.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+from math import sin
+
+import pytest
+
+from pyroots.utils import ConvergenceError, nearly_equal
+
+
+def test_solve_with_known_bound_values(Solver):
+    calls = []
+
+    def f(x, a):
+        calls.append(x)
+        return x ** 2 - a
+
+    solver = Solver(epsilon=1e-8)
+    result = solver.solve(f, 0.0, 3.0, fa=-2.0, fb=7.0, args=(2.0,))
+    assert result.converged
+    assert nearly_equal(result.x0, 2 ** 0.5, 1e-8)
+    assert 0.0 not in calls and 3.0 not in calls
+    assert result.func_calls == len(calls)
+
+
+def test_solve_with_positional_and_keyword_args(Solver):
+    f = lambda x, a, b=0: x ** 2 - a + b
+    result = Solver(epsilon=1e-8).solve(f, 0, 3, args=(3,), kwargs={"b": 1})
+    assert nearly_equal(result.x0, 2 ** 0.5, 1e-8)
+
+
+def test_sweep(Solver):
+    f = lambda x, p, c: x ** 3 + x - p * c
+    ps = [1 + 0.05 * i for i in range(100)]
+    solver = Solver(epsilon=1e-10)
+    results = solver.sweep(f, ps, -5, 5, args=(1.0,))
+    assert len(results) == len(ps)
+    for p, result in zip(ps, results):
+        assert result.converged
+        assert nearly_equal(f(result.x0, p, 1.0), 0, 1e-10)
+        assert result.func_calls == len(result.x_steps) == len(result.fx_steps)
+    cold = sum(solver(f, -5, 5, p, 1.0).func_calls for p in ps)
+    assert sum(result.func_calls for result in results) < cold
+
+
+def test_sweep_recovers_from_a_bad_prediction(Solver):
+    # the root jumps from one side of the interval to the other one.
+    f = lambda x, p: x - p
+    ps = [-4, -3.9, -3.8, 4.5, 4.4]
+    results = Solver(epsilon=1e-10).sweep(f, ps, -5, 5)
+    for p, result in zip(ps, results):
+        assert result.converged
+        assert nearly_equal(result.x0, p, 1e-10)
+
+
+def test_sweep_raises_on_fail(Solver):
+    f = lambda x, p: sin(x) + p
+    with pytest.raises(ConvergenceError):
+        Solver().sweep(f, [0.5, 3.0], -1, 1)
+    results = Solver(raise_on_fail=False).sweep(f, [0.5, 3.0, 0.4], -1, 1)
+    assert [result.converged for result in results] == [True, False, True]
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_toms748.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for the TOMS 748 solver.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import math
+
+import pytest
+
+from pyroots import Toms748
+from pyroots.utils import EPS
+
+
+problems = [
+    (lambda x: math.sin(x) - x / 2, math.pi / 2, math.pi, 1.895494267033981),
+    (lambda x: x ** 3 - 2 * x - 5, 2, 3, 2.0945514815423265),
+    (lambda x: math.exp(x) - 2, -4, 4 / 3, math.log(2)),
+    (lambda x: x * math.exp(x) - 1, -1, 4, 0.5671432904097838),
+    (lambda x: x ** 20 - 1, 0, 5, 1.0),
+    (lambda x: math.exp(-x * x) * (x - 0.3) - 1e-4, -1, 2, 0.30010941),
+]
+
+
+@pytest.mark.parametrize("k", [1, 2, 3])
+@pytest.mark.parametrize("f, xa, xb, root", problems)
+def test_problems(f, xa, xb, root, k):
+    xs = []
+
+    def g(x):
+        xs.append(x)
+        return f(x)
+
+    result = Toms748(epsilon=1e-12, k=k)(g, xa, xb)
+    assert result.converged
+    assert result.x0 == pytest.approx(root, abs=1e-7)
+    # no point is evaluated twice.
+    assert len(xs) == len(set(xs)) == result.func_calls
+    assert all(min(xa, xb) <= x <= max(xa, xb) for x in xs)
+
+
+def test_consecutive_floats():
+    # The bracket shrinks to consecutive floats before |f| gets smaller than epsilon.
+    result = Toms748(epsilon=EPS, raise_on_fail=False)(lambda x: x ** 3 - 2 * x - 5, 2, 3)
+    assert not result.converged
+    assert result.msg == "Bracket is smaller than tolerance."
+    assert result.x0 == pytest.approx(2.0945514815423265)
+
+
+def test_func_calls():
+    f = lambda x: math.exp(-x * x) * (x - 0.3) - 1e-4
+    assert Toms748(epsilon=1e-12)(f, -1, 2).func_calls < 15
+
+
+def test_without_iterations():
+    result = Toms748(max_iter=0, raise_on_fail=False)(lambda x: x ** 3 - x - 2, 1, 2)
+    assert result.msg == Toms748.messages["iterations"]
+    assert result.iterations == 0
+    assert result.func_calls == 2
+    assert result.x_steps == [1, 2]
+
+
+def test_invalid_k():
+    with pytest.raises(ArithmeticError):
+        Toms748(k=0)
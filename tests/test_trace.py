@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# file tests/test_trace.py
+#
+#############################################################################
+# Copyright (c) 2014 by Panagiotis Mavrogiorgos
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#############################################################################
+#
+# @license: http://opensource.org/licenses/BSD-3-Clause
+# @authors: see AUTHORS.txt
+
+"""
+Tests for the recorders of the steps.
+"""
+
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+import pickle
+from functools import partial
+
+import pytest
+
+from pyroots import solve_many
+from pyroots.trace import ArrayTrace, FileTrace
+
+
+f = lambda x: x ** 3 - x ** 2 - 3 * x + 2
+
+
+def square(x, a):
+    return x * x - a
+
+
+def test_array_trace(Solver):
+    expected = Solver(epsilon=1e-12)(f, 1, 2.5)
+    result = Solver(epsilon=1e-12, history=ArrayTrace)(f, 1, 2.5)
+    assert list(result.x_steps) == expected.x_steps
+    assert list(result.fx_steps) == expected.fx_steps
+    assert result.func_calls == expected.func_calls
+
+
+def test_ring_buffer_trace(Solver):
+    expected = Solver(epsilon=1e-12)(f, 1, 2.5)
+    result = Solver(epsilon=1e-12, history=partial(ArrayTrace, maxlen=3))(f, 1, 2.5)
+    assert list(result.x_steps) == expected.x_steps[-3:]
+    assert list(result.fx_steps) == expected.fx_steps[-3:]
+    assert result.func_calls == expected.func_calls
+
+
+def test_ring_buffer_ordering():
+    trace = ArrayTrace(maxlen=4)
+    for i in range(2):
+        trace.append(i, -i)
+    assert list(trace.x_steps) == [0, 1]
+    for i in range(2, 7):
+        trace.append(i, -i)
+    assert list(trace.x_steps) == [3, 4, 5, 6]
+    assert list(trace.fx_steps) == [-3, -4, -5, -6]
+    assert trace.count == 7
+    with pytest.raises(ValueError):
+        ArrayTrace(maxlen=0)
+
+
+def test_file_trace(Solver, tmp_path):
+    path = str(tmp_path / "steps.bin")
+    expected = Solver(epsilon=1e-12)(f, 1, 2.5)
+    with FileTrace(path, buffer_size=2) as trace:
+        solver = Solver(epsilon=1e-12, history=trace)
+        first = solver(f, 1, 2.5)
+        solver(f, 1, 2.5)
+    assert first.x_steps == ()
+    assert first.func_calls == expected.func_calls
+    records = FileTrace.read(path)
+    assert len(records) == 2 * expected.func_calls
+    for solve_id in (0, 1):
+        steps = [(x, fx) for i, x, fx in records if i == solve_id]
+        assert steps == list(zip(expected.x_steps, expected.fx_steps))
+
+
+def test_file_trace_when_f_raises(Solver, tmp_path):
+    path = str(tmp_path / "steps.bin")
+    calls = []
+
+    def failing(x):
+        calls.append(x)
+        if len(calls) == 4:
+            raise RuntimeError("boom")
+        return f(x)
+
+    with FileTrace(path) as trace:
+        with pytest.raises(RuntimeError):
+            Solver(epsilon=1e-12, history=trace)(failing, 1, 2.5)
+    assert [x for _, x, _ in FileTrace.read(path)] == calls[:3]
+
+
+def test_file_trace_pickling(Solver, tmp_path):
+    path = str(tmp_path / "steps.bin")
+    brackets, args_list = [(0, 10)] * 20, [(a,) for a in range(1, 21)]
+    expected = solve_many(Solver(), square, brackets, args_list, workers=1)
+    with FileTrace(path) as trace:
+        solver = pickle.loads(pickle.dumps(Solver(history=trace)))
+        solver(square, 0, 10, 2)
+        solve_many(solver, square, brackets, args_list, workers=2)
+    records = FileTrace.read(path)
+    assert len(records) == expected[1].func_calls + sum(result.func_calls for result in expected)
+    assert len(set(i for i, _, _ in records)) == 21
+
+
+def test_trace_in_sweep(Solver):
+    g = lambda x, p: x ** 3 + x - p
+    ps = [1 + 0.05 * i for i in range(10)]
+    expected = Solver(epsilon=1e-10).sweep(g, ps, -5, 5)
+    results = Solver(epsilon=1e-10, history=ArrayTrace).sweep(g, ps, -5, 5)
+    for result, full in zip(results, expected):
+        assert list(result.x_steps) == full.x_steps
+        assert result.func_calls == full.func_calls